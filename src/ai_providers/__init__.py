@@ -1,6 +1,6 @@
 """
 Multi AI Provider Support
-Gemini, OpenAI, Anthropic Claude, xAI Grok
+Gemini, OpenAI, Anthropic Claude, xAI Grok, OpenAI-compatible endpoints
 """
 
 from .base import AIProvider
@@ -8,6 +8,7 @@ from .gemini import GeminiProvider
 from .openai import OpenAIProvider
 from .anthropic import AnthropicProvider
 from .grok import GrokProvider
+from .openai_compatible import OpenAICompatibleProvider
 
 __all__ = [
     'AIProvider',
@@ -15,4 +16,5 @@ __all__ = [
     'OpenAIProvider',
     'AnthropicProvider',
     'GrokProvider',
+    'OpenAICompatibleProvider',
 ]
@@ -5,7 +5,7 @@ Vision API for slide analysis and speaker notes generation
 
 import base64
 import io
-from typing import Optional
+from typing import Optional, Iterator, List, Dict, Any
 from PIL import Image
 
 try:
@@ -25,13 +25,26 @@ class AnthropicProvider(AIProvider):
         "claude-haiku-4-5",    # Claude Haiku 4.5 (빠른 응답)
     ]
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-5"):
+    # 복잡도 라우팅 기본값 (단순 슬라이드 / 복잡한 슬라이드)
+    FAST_MODEL = "claude-haiku-4-5"
+    STRONG_MODEL = "claude-sonnet-4-5"
+    DEFAULT_MODEL = "claude-sonnet-4-5"
+
+    # --plan 비용 추정용 가격 (USD / 100만 토큰: 입력, 출력)
+    PRICES = {
+        "claude-sonnet-4-5": (3.0, 15.0),
+        "claude-opus-4-5": (5.0, 25.0),
+        "claude-haiku-4-5": (1.0, 5.0),
+    }
+
+    def __init__(self, api_key: str, model: str = DEFAULT_MODEL, timeout: Optional[float] = None):
         """
         Initialize Anthropic provider.
 
         Args:
             api_key: Anthropic API key
             model: Claude model to use (default: claude-sonnet-4-5)
+            timeout: Per-request timeout in seconds
         """
         if anthropic is None:
             raise ImportError(
@@ -39,8 +52,8 @@ class AnthropicProvider(AIProvider):
                 "Install with: pip install anthropic"
             )
 
-        super().__init__(api_key, model)
-        self.client = anthropic.Anthropic(api_key=api_key)
+        super().__init__(api_key, model, timeout)
+        self.client = anthropic.Anthropic(api_key=api_key, timeout=timeout)
 
     def _image_to_base64(self, image: Image.Image) -> str:
         """Convert PIL Image to base64 string."""
@@ -48,10 +61,43 @@ class AnthropicProvider(AIProvider):
         image.save(buffer, format='PNG')
         return base64.b64encode(buffer.getvalue()).decode('utf-8')
 
+    def _slide_messages(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Build the messages for a slide request (image + prompt)."""
+        prompt = self._get_prompt(context, slide_text, previous_notes)
+        image_b64 = self._image_to_base64(image)
+
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": "image/png",
+                            "data": image_b64
+                        }
+                    },
+                    {
+                        "type": "text",
+                        "text": prompt
+                    }
+                ]
+            }
+        ]
+
     def analyze_slide(
         self,
         image: Image.Image,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
     ) -> str:
         """
         Analyze slide image using Claude Vision.
@@ -59,39 +105,89 @@ class AnthropicProvider(AIProvider):
         Args:
             image: PIL Image of the slide
             context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
 
         Returns:
             Generated speaker notes
         """
-        prompt = self._get_prompt(context)
-        image_b64 = self._image_to_base64(image)
+        message = self.client.messages.create(
+            model=self.model,
+            max_tokens=2000,
+            messages=self._slide_messages(image, context, slide_text, previous_notes)
+        )
+
+        self._set_usage(message.usage.input_tokens, message.usage.output_tokens)
+        return message.content[0].text
+
+    def analyze_slide_stream(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream speaker notes from Claude Vision chunk by chunk.
 
+        Args:
+            image: PIL Image of the slide
+            context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
+
+        Yields:
+            Chunks of the generated speaker notes
+        """
+        return self._stream_messages(self._slide_messages(image, context, slide_text, previous_notes))
+
+    def generate_text(self, prompt: str) -> str:
+        """
+        Run a text-only Claude completion.
+
+        Args:
+            prompt: Complete prompt string
+
+        Returns:
+            Generated text
+        """
         message = self.client.messages.create(
             model=self.model,
             max_tokens=2000,
             messages=[
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/png",
-                                "data": image_b64
-                            }
-                        },
-                        {
-                            "type": "text",
-                            "text": prompt
-                        }
-                    ]
+                    "content": prompt
                 }
             ]
         )
 
+        self._set_usage(message.usage.input_tokens, message.usage.output_tokens)
         return message.content[0].text
 
+    def generate_text_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a text-only Claude completion chunk by chunk.
+
+        Args:
+            prompt: Complete prompt string
+
+        Yields:
+            Chunks of the generated text
+        """
+        return self._stream_messages([{"role": "user", "content": prompt}])
+
+    def _stream_messages(self, messages: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield text deltas of a streamed message (closing stops the request)."""
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=2000,
+            messages=messages
+        ) as stream:
+            yield from stream.text_stream
+            usage = stream.get_final_message().usage
+            self._set_usage(usage.input_tokens, usage.output_tokens)
+
     def get_available_models(self) -> list[str]:
         """Get available Claude models."""
         return self.MODELS
@@ -3,30 +3,139 @@ AI Provider Base Class
 Abstract interface for multi-provider AI Vision support
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+import math
+from typing import Optional, Iterator, Dict, Tuple
 from PIL import Image
 
 
 class AIProvider(ABC):
     """Abstract base class for AI providers with Vision capabilities."""
 
-    def __init__(self, api_key: str, model: str):
+    # Shared instructions for every speaker notes prompt
+    NOTES_GUIDE = """발표자 노트에 포함할 내용:
+1. **핵심 메시지**: 이 슬라이드에서 전달해야 할 가장 중요한 포인트
+2. **상세 설명**: 슬라이드에 표시된 내용의 부연 설명
+3. **전환 멘트**: 다음 슬라이드로 넘어가기 위한 자연스러운 연결 문구
+4. **예상 질문**: 청중이 할 수 있는 질문과 답변 가이드
+5. **발표 팁**: 강조할 부분, 속도 조절 등
+
+형식:
+- 한국어로 작성
+- 2-3분 분량의 발표 스크립트
+- 읽기 쉽게 bullet point 활용"""
+
+    # Default models for complexity routing (simple / complex slides)
+    FAST_MODEL: Optional[str] = None
+    STRONG_MODEL: Optional[str] = None
+
+    # Model used when none is given (used by the planner without creating a client)
+    DEFAULT_MODEL: Optional[str] = None
+
+    # False for endpoints that accept unauthenticated requests (e.g. local servers)
+    API_KEY_REQUIRED = True
+
+    # Error message fragments meaning the key has no quota or credit left
+    QUOTA_ERROR_MARKERS = ('insufficient_quota', 'credit balance', 'billing')
+
+    # Approximate list prices in USD per 1M tokens: {model: (input, output)}.
+    # Only used for --plan estimates; check the provider's pricing page for billing.
+    PRICES: Dict[str, Tuple[float, float]] = {}
+
+    def __init__(self, api_key: str, model: str, timeout: Optional[float] = None):
         """
         Initialize AI provider.
 
         Args:
             api_key: API key for the provider
             model: Model identifier to use
+            timeout: Per-request timeout in seconds (None uses the SDK default)
         """
         self.api_key = api_key
         self.model = model
+        self.timeout = timeout
+        # Token usage is tracked per thread because one provider serves parallel requests
+        self._usage = threading.local()
+
+    @property
+    def last_usage(self) -> Optional[Dict[str, int]]:
+        """
+        Token usage of the latest request made from the current thread.
+
+        Returns:
+            {'input_tokens': int, 'output_tokens': int}, or None if the provider
+            did not report usage (e.g. a stream closed before completion)
+        """
+        return getattr(self._usage, 'value', None)
+
+    def reset_usage(self):
+        """Forget the usage of the previous request on the current thread."""
+        self._usage.value = None
+
+    def _set_usage(self, input_tokens: Optional[int], output_tokens: Optional[int]):
+        """Record token usage reported by the SDK."""
+        self._usage.value = {
+            'input_tokens': input_tokens or 0,
+            'output_tokens': output_tokens or 0,
+        }
+
+    @classmethod
+    def estimate_image_tokens(cls, width: int, height: int) -> int:
+        """
+        Estimate the input tokens one slide image costs, without calling the API.
+
+        The default follows the common "pixels / 750" rule with the image
+        downscaled to a 1568px long edge and about 1.15 megapixels.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+
+        Returns:
+            Approximate token count
+        """
+        scale = min(1.0, 1568 / max(width, height), math.sqrt(1_150_000 / (width * height)))
+        return math.ceil(round(width * scale) * round(height * scale) / 750)
+
+    def classify_error(self, error: Exception) -> Optional[str]:
+        """
+        Tell whether a failed request was caused by the API key itself.
+
+        Used by the key pool to rest or retire a key and retry with another one.
+
+        Args:
+            error: Exception raised by the SDK
+
+        Returns:
+            'rate_limit' (HTTP 429), 'auth' (HTTP 401/403), 'quota' (billing or
+            quota exhausted) or None for errors unrelated to the key
+        """
+        message = str(error).lower()
+        if any(marker in message for marker in self.QUOTA_ERROR_MARKERS):
+            return 'quota'
+        status = getattr(error, 'status_code', None)
+        if not isinstance(status, int):
+            # google-genai APIError carries the HTTP status in .code
+            status = getattr(error, 'code', None)
+        if status == 429:
+            return 'rate_limit'
+        if status in (401, 403):
+            return 'auth'
+        return None
+
+    @classmethod
+    def price(cls, model: str) -> Optional[Tuple[float, float]]:
+        """(input, output) USD per 1M tokens for a model, or None if unknown."""
+        return cls.PRICES.get(model)
 
     @abstractmethod
     def analyze_slide(
         self,
         image: Image.Image,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
     ) -> str:
         """
         Analyze a slide image and generate speaker notes.
@@ -34,12 +143,101 @@ class AIProvider(ABC):
         Args:
             image: PIL Image of the slide
             context: Optional context materials to enhance notes
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
 
         Returns:
             Generated speaker notes as string
         """
         pass
 
+    def analyze_slide_stream(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Streaming variant of analyze_slide that yields text chunks as they arrive.
+
+        Closing the iterator early stops generation. The default implementation
+        yields the complete result of analyze_slide as a single chunk; providers
+        whose SDK supports streaming override it.
+
+        Args:
+            image: PIL Image of the slide
+            context: Optional context materials to enhance notes
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
+
+        Yields:
+            Chunks of the generated speaker notes
+        """
+        yield self.analyze_slide(image, context, slide_text=slide_text, previous_notes=previous_notes)
+
+    @abstractmethod
+    def generate_text(self, prompt: str) -> str:
+        """
+        Run a text-only completion (no image).
+
+        Args:
+            prompt: Complete prompt string
+
+        Returns:
+            Generated text
+        """
+        pass
+
+    def generate_text_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Streaming variant of generate_text (single chunk by default).
+
+        Args:
+            prompt: Complete prompt string
+
+        Yields:
+            Chunks of the generated text
+        """
+        yield self.generate_text(prompt)
+
+    def analyze_text(
+        self,
+        slide_text: str,
+        context: Optional[str] = None
+    ) -> str:
+        """
+        Generate speaker notes from the slide's text layer only.
+
+        Much smaller and faster than an image request; suitable for
+        text-heavy slides such as bullet lists.
+
+        Args:
+            slide_text: Text extracted from the PDF text layer
+            context: Optional context materials
+
+        Returns:
+            Generated speaker notes
+        """
+        return self.generate_text(self._get_text_prompt(slide_text, context))
+
+    def analyze_text_stream(
+        self,
+        slide_text: str,
+        context: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Streaming variant of analyze_text.
+
+        Args:
+            slide_text: Text extracted from the PDF text layer
+            context: Optional context materials
+
+        Yields:
+            Chunks of the generated speaker notes
+        """
+        return self.generate_text_stream(self._get_text_prompt(slide_text, context))
+
     @abstractmethod
     def get_available_models(self) -> list[str]:
         """
@@ -50,30 +248,106 @@ class AIProvider(ABC):
         """
         pass
 
-    def _get_prompt(self, context: Optional[str] = None) -> str:
+    def _get_prompt(
+        self,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> str:
         """
         Get the speaker notes generation prompt.
 
         Args:
             context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide;
+                switches to a short delta prompt
 
         Returns:
             Complete prompt string
         """
-        base_prompt = """이 슬라이드 이미지를 분석하고 발표자 노트를 작성해주세요.
+        if previous_notes:
+            return self._get_delta_prompt(previous_notes, slide_text)
 
-발표자 노트에 포함할 내용:
-1. **핵심 메시지**: 이 슬라이드에서 전달해야 할 가장 중요한 포인트
-2. **상세 설명**: 슬라이드에 표시된 내용의 부연 설명
-3. **전환 멘트**: 다음 슬라이드로 넘어가기 위한 자연스러운 연결 문구
-4. **예상 질문**: 청중이 할 수 있는 질문과 답변 가이드
-5. **발표 팁**: 강조할 부분, 속도 조절 등
+        base_prompt = "이 슬라이드 이미지를 분석하고 발표자 노트를 작성해주세요.\n\n" + self.NOTES_GUIDE
 
-형식:
+        if slide_text:
+            base_prompt += f"""
+
+---
+슬라이드 텍스트 (PDF 텍스트 레이어에서 추출):
+{slide_text}
+---
+
+위 텍스트는 슬라이드에 적힌 내용 그대로입니다. 이미지와 함께 참고하세요."""
+
+        return base_prompt + self._get_context_section(context)
+
+    def _get_delta_prompt(
+        self,
+        previous_notes: str,
+        slide_text: Optional[str] = None
+    ) -> str:
+        """
+        Get the short prompt for a slide nearly identical to the previous one.
+
+        Args:
+            previous_notes: Speaker notes of the previous slide
+            slide_text: Optional text extracted from the PDF text layer
+
+        Returns:
+            Complete prompt string
+        """
+        prompt = f"""이 슬라이드는 바로 앞 슬라이드와 거의 같습니다 (빌드업 애니메이션, 강조 표시 등).
+
+---
+앞 슬라이드의 발표자 노트:
+{previous_notes}
+---
+
+앞 슬라이드와 달라진 부분만 중심으로 짧은 발표자 노트를 작성해주세요.
 - 한국어로 작성
-- 2-3분 분량의 발표 스크립트
-- 읽기 쉽게 bullet point 활용"""
+- 앞 노트의 내용을 반복하지 말 것
+- 3-5개의 bullet point"""
+
+        if slide_text:
+            prompt += f"""
+
+---
+슬라이드 텍스트 (PDF 텍스트 레이어에서 추출):
+{slide_text}
+---"""
+
+        return prompt
+
+    def _get_text_prompt(
+        self,
+        slide_text: str,
+        context: Optional[str] = None
+    ) -> str:
+        """
+        Get the speaker notes prompt for text-only requests (no image).
+
+        Args:
+            slide_text: Text extracted from the PDF text layer
+            context: Optional context materials
+
+        Returns:
+            Complete prompt string
+        """
+        base_prompt = f"""다음은 발표 슬라이드 한 장에 적힌 텍스트입니다. 이 슬라이드의 발표자 노트를 작성해주세요.
+
+---
+슬라이드 텍스트:
+{slide_text}
+---
+
+""" + self.NOTES_GUIDE
+
+        return base_prompt + self._get_context_section(context)
 
+    def _get_context_section(self, context: Optional[str] = None) -> str:
+        """Build the context materials section appended to prompts."""
         if context:
             context_section = f"""
 
@@ -83,6 +357,6 @@ class AIProvider(ABC):
 ---
 
 위 참고 자료를 바탕으로 슬라이드 내용을 더욱 풍부하게 설명해주세요."""
-            return base_prompt + context_section
+            return context_section
 
-        return base_prompt
+        return ""
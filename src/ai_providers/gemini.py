@@ -3,11 +3,13 @@ Google Gemini AI Provider
 Vision API for slide analysis and speaker notes generation
 """
 
-from typing import Optional
+import math
+from typing import Optional, Iterator
 from PIL import Image
 
 try:
-    import google.generativeai as genai
+    from google import genai
+    from google.genai import types as genai_types
 except ImportError:
     genai = None
 
@@ -23,28 +25,65 @@ class GeminiProvider(AIProvider):
         "gemini-2.0-flash-exp",  # 실험적 빠른 모델
     ]
 
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash"):
+    # 복잡도 라우팅 기본값 (단순 슬라이드 / 복잡한 슬라이드)
+    FAST_MODEL = "gemini-2.5-flash"
+    STRONG_MODEL = "gemini-2.5-pro"
+    DEFAULT_MODEL = "gemini-2.5-flash"
+
+    # --plan 비용 추정용 가격 (USD / 100만 토큰: 입력, 출력)
+    PRICES = {
+        "gemini-2.5-flash": (0.3, 2.5),
+        "gemini-2.5-pro": (1.25, 10.0),
+        "gemini-2.0-flash-exp": (0.1, 0.4),
+    }
+
+    def __init__(self, api_key: str, model: str = DEFAULT_MODEL, timeout: Optional[float] = None):
         """
         Initialize Gemini provider.
 
         Args:
             api_key: Google AI API key
             model: Gemini model to use (default: gemini-2.5-flash)
+            timeout: Per-request timeout in seconds
         """
         if genai is None:
             raise ImportError(
-                "google-generativeai package not found. "
-                "Install with: pip install google-generativeai"
+                "google-genai package not found. "
+                "Install with: pip install google-genai"
             )
 
-        super().__init__(api_key, model)
-        genai.configure(api_key=api_key)
-        self.client = genai.GenerativeModel(model)
+        super().__init__(api_key, model, timeout)
+        # Each provider has its own client bound to its key (no process-global
+        # configuration), so the key pool can run one client per key
+        http_options = genai_types.HttpOptions(timeout=int(timeout * 1000)) if timeout else None
+        self.client = genai.Client(api_key=api_key, http_options=http_options)
+
+    @classmethod
+    def estimate_image_tokens(cls, width: int, height: int) -> int:
+        """
+        Estimate image tokens with Gemini's tiling rule.
+
+        Small images cost 258 tokens; larger ones are cut into square tiles
+        (side = shorter edge / 1.5, clamped to 256-768px) of 258 tokens each.
+        """
+        if width <= 384 and height <= 384:
+            return 258
+        tile = min(768, max(256, int(min(width, height) / 1.5)))
+        return 258 * math.ceil(width / tile) * math.ceil(height / tile)
+
+    def classify_error(self, error: Exception) -> Optional[str]:
+        """Also treat "API key not valid" (HTTP 400 from Gemini) as an auth error."""
+        message = str(error)
+        if 'API_KEY_INVALID' in message or 'API key not valid' in message:
+            return 'auth'
+        return super().classify_error(error)
 
     def analyze_slide(
         self,
         image: Image.Image,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
     ) -> str:
         """
         Analyze slide image using Gemini Vision.
@@ -52,16 +91,82 @@ class GeminiProvider(AIProvider):
         Args:
             image: PIL Image of the slide
             context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
 
         Returns:
             Generated speaker notes
         """
-        prompt = self._get_prompt(context)
+        prompt = self._get_prompt(context, slide_text, previous_notes)
 
         # Gemini accepts PIL Image directly
-        response = self.client.generate_content([prompt, image])
+        response = self.client.models.generate_content(model=self.model, contents=[prompt, image])
+
+        self._record_usage(response)
+        return response.text or ''
+
+    def analyze_slide_stream(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream speaker notes from Gemini Vision chunk by chunk.
+
+        Args:
+            image: PIL Image of the slide
+            context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
+
+        Yields:
+            Chunks of the generated speaker notes
+        """
+        prompt = self._get_prompt(context, slide_text, previous_notes)
+        return self._stream_content([prompt, image])
+
+    def generate_text(self, prompt: str) -> str:
+        """
+        Run a text-only Gemini completion.
+
+        Args:
+            prompt: Complete prompt string
+
+        Returns:
+            Generated text
+        """
+        response = self.client.models.generate_content(model=self.model, contents=prompt)
+
+        self._record_usage(response)
+        return response.text or ''
+
+    def generate_text_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a text-only Gemini completion chunk by chunk.
+
+        Args:
+            prompt: Complete prompt string
+
+        Yields:
+            Chunks of the generated text
+        """
+        return self._stream_content(prompt)
+
+    def _stream_content(self, contents) -> Iterator[str]:
+        """Yield text of each streamed response chunk."""
+        for chunk in self.client.models.generate_content_stream(model=self.model, contents=contents):
+            # Chunks without text parts (e.g. safety or finish metadata) have text None
+            if chunk.text:
+                yield chunk.text
+            # Cumulative usage; the last chunk holds the total
+            self._record_usage(chunk)
 
-        return response.text
+    def _record_usage(self, response):
+        usage = getattr(response, 'usage_metadata', None)
+        if usage:
+            self._set_usage(usage.prompt_token_count, usage.candidates_token_count)
 
     def get_available_models(self) -> list[str]:
         """Get available Gemini models."""
@@ -5,7 +5,7 @@ Vision API for slide analysis and speaker notes generation
 
 import base64
 import io
-from typing import Optional
+from typing import Optional, Iterator, List, Dict, Any
 from PIL import Image
 
 try:
@@ -25,15 +25,28 @@ class GrokProvider(AIProvider):
         "grok-beta",      # Grok Beta
     ]
 
+    # 복잡도 라우팅 기본값 (단순 슬라이드 / 복잡한 슬라이드)
+    FAST_MODEL = "grok-2-vision-1212"
+    STRONG_MODEL = "grok-2-vision-1212"
+    DEFAULT_MODEL = "grok-2-vision-1212"
+
+    # --plan 비용 추정용 가격 (USD / 100만 토큰: 입력, 출력)
+    PRICES = {
+        "grok-2-1212": (2.0, 10.0),
+        "grok-2-vision-1212": (2.0, 10.0),
+        "grok-beta": (5.0, 15.0),
+    }
+
     XAI_BASE_URL = "https://api.x.ai/v1"
 
-    def __init__(self, api_key: str, model: str = "grok-2-vision-1212"):
+    def __init__(self, api_key: str, model: str = DEFAULT_MODEL, timeout: Optional[float] = None):
         """
         Initialize Grok provider.
 
         Args:
             api_key: xAI API key
             model: Grok model to use (default: grok-2-vision-1212)
+            timeout: Per-request timeout in seconds
         """
         if openai is None:
             raise ImportError(
@@ -41,10 +54,11 @@ class GrokProvider(AIProvider):
                 "Install with: pip install openai"
             )
 
-        super().__init__(api_key, model)
+        super().__init__(api_key, model, timeout)
         self.client = openai.OpenAI(
             api_key=api_key,
-            base_url=self.XAI_BASE_URL
+            base_url=self.XAI_BASE_URL,
+            timeout=timeout
         )
 
     def _image_to_base64(self, image: Image.Image) -> str:
@@ -53,10 +67,41 @@ class GrokProvider(AIProvider):
         image.save(buffer, format='PNG')
         return base64.b64encode(buffer.getvalue()).decode('utf-8')
 
+    def _slide_messages(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Build the chat messages for a slide request (prompt + image)."""
+        prompt = self._get_prompt(context, slide_text, previous_notes)
+        image_b64 = self._image_to_base64(image)
+
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": prompt
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:image/png;base64,{image_b64}"
+                        }
+                    }
+                ]
+            }
+        ]
+
     def analyze_slide(
         self,
         image: Image.Image,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
     ) -> str:
         """
         Analyze slide image using Grok Vision.
@@ -64,37 +109,100 @@ class GrokProvider(AIProvider):
         Args:
             image: PIL Image of the slide
             context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
 
         Returns:
             Generated speaker notes
         """
-        prompt = self._get_prompt(context)
-        image_b64 = self._image_to_base64(image)
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._slide_messages(image, context, slide_text, previous_notes),
+            max_tokens=2000
+        )
+
+        self._record_usage(response.usage)
+        return response.choices[0].message.content
+
+    def analyze_slide_stream(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream speaker notes from Grok Vision chunk by chunk.
 
+        Args:
+            image: PIL Image of the slide
+            context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
+
+        Yields:
+            Chunks of the generated speaker notes
+        """
+        return self._stream_chat(self._slide_messages(image, context, slide_text, previous_notes))
+
+    def generate_text(self, prompt: str) -> str:
+        """
+        Run a text-only Grok completion.
+
+        Args:
+            prompt: Complete prompt string
+
+        Returns:
+            Generated text
+        """
         response = self.client.chat.completions.create(
             model=self.model,
             messages=[
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{image_b64}"
-                            }
-                        }
-                    ]
+                    "content": prompt
                 }
             ],
             max_tokens=2000
         )
 
+        self._record_usage(response.usage)
         return response.choices[0].message.content
 
+    def generate_text_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a text-only Grok completion chunk by chunk.
+
+        Args:
+            prompt: Complete prompt string
+
+        Yields:
+            Chunks of the generated text
+        """
+        return self._stream_chat([{"role": "user", "content": prompt}])
+
+    def _stream_chat(self, messages: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield content deltas of a streamed chat completion (closing stops the request)."""
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=2000,
+            stream=True
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if getattr(chunk, 'usage', None):
+                    # Sent with the final chunk
+                    self._record_usage(chunk.usage)
+        finally:
+            stream.close()
+
+    def _record_usage(self, usage):
+        if usage is not None:
+            self._set_usage(usage.prompt_tokens, usage.completion_tokens)
+
     def get_available_models(self) -> list[str]:
         """Get available Grok models."""
         return self.MODELS
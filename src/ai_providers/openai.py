@@ -5,7 +5,8 @@ Vision API for slide analysis and speaker notes generation
 
 import base64
 import io
-from typing import Optional
+import math
+from typing import Optional, Iterator, List, Dict, Any
 from PIL import Image
 
 try:
@@ -26,13 +27,27 @@ class OpenAIProvider(AIProvider):
         "gpt-4-turbo",    # GPT-4 Turbo with Vision
     ]
 
-    def __init__(self, api_key: str, model: str = "gpt-4.1"):
+    # 복잡도 라우팅 기본값 (단순 슬라이드 / 복잡한 슬라이드)
+    FAST_MODEL = "gpt-4.1-mini"
+    STRONG_MODEL = "gpt-4.1"
+    DEFAULT_MODEL = "gpt-4.1"
+
+    # --plan 비용 추정용 가격 (USD / 100만 토큰: 입력, 출력)
+    PRICES = {
+        "gpt-4.1": (2.0, 8.0),
+        "gpt-4.1-mini": (0.4, 1.6),
+        "gpt-4o": (2.5, 10.0),
+        "gpt-4-turbo": (10.0, 30.0),
+    }
+
+    def __init__(self, api_key: str, model: str = DEFAULT_MODEL, timeout: Optional[float] = None):
         """
         Initialize OpenAI provider.
 
         Args:
             api_key: OpenAI API key
             model: GPT model to use (default: gpt-4.1)
+            timeout: Per-request timeout in seconds
         """
         if openai is None:
             raise ImportError(
@@ -40,8 +55,8 @@ class OpenAIProvider(AIProvider):
                 "Install with: pip install openai"
             )
 
-        super().__init__(api_key, model)
-        self.client = openai.OpenAI(api_key=api_key)
+        super().__init__(api_key, model, timeout)
+        self.client = openai.OpenAI(api_key=api_key, timeout=timeout)
 
     def _image_to_base64(self, image: Image.Image) -> str:
         """Convert PIL Image to base64 string."""
@@ -49,10 +64,55 @@ class OpenAIProvider(AIProvider):
         image.save(buffer, format='PNG')
         return base64.b64encode(buffer.getvalue()).decode('utf-8')
 
+    def _slide_messages(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Build the chat messages for a slide request (prompt + image)."""
+        prompt = self._get_prompt(context, slide_text, previous_notes)
+        image_b64 = self._image_to_base64(image)
+
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": prompt
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:image/png;base64,{image_b64}"
+                        }
+                    }
+                ]
+            }
+        ]
+
+    @classmethod
+    def estimate_image_tokens(cls, width: int, height: int) -> int:
+        """
+        Estimate image tokens with OpenAI's high-detail tiling rule.
+
+        The image is fit into 2048x2048, its short side scaled to 768px,
+        then billed 85 tokens plus 170 per 512px tile.
+        """
+        scale = min(1.0, 2048 / max(width, height))
+        width, height = width * scale, height * scale
+        scale = min(1.0, 768 / min(width, height))
+        width, height = width * scale, height * scale
+        return 85 + 170 * math.ceil(width / 512) * math.ceil(height / 512)
+
     def analyze_slide(
         self,
         image: Image.Image,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
     ) -> str:
         """
         Analyze slide image using OpenAI Vision.
@@ -60,37 +120,101 @@ class OpenAIProvider(AIProvider):
         Args:
             image: PIL Image of the slide
             context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
 
         Returns:
             Generated speaker notes
         """
-        prompt = self._get_prompt(context)
-        image_b64 = self._image_to_base64(image)
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._slide_messages(image, context, slide_text, previous_notes),
+            max_tokens=2000
+        )
+
+        self._record_usage(response.usage)
+        return response.choices[0].message.content
+
+    def analyze_slide_stream(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream speaker notes from OpenAI Vision chunk by chunk.
 
+        Args:
+            image: PIL Image of the slide
+            context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
+
+        Yields:
+            Chunks of the generated speaker notes
+        """
+        return self._stream_chat(self._slide_messages(image, context, slide_text, previous_notes))
+
+    def generate_text(self, prompt: str) -> str:
+        """
+        Run a text-only OpenAI completion.
+
+        Args:
+            prompt: Complete prompt string
+
+        Returns:
+            Generated text
+        """
         response = self.client.chat.completions.create(
             model=self.model,
             messages=[
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{image_b64}"
-                            }
-                        }
-                    ]
+                    "content": prompt
                 }
             ],
             max_tokens=2000
         )
 
+        self._record_usage(response.usage)
         return response.choices[0].message.content
 
+    def generate_text_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a text-only OpenAI completion chunk by chunk.
+
+        Args:
+            prompt: Complete prompt string
+
+        Yields:
+            Chunks of the generated text
+        """
+        return self._stream_chat([{"role": "user", "content": prompt}])
+
+    def _stream_chat(self, messages: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield content deltas of a streamed chat completion (closing stops the request)."""
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=2000,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if getattr(chunk, 'usage', None):
+                    # Sent with the final chunk
+                    self._record_usage(chunk.usage)
+        finally:
+            stream.close()
+
+    def _record_usage(self, usage):
+        if usage is not None:
+            self._set_usage(usage.prompt_tokens, usage.completion_tokens)
+
     def get_available_models(self) -> list[str]:
         """Get available OpenAI models."""
         return self.MODELS
@@ -0,0 +1,200 @@
+"""
+OpenAI-Compatible Endpoint Provider
+Vision chat completions against any server that speaks the OpenAI API
+(vLLM, llama.cpp server, Ollama, LM Studio, ...)
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Optional, Iterator, List, Dict, Any, Tuple
+from PIL import Image
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+from .base import AIProvider
+from .openai import OpenAIProvider
+
+
+class OpenAICompatibleProvider(OpenAIProvider):
+    """
+    OpenAI-compatible vision endpoint provider (uses OpenAI SDK).
+
+    Settings not given to the constructor are read from the environment:
+    OPENAI_COMPATIBLE_BASE_URL, OPENAI_COMPATIBLE_MODEL,
+    OPENAI_COMPATIBLE_HEADERS (JSON object) and OPENAI_COMPATIBLE_MAX_CONCURRENCY.
+    """
+
+    # 모델은 서버마다 다르므로 지정하지 않으면 서버의 /models 첫 번째 모델 사용
+    MODELS: List[str] = []
+    FAST_MODEL = None
+    STRONG_MODEL = None
+    DEFAULT_MODEL = None
+
+    # 로컬 서버는 토큰 요금이 없고, 유료 호환 서비스는 가격을 알 수 없음
+    PRICES = {}
+
+    # 인증 없는 로컬 서버는 API 키 없이 사용 (SDK에는 자리 표시 키 전달)
+    API_KEY_REQUIRED = False
+    PLACEHOLDER_API_KEY = "not-needed"
+
+    DEFAULT_BASE_URL = "http://localhost:8000/v1"
+
+    # (서버, 동시 요청 수)별 요청 슬롯 (같은 설정으로 같은 서버를 쓰는 모든 인스턴스가 공유)
+    _slots: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+    _slots_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        base_url: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize an OpenAI-compatible provider.
+
+        Args:
+            api_key: API key for the server (optional for local servers)
+            model: Model name served by the endpoint (default: first model the server lists)
+            timeout: Per-request timeout in seconds
+            base_url: Endpoint base URL including /v1 (default: http://localhost:8000/v1)
+            headers: Extra HTTP headers sent with every request
+            max_concurrency: Maximum in-flight requests to this endpoint (None for no limit)
+        """
+        if openai is None:
+            raise ImportError(
+                "openai package not found. "
+                "Install with: pip install openai"
+            )
+
+        self.base_url = (
+            base_url or os.environ.get("OPENAI_COMPATIBLE_BASE_URL") or self.DEFAULT_BASE_URL
+        ).rstrip("/")
+        if headers is None:
+            headers = json.loads(os.environ.get("OPENAI_COMPATIBLE_HEADERS") or "{}")
+        self.headers = headers
+        if max_concurrency is None:
+            max_concurrency = int(os.environ.get("OPENAI_COMPATIBLE_MAX_CONCURRENCY") or 0) or None
+        self.max_concurrency = max_concurrency
+
+        AIProvider.__init__(self, api_key, model, timeout)
+        self.client = openai.OpenAI(
+            api_key=api_key or self.PLACEHOLDER_API_KEY,
+            base_url=self.base_url,
+            default_headers=headers or None,
+            timeout=timeout
+        )
+        self.model = model or os.environ.get("OPENAI_COMPATIBLE_MODEL") or self._detect_model()
+        self._slot = self._get_slot()
+
+    def _list_models(self) -> List[str]:
+        return [m.id for m in self.client.models.list()]
+
+    def _detect_model(self) -> str:
+        """Pick the first model the server lists."""
+        try:
+            models = self._list_models()
+        except Exception as e:
+            raise ValueError(
+                f"Could not list models from {self.base_url} ({e}). "
+                f"Pass a model name or set OPENAI_COMPATIBLE_MODEL."
+            ) from e
+        if not models:
+            raise ValueError(f"{self.base_url} serves no models. Pass a model name.")
+        return models[0]
+
+    def _get_slot(self) -> Optional[threading.BoundedSemaphore]:
+        if not self.max_concurrency:
+            return None
+        key = (self.base_url, self.max_concurrency)
+        with self._slots_lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = threading.BoundedSemaphore(self.max_concurrency)
+            return slot
+
+    @contextmanager
+    def _request_slot(self):
+        """Wait for a free request slot when max_concurrency is set."""
+        if self._slot is None:
+            yield
+            return
+        with self._slot:
+            yield
+
+    @classmethod
+    def estimate_image_tokens(cls, width: int, height: int) -> int:
+        """Estimate image tokens with the generic rule (tiling differs per local model)."""
+        return super(OpenAIProvider, cls).estimate_image_tokens(width, height)
+
+    def analyze_slide(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        slide_text: Optional[str] = None,
+        previous_notes: Optional[str] = None
+    ) -> str:
+        """
+        Analyze slide image with the endpoint's vision model.
+
+        Args:
+            image: PIL Image of the slide
+            context: Optional context materials
+            slide_text: Optional text extracted from the PDF text layer
+            previous_notes: Notes of a nearly identical previous slide (delta prompt)
+
+        Returns:
+            Generated speaker notes
+        """
+        with self._request_slot():
+            return super().analyze_slide(image, context, slide_text, previous_notes)
+
+    def generate_text(self, prompt: str) -> str:
+        """
+        Run a text-only completion on the endpoint.
+
+        Args:
+            prompt: Complete prompt string
+
+        Returns:
+            Generated text
+        """
+        with self._request_slot():
+            return super().generate_text(prompt)
+
+    def _stream_chat(self, messages: List[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Stream a chat completion while holding a request slot.
+
+        Unlike OpenAIProvider, stream_options is not sent: several servers reject
+        unknown options. Usage is still recorded if the server sends it.
+        """
+        with self._request_slot():
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=2000,
+                stream=True
+            )
+            try:
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                    if getattr(chunk, 'usage', None):
+                        self._record_usage(chunk.usage)
+            finally:
+                stream.close()
+
+    def get_available_models(self) -> list[str]:
+        """Get the models served by the endpoint."""
+        try:
+            return self._list_models()
+        except Exception:
+            return [self.model]
@@ -0,0 +1,76 @@
+"""
+Disk Cache Helpers
+컨텍스트 추출/요약 등 재사용 가능한 결과의 디스크 캐시 경로와 해시 유틸리티
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union, Tuple
+
+# 해시 계산 시 한 번에 읽는 크기
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_cache_dir(name: str) -> Path:
+    """
+    캐시 하위 디렉터리 경로 (없으면 생성).
+
+    기본 위치는 ~/.cache/nb2pptx 이며 NB2PPTX_CACHE_DIR 환경변수로 바꿀 수 있습니다.
+
+    Args:
+        name: 하위 디렉터리 이름 (예: 'digest')
+
+    Returns:
+        캐시 디렉터리 경로
+    """
+    root = os.environ.get('NB2PPTX_CACHE_DIR') or Path.home() / '.cache' / 'nb2pptx'
+    path = Path(root) / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# 같은 파일을 여러 번 해시하지 않도록 (경로, 수정 시각, 크기) 기준으로 기억
+# (감시 모드처럼 오래 도는 프로세스에서 무한히 늘지 않도록 최근 항목만 유지)
+FILE_HASH_MEMO_SIZE = 1024
+_file_hashes: 'OrderedDict[Tuple[str, int, int], str]' = OrderedDict()
+_file_hashes_lock = threading.Lock()
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """
+    파일 내용의 SHA-256 해시 (스트리밍 읽기).
+
+    미리보기 후 변환처럼 같은 파일을 다시 해시할 때는 파일이 바뀌지 않았으면 이전 결과를 사용합니다.
+    """
+    stat = os.stat(path)
+    memo_key = (str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)
+    with _file_hashes_lock:
+        cached = _file_hashes.get(memo_key)
+        if cached is not None:
+            _file_hashes.move_to_end(memo_key)
+            return cached
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    result = digest.hexdigest()
+
+    with _file_hashes_lock:
+        _file_hashes[memo_key] = result
+        _file_hashes.move_to_end(memo_key)
+        while len(_file_hashes) > FILE_HASH_MEMO_SIZE:
+            _file_hashes.popitem(last=False)
+    return result
+
+
+def text_sha256(*parts: str) -> str:
+    """문자열 조각들을 이어 붙인 SHA-256 해시."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
@@ -0,0 +1,63 @@
+"""
+Cancellation and Deadlines
+실행 중인 변환을 중단하는 취소 토큰과 작업 전체 기한(deadline)
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class ConversionCancelled(Exception):
+    """변환이 취소됨 (출력 파일은 만들지 않음)."""
+
+
+class DeadlineExceeded(ConversionCancelled):
+    """작업 기한이 지남 (완료된 노트까지만 담아 부분 결과로 저장)."""
+
+
+class CancellationToken:
+    """
+    변환 취소 요청과 작업 기한을 전달하는 토큰.
+
+    다른 스레드(UI, 워커 하트비트 등)에서 cancel()을 호출하면 변환이 다음 확인 지점에서 멈춥니다.
+    확인 지점은 슬라이드 시작과 스트리밍 응답의 조각마다 있습니다.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: 작업 기한 (지금부터 초, None이면 기한 없음)
+        """
+        self.deadline = time.time() + timeout if timeout else None
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+
+    def cancel(self, reason: str = '사용자 취소'):
+        """취소 요청."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """명시적으로 취소되었는지 (기한 초과는 제외)."""
+        return self._event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        """기한이 지났는지."""
+        return self.deadline is not None and time.time() >= self.deadline
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간 (초, 기한이 없으면 None)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
+
+    def raise_if_cancelled(self):
+        """취소되었으면 ConversionCancelled, 기한이 지났으면 DeadlineExceeded 발생."""
+        if self.cancelled:
+            raise ConversionCancelled(self.reason)
+        if self.expired:
+            raise DeadlineExceeded('작업 기한 초과')
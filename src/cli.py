@@ -4,7 +4,9 @@ NotebookLM PDF to PPTX Converter CLI
 
 import os
 import sys
+import json
 import argparse
+import contextlib
 from pathlib import Path
 from typing import List, Optional
 from dotenv import load_dotenv
@@ -18,10 +20,15 @@ from rich.progress import (
     TimeRemainingColumn
 )
 from rich.panel import Panel
+from rich.markup import escape
 from rich.theme import Theme
 
 # Import inside the package
 from .converter import NotebookLMToPPTX
+from .page_cache import PageCache
+from .cancellation import CancellationToken
+from .sharding import parse_shard_spec, shard_path
+from . import events as ev
 
 # 커스텀 테마 (Neo-brutalism 스타일 느낌)
 custom_theme = Theme({
@@ -35,6 +42,52 @@ custom_theme = Theme({
 
 console = Console(theme=custom_theme)
 
+# Rich 진행률 표시줄에 보여줄 단계 이름
+STAGE_LABELS = {
+    "context": "맥락 자료 준비 중...",
+    "render": "PDF 렌더링 중...",
+    "text_layer": "텍스트 레이어 추출 중...",
+    "slides": "슬라이드 변환 중...",
+    "notes": "노트 생성 중...",
+    "save": "PPTX 저장 중...",
+}
+
+# -p/--provider 선택지 (openai-compatible / local: vLLM, llama.cpp, Ollama 등 OpenAI 호환 서버)
+PROVIDER_CHOICES = ["gemini", "openai", "claude", "anthropic", "grok", "xai", "openai-compatible", "local"]
+
+def _header(value: str):
+    """--header 인자 ('이름: 값') 검사."""
+    name, sep, content = value.partition(":")
+    if not sep or not name.strip():
+        raise argparse.ArgumentTypeError(f"헤더는 '이름: 값' 형식이어야 합니다: {value}")
+    return name.strip(), content.strip()
+
+def add_endpoint_args(parser: argparse.ArgumentParser):
+    """OpenAI 호환 서버(-p openai-compatible) 연결 옵션 추가."""
+    parser.add_argument("--base-url", help="OpenAI 호환 서버 주소 (예: http://gpu-server:8000/v1, 기본값: 환경변수 OPENAI_COMPATIBLE_BASE_URL 또는 localhost:8000)")
+    parser.add_argument("--header", type=_header, action="append", metavar="'이름: 값'", help="OpenAI 호환 서버에 보낼 HTTP 헤더. 여러 번 사용 가능.")
+    parser.add_argument("--max-concurrency", type=int, help="OpenAI 호환 서버에 동시에 보낼 최대 요청 수 (서버 하드웨어에 맞게 제한)")
+
+def provider_options(args) -> Optional[dict]:
+    """add_endpoint_args 옵션을 NotebookLMToPPTX(provider_options=...)로 변환 (지정하지 않았으면 None)."""
+    if args.provider not in ("openai-compatible", "local"):
+        return None
+    options = {}
+    if args.base_url:
+        options["base_url"] = args.base_url
+    if args.header:
+        options["headers"] = dict(args.header)
+    if args.max_concurrency:
+        options["max_concurrency"] = args.max_concurrency
+    return options or None
+
+def _shard_spec(value: str):
+    """--shard 인자 ('i/N') 검사."""
+    try:
+        return parse_shard_spec(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
 def parse_args():
     parser = argparse.ArgumentParser(
         description="NotebookLM PDF를 스피커 노트가 포함된 PPTX로 변환합니다.",
@@ -55,7 +108,7 @@ def parse_args():
     parser.add_argument(
         "-p", "--provider",
         default="gemini",
-        choices=["gemini", "openai", "claude", "anthropic", "grok", "xai"],
+        choices=PROVIDER_CHOICES,
         help="사용할 AI 프로바이더 (기본값: gemini)"
     )
     
@@ -63,10 +116,18 @@ def parse_args():
         "-m", "--model",
         help="AI 모델명 (지정하지 않으면 프로바이더 기본값 사용)"
     )
+    add_endpoint_args(parser)
     
     parser.add_argument(
         "-k", "--api-key",
-        help="API 키 (환경변수보다 우선순위 높음)"
+        action="append",
+        help="API 키 (환경변수보다 우선순위 높음). 여러 번 지정하거나 쉼표로 구분하면 키 풀로 요청을 분산합니다."
+    )
+    parser.add_argument(
+        "--key-rpm",
+        type=int,
+        default=None,
+        help="키 풀 사용 시 키별 분당 요청 한도 (지정하면 한도 안에서 여유가 큰 키부터 사용)"
     )
     
     parser.add_argument(
@@ -93,6 +154,11 @@ def parse_args():
         default=144,
         help="PDF 변환 해상도 (기본값: 144 DPI)"
     )
+    parser.add_argument(
+        "--ppi",
+        type=int,
+        help="DPI 대신 슬라이드 기준 해상도로 렌더링 (예: 96 → 1280×720, 144 → 1920×1080). 페이지 크기와 무관하게 필요한 픽셀만 생성합니다."
+    )
     parser.add_argument(
         "--update",
         action="store_true",
@@ -103,6 +169,153 @@ def parse_args():
         action="store_true",
         help="우측 하단 NotebookLM 워터마크를 제거합니다."
     )
+    parser.add_argument(
+        "--text-mode",
+        default="off",
+        choices=["off", "assist", "text-only"],
+        help="PDF 텍스트 레이어 활용 (assist: 이미지+텍스트, text-only: 텍스트 위주 슬라이드는 이미지 없이 전송)"
+    )
+    parser.add_argument(
+        "--text-only-coverage",
+        type=float,
+        default=0.9,
+        help="text-only 모드에서 이미지 없이 보낼 최소 텍스트 비중 (0~1, 기본값: 0.9)"
+    )
+    parser.add_argument(
+        "--route",
+        action="store_true",
+        help="슬라이드 복잡도에 따라 빠른 모델/강한 모델로 나눠 보냅니다."
+    )
+    parser.add_argument(
+        "--route-threshold",
+        type=float,
+        default=0.45,
+        help="강한 모델로 보낼 최소 복잡도 점수 (0~1, 기본값: 0.45)"
+    )
+    parser.add_argument(
+        "--simple-model",
+        help="단순 슬라이드용 모델 (기본값: 프로바이더의 빠른 모델)"
+    )
+    parser.add_argument(
+        "--complex-model",
+        help="복잡한 슬라이드용 모델 (기본값: -m 모델 또는 프로바이더의 강한 모델)"
+    )
+    parser.add_argument(
+        "--report",
+        help="실행 리포트(JSON) 저장 경로 (--plan과 함께 쓰면 예측 결과 저장)"
+    )
+    parser.add_argument(
+        "--digest",
+        action="store_true",
+        help="맥락 자료를 한 번 요약해 모든 슬라이드에서 재사용합니다 (대용량 맥락 자료용)."
+    )
+    parser.add_argument(
+        "--digest-max-chars",
+        type=int,
+        default=8000,
+        help="맥락 요약 최대 길이 (문자, 기본값: 8000)"
+    )
+    parser.add_argument(
+        "--context-max-file-mb",
+        type=float,
+        default=10,
+        help="맥락 자료 단일 파일 최대 크기 (MB, 기본값: 10)"
+    )
+    parser.add_argument(
+        "--context-max-total-mb",
+        type=float,
+        default=50,
+        help="맥락 자료 전체 최대 크기 (MB, 기본값: 50)"
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="동일/유사 슬라이드(빌드업, 반복 구분 슬라이드)의 이미지와 노트를 재사용합니다."
+    )
+    parser.add_argument(
+        "--dedup-threshold",
+        type=int,
+        default=6,
+        help="유사 슬라이드로 볼 최대 해시 거리 (0~64, 기본값: 6, 0이면 동일 슬라이드만)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="이전 변환 결과와 비교해 바뀐 슬라이드만 다시 렌더링/노트 생성합니다."
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="완성된 슬라이드를 바로 PPTX에 기록합니다 (수백 장짜리 덱의 메모리 사용량 감소)."
+    )
+    parser.add_argument(
+        "--media-format",
+        default="png",
+        choices=["png", "png-optimized", "palette", "jpeg", "auto"],
+        help="슬라이드 이미지 형식 (auto: 사진형 슬라이드는 JPEG, 나머지는 팔레트 PNG, 기본값: png)"
+    )
+    parser.add_argument(
+        "--jpeg-quality",
+        type=int,
+        default=85,
+        help="JPEG 품질 (1~95, 기본값: 85)"
+    )
+    parser.add_argument(
+        "--native-text",
+        action="store_true",
+        help="PDF 텍스트를 편집 가능한 텍스트 상자로 복원합니다 (배경은 텍스트를 지운 이미지, 가볍고 검색 가능한 PPTX)."
+    )
+    parser.add_argument(
+        "--notes-max-length",
+        type=int,
+        default=None,
+        help="노트 최대 글자수. 응답을 스트리밍으로 받다가 이 길이에 도달하면 생성을 멈춥니다 (예: 500)."
+    )
+    parser.add_argument(
+        "--request-timeout",
+        type=float,
+        default=120,
+        help="AI 요청 하나의 최대 대기 시간 (초, 기본값: 120)"
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="작업 전체 기한 (초). 지나면 남은 슬라이드는 노트 없이 저장하고 부분 결과로 표시합니다."
+    )
+    parser.add_argument(
+        "--render-cache",
+        action="store_true",
+        help="렌더링한 페이지를 캐시해 같은 PDF를 다시 변환할 때 렌더링을 생략합니다."
+    )
+    parser.add_argument(
+        "--events",
+        action="store_true",
+        help="진행 이벤트를 JSON Lines로 stdout에 출력합니다 (다른 출력은 stderr, 오케스트레이션 연동용)."
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="변환하지 않고 예상 토큰, 비용, 소요 시간만 출력합니다 (렌더링/API 호출 없음)."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="--plan에서 함께 예측할 병렬 실행 수 (--shard, watch --workers, 큐 워커로 나눠 실행할 때, 기본값: 1). "
+             "한 번의 변환이 키 풀로 보내는 동시 요청 수는 자동으로 함께 예측합니다."
+    )
+    parser.add_argument(
+        "--shard",
+        type=_shard_spec,
+        metavar="i/N",
+        help="페이지를 N개 구간으로 나눠 i번째 구간만 변환합니다 (기본 출력: 원본파일명.shard-i-of-N.pptx, nb2pptx merge로 합치기)."
+    )
+    parser.add_argument(
+        "--no-context-cache",
+        action="store_true",
+        help="맥락 자료 추출 캐시를 사용하지 않습니다."
+    )
     
     return parser.parse_args()
 
@@ -165,11 +378,360 @@ def launch_ui():
         console.print(f"[error]❌ UI 실행 실패:[/error] {str(e)}")
         sys.exit(1)
 
+def run_worker(argv: List[str]):
+    """작업 큐 워커 실행 (nb2pptx worker)"""
+    from .jobqueue import JobQueue, QueueWorker, DEFAULT_QUEUE_PATH
+
+    parser = argparse.ArgumentParser(prog="nb2pptx worker", description="SQLite 작업 큐의 변환 작업을 처리합니다.")
+    parser.add_argument("--queue", default=os.environ.get("NB2PPTX_QUEUE", DEFAULT_QUEUE_PATH), help="작업 큐 DB 경로")
+    parser.add_argument("--worker-id", help="워커 식별자 (기본값: 호스트명:PID)")
+    parser.add_argument("--lease", type=float, default=300, help="작업 리스 유지 시간 (초, 기본값: 300)")
+    parser.add_argument("--poll", type=float, default=2.0, help="빈 큐 폴링 간격 (초)")
+    parser.add_argument("--max-jobs", type=int, help="처리할 최대 작업 수")
+    parser.add_argument("--exit-when-empty", action="store_true", help="큐가 비면 종료합니다.")
+    parser.add_argument("--no-wal", action="store_true", help="WAL 모드를 끕니다 (NFS 등 공유 스토리지용)")
+    parser.add_argument("--events", action="store_true", help="진행 이벤트를 JSON Lines로 stdout에 출력합니다 (다른 출력은 stderr).")
+    args = parser.parse_args(argv)
+
+    worker = QueueWorker(
+        JobQueue(args.queue, wal=not args.no_wal),
+        worker_id=args.worker_id,
+        lease_seconds=args.lease,
+        poll_interval=args.poll,
+        event_callback=ev.JsonLinesWriter(sys.stdout) if args.events else None
+    )
+    if args.events:
+        console.file = sys.stderr
+    try:
+        with contextlib.redirect_stdout(sys.stderr) if args.events else contextlib.nullcontext():
+            processed = worker.run(max_jobs=args.max_jobs, exit_when_empty=args.exit_when_empty)
+    except KeyboardInterrupt:
+        console.print("\n[dim]워커 종료 (진행 중이던 작업은 리스 만료 후 재대기열에 들어갑니다)[/dim]")
+        sys.exit(0)
+    console.print(f"[success]✨ 워커 종료: {processed}개 작업 처리[/success]")
+
+def submit_job(argv: List[str]):
+    """작업 큐에 변환 작업 등록 (nb2pptx submit)"""
+    from .jobqueue import JobQueue, DEFAULT_QUEUE_PATH
+
+    parser = argparse.ArgumentParser(prog="nb2pptx submit", description="변환 작업을 SQLite 작업 큐에 등록합니다.")
+    parser.add_argument("pdf_path", help="변환할 PDF 파일 경로")
+    parser.add_argument("--queue", default=os.environ.get("NB2PPTX_QUEUE", DEFAULT_QUEUE_PATH), help="작업 큐 DB 경로")
+    parser.add_argument("-o", "--output", help="출력 PPTX 파일 경로")
+    parser.add_argument("-p", "--provider", default="gemini", choices=PROVIDER_CHOICES)
+    parser.add_argument("-m", "--model", help="AI 모델명")
+    add_endpoint_args(parser)
+    parser.add_argument("-c", "--context", action="append", help="맥락 자료 파일. 여러 번 사용 가능.")
+    parser.add_argument("--dpi", type=int, default=144, help="PDF 변환 해상도")
+    parser.add_argument("--ppi", type=int, help="슬라이드 기준 해상도 (지정 시 DPI 대신 사용)")
+    parser.add_argument("--stream", action="store_true", help="완성된 슬라이드를 바로 PPTX에 기록합니다 (대용량 덱).")
+    parser.add_argument("--media-format", default="png", choices=["png", "png-optimized", "palette", "jpeg", "auto"], help="슬라이드 이미지 형식")
+    parser.add_argument("--native-text", action="store_true", help="PDF 텍스트를 편집 가능한 텍스트 상자로 복원합니다.")
+    parser.add_argument("--no-notes", action="store_true", help="AI 스피커 노트 생성을 건너뜁니다.")
+    parser.add_argument("--notes-max-length", type=int, help="노트 최대 글자수 (도달하면 생성 중단)")
+    parser.add_argument("--request-timeout", type=float, default=120, help="AI 요청 하나의 최대 대기 시간 (초)")
+    parser.add_argument("--deadline", type=float, help="작업 기한 (초, 실행 시작부터). 지나면 부분 결과로 저장")
+    parser.add_argument("--key-rpm", type=int, help="키 풀 사용 시 키별 분당 요청 한도 (키는 워커의 환경변수 {변수}S)")
+    parser.add_argument("--remove-watermark", action="store_true", help="NotebookLM 워터마크를 제거합니다.")
+    parser.add_argument("--text-mode", default="off", choices=["off", "assist", "text-only"], help="PDF 텍스트 레이어 활용 모드")
+    parser.add_argument("--route", action="store_true", help="슬라이드 복잡도에 따라 빠른/강한 모델로 분배합니다.")
+    parser.add_argument("--report", help="실행 리포트(JSON) 저장 경로")
+    parser.add_argument("--digest", action="store_true", help="맥락 자료 요약본을 모든 슬라이드에서 재사용합니다.")
+    parser.add_argument("--incremental", action="store_true", help="바뀐 슬라이드만 다시 처리합니다.")
+    parser.add_argument("--dedup", action="store_true", help="동일/유사 슬라이드의 이미지와 노트를 재사용합니다.")
+    parser.add_argument("--priority", type=int, default=0, help="우선순위 (클수록 먼저 처리)")
+    parser.add_argument("--max-attempts", type=int, default=3, help="최대 시도 횟수")
+    parser.add_argument("--shards", type=int, default=1, help="페이지를 N개 샤드 작업으로 나눠 등록합니다 (워커 여러 대가 나눠 처리, nb2pptx merge로 합치기).")
+    args = parser.parse_args(argv)
+
+    if not Path(args.pdf_path).exists():
+        console.print(f"[error]❌ 오류: 파일을 찾을 수 없습니다: {args.pdf_path}[/error]")
+        sys.exit(1)
+    if args.shards < 1:
+        console.print("[error]❌ 오류: --shards는 1 이상이어야 합니다.[/error]")
+        sys.exit(1)
+
+    queue = JobQueue(args.queue)
+    sharded = args.shards > 1
+    for index in range(1, args.shards + 1):
+        output = args.output
+        report = args.report
+        if sharded:
+            output = shard_path(output or Path(args.pdf_path).with_suffix(".pptx"), index, args.shards)
+            report = shard_path(report, index, args.shards) if report else None
+        job_id = _submit_one(queue, args, output, report, (index, args.shards) if sharded else None)
+        label = f" (샤드 {index}/{args.shards} → {output})" if sharded else ""
+        console.print(f"[success]📥 작업 등록 완료:[/success] {job_id}{label}")
+    if sharded:
+        merged = Path(args.output) if args.output else Path(args.pdf_path).with_suffix(".pptx")
+        console.print(f"[dim]모든 샤드가 끝나면: nb2pptx merge {shard_path(merged, '*', args.shards)} -o {merged}[/dim]")
+
+def _submit_one(queue, args, output, report, shard):
+    """submit 인자로 작업 하나 등록."""
+    return queue.submit(
+        args.pdf_path,
+        output_path=output,
+        provider=args.provider,
+        model=args.model,
+        dpi=args.dpi,
+        context_paths=args.context,
+        options={
+            "generate_notes": not args.no_notes,
+            "remove_watermark": args.remove_watermark,
+            "text_mode": args.text_mode,
+            "routing": args.route,
+            "context_digest": args.digest,
+            "incremental": args.incremental,
+            "dedup": args.dedup,
+            "slide_ppi": args.ppi,
+            "streaming": args.stream,
+            "media_format": args.media_format,
+            "native_text": args.native_text,
+            "notes_max_length": args.notes_max_length,
+            "request_timeout": args.request_timeout,
+            "deadline": args.deadline,
+            "key_rpm": args.key_rpm,
+            "provider_options": provider_options(args),
+            "report_path": str(Path(report).absolute()) if report else None,
+            "shard": shard,
+        },
+        priority=args.priority,
+        max_attempts=args.max_attempts
+    )
+
+def show_jobs(argv: List[str]):
+    """작업 큐 상태 조회 (nb2pptx jobs)"""
+    from rich.table import Table
+    from .jobqueue import JobQueue, DEFAULT_QUEUE_PATH
+
+    parser = argparse.ArgumentParser(prog="nb2pptx jobs", description="작업 큐 상태를 조회합니다.")
+    parser.add_argument("job_id", nargs="?", help="상세 조회할 작업 ID")
+    parser.add_argument("--queue", default=os.environ.get("NB2PPTX_QUEUE", DEFAULT_QUEUE_PATH), help="작업 큐 DB 경로")
+    parser.add_argument("--status", help="상태 필터 (queued, running, done, failed, cancelled)")
+    parser.add_argument("--cancel", action="store_true", help="대기 중인 작업을 취소합니다.")
+    args = parser.parse_args(argv)
+
+    queue = JobQueue(args.queue)
+
+    if args.job_id:
+        if args.cancel:
+            ok = queue.cancel(args.job_id)
+            console.print("[success]취소되었습니다.[/success]" if ok else "[warning]대기 중인 작업이 아닙니다.[/warning]")
+            return
+        job = queue.get(args.job_id)
+        if job is None:
+            console.print(f"[error]❌ 작업을 찾을 수 없습니다: {args.job_id}[/error]")
+            sys.exit(1)
+        console.print(Panel(
+            "\n".join(f"[bold]{k}:[/bold] {v}" for k, v in job.items()),
+            title=f"Job {job['id']}",
+            border_style="cyan"
+        ))
+        slides = queue.slide_progress(args.job_id)
+        if slides:
+            console.print(" ".join(
+                f"[{'green' if s['status'] == 'done' else 'yellow'}]{s['slide_num']}[/]" for s in slides
+            ))
+        return
+
+    table = Table(title=f"작업 큐: {args.queue}")
+    for col in ("ID", "상태", "PDF", "프로바이더", "진행", "시도", "워커"):
+        table.add_column(col)
+    for job in queue.list_jobs(status=args.status):
+        table.add_row(
+            job['id'][:12],
+            job['status'],
+            Path(job['pdf_path']).name,
+            f"{job['provider']} ({job['model'] or '기본'})",
+            f"{job['progress_current']}/{job['progress_total']}",
+            f"{job['attempts']}/{job['max_attempts']}",
+            job['worker_id'] or "-"
+        )
+    console.print(table)
+
+def _renote_command(argv: List[str], only_missing: bool):
+    """기존 PPTX 노트 생성 공통 처리 (repair / renote)"""
+    name = "repair" if only_missing else "renote"
+    description = (
+        "기존 PPTX에서 노트가 비어 있는 슬라이드만 다시 생성합니다."
+        if only_missing else
+        "기존 PPTX의 슬라이드 이미지로 모든 노트를 다시 생성합니다 (PDF/Poppler 불필요)."
+    )
+    parser = argparse.ArgumentParser(prog=f"nb2pptx {name}", description=description)
+    parser.add_argument("pptx_path", help="대상 PPTX 파일 경로")
+    parser.add_argument("-o", "--output", help="저장 경로 (기본값: 제자리 저장)")
+    parser.add_argument("-p", "--provider", default="gemini", choices=PROVIDER_CHOICES)
+    parser.add_argument("-m", "--model", help="AI 모델명")
+    add_endpoint_args(parser)
+    parser.add_argument("-k", "--api-key", action="append", help="API 키 (여러 번 지정하면 키 풀로 분산)")
+    parser.add_argument("--key-rpm", type=int, help="키별 분당 요청 한도")
+    parser.add_argument("-c", "--context", action="append", help="맥락 자료 파일. 여러 번 사용 가능.")
+    parser.add_argument("-j", "--workers", type=int, default=4, help="병렬 AI 요청 수 (기본값: 4)")
+    parser.add_argument("--report", help="실행 리포트(JSON) 저장 경로")
+    args = parser.parse_args(argv)
+
+    pptx_path = Path(args.pptx_path)
+    if not pptx_path.exists():
+        console.print(f"[error]❌ 오류: 파일을 찾을 수 없습니다: {pptx_path}[/error]")
+        sys.exit(1)
+
+    try:
+        converter = NotebookLMToPPTX(
+            provider=args.provider,
+            api_key=args.api_key,
+            model=args.model,
+            max_workers=args.workers,
+            key_rpm=args.key_rpm,
+            provider_options=provider_options(args)
+        )
+        output_path = converter.renote_pptx(
+            pptx_path,
+            output_path=args.output,
+            context_paths=args.context,
+            only_missing=only_missing
+        )
+        if args.report and converter.last_report:
+            converter.last_report.save(args.report)
+    except Exception as e:
+        console.print(f"[error]❌ 노트 생성 중 오류 발생:[/error] {str(e)}")
+        sys.exit(1)
+
+    console.print(Panel(
+        f"[success]{'🩹 노트 복구 완료!' if only_missing else '📝 노트 재생성 완료!'}[/success]\n\n"
+        f"[bold]📂 저장 위치:[/bold] {output_path}",
+        title=name.capitalize(),
+        border_style="green"
+    ))
+
+def repair_deck(argv: List[str]):
+    """노트가 비어 있는 슬라이드만 다시 생성 (nb2pptx repair)"""
+    _renote_command(argv, only_missing=True)
+
+def renote_deck(argv: List[str]):
+    """기존 PPTX의 노트를 모두 다시 생성 (nb2pptx renote)"""
+    _renote_command(argv, only_missing=False)
+
+# 서브커맨드 (nb2pptx <command> ...)
+def watch_folder(argv: List[str]):
+    """감시 폴더의 새 PDF를 자동 변환 (nb2pptx watch)"""
+    from .watcher import FolderWatcher
+
+    parser = argparse.ArgumentParser(prog="nb2pptx watch", description="폴더에 들어오는 PDF를 미리 준비한 컨버터로 바로 변환합니다.")
+    parser.add_argument("watch_dir", help="감시할 폴더")
+    parser.add_argument("-o", "--output-dir", help="PPTX와 실행 리포트를 저장할 폴더 (기본값: 감시 폴더)")
+    parser.add_argument("-p", "--provider", default="gemini", choices=PROVIDER_CHOICES)
+    parser.add_argument("-m", "--model", help="AI 모델명")
+    add_endpoint_args(parser)
+    parser.add_argument("-k", "--api-key", action="append", help="API 키 (여러 번 지정하면 키 풀로 분산)")
+    parser.add_argument("-c", "--context", action="append", help="모든 덱에 쓸 맥락 자료 파일. 여러 번 사용 가능.")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="동시에 변환할 파일 수 (미리 준비할 컨버터 수, 기본값: 1)")
+    parser.add_argument("--poll", type=float, default=2.0, help="폴더 재스캔 간격 (초, 기본값: 2)")
+    parser.add_argument("--settle", type=float, default=1.0, help="파일이 이 시간 동안 그대로면 다 써진 것으로 판단 (초, 기본값: 1)")
+    parser.add_argument("--recursive", action="store_true", help="하위 폴더까지 감시합니다 (출력은 같은 폴더 구조로 저장).")
+    parser.add_argument("--polling-only", action="store_true", help="파일 시스템 알림 없이 폴링만 사용합니다 (알림이 없는 네트워크 폴더용).")
+    parser.add_argument("--once", action="store_true", help="지금 있는 파일만 변환하고 종료합니다.")
+    parser.add_argument("--dpi", type=int, default=144, help="PDF 변환 해상도")
+    parser.add_argument("--ppi", type=int, help="슬라이드 기준 해상도 (지정 시 DPI 대신 사용)")
+    parser.add_argument("--stream", action="store_true", help="완성된 슬라이드를 바로 PPTX에 기록합니다 (대용량 덱).")
+    parser.add_argument("--media-format", default="png", choices=["png", "png-optimized", "palette", "jpeg", "auto"], help="슬라이드 이미지 형식")
+    parser.add_argument("--no-notes", action="store_true", help="AI 스피커 노트 생성을 건너뜁니다.")
+    parser.add_argument("--notes-max-length", type=int, help="노트 최대 글자수 (도달하면 생성 중단)")
+    parser.add_argument("--remove-watermark", action="store_true", help="NotebookLM 워터마크를 제거합니다.")
+    parser.add_argument("--digest", action="store_true", help="맥락 자료 요약본을 모든 슬라이드에서 재사용합니다.")
+    parser.add_argument("--render-cache", action="store_true", help="렌더링한 페이지를 캐시합니다 (같은 PDF를 다시 내보낼 때 렌더링 생략).")
+    args = parser.parse_args(argv)
+
+    try:
+        watcher = FolderWatcher(
+            args.watch_dir,
+            output_dir=args.output_dir,
+            converter_options={
+                "provider": args.provider,
+                "api_key": args.api_key,
+                "model": args.model,
+                "dpi": args.dpi,
+                "slide_ppi": args.ppi,
+                "streaming": args.stream,
+                "media_format": args.media_format,
+                "notes_max_length": args.notes_max_length,
+                "remove_watermark": args.remove_watermark,
+                "context_digest": args.digest,
+                "page_cache": PageCache() if args.render_cache else None,
+                "provider_options": provider_options(args),
+            },
+            convert_options={
+                "context_paths": args.context,
+                "generate_notes": not args.no_notes,
+            },
+            workers=args.workers,
+            poll_interval=args.poll,
+            settle_seconds=args.settle,
+            recursive=args.recursive,
+            notifications=not args.polling_only
+        )
+    except (NotADirectoryError, ValueError, ImportError) as e:
+        console.print(f"[error]❌ 오류:[/error] {e}")
+        sys.exit(1)
+
+    try:
+        processed = watcher.run(once=args.once)
+        console.print(f"[success]처리한 파일: {processed}개[/success]")
+    except KeyboardInterrupt:
+        # run()이 진행 중이던 변환을 마친 뒤 돌아옴
+        console.print(f"\n[dim]감시 종료 (처리한 파일: {watcher.processed}개)[/dim]")
+
+def merge_shards(argv: List[str]):
+    """샤드 PPTX를 하나의 덱으로 합치기 (nb2pptx merge)"""
+    from .sharding import merge_shards as merge
+
+    parser = argparse.ArgumentParser(prog="nb2pptx merge", description="--shard로 나눠 변환한 PPTX를 페이지 순서대로 합칩니다 (이미지 재인코딩 없음).")
+    parser.add_argument("shards", nargs="+", help="샤드 PPTX 파일 (순서 무관)")
+    parser.add_argument("-o", "--output", required=True, help="합친 PPTX 파일 경로")
+    parser.add_argument("--in-memory", action="store_true", help="python-pptx로 메모리에서 합친 뒤 저장합니다 (기본값: 슬라이드를 바로 기록).")
+    parser.add_argument("--allow-missing", action="store_true", help="빠진 샤드가 있어도 있는 샤드만 합칩니다.")
+    args = parser.parse_args(argv)
+
+    for path in args.shards:
+        if not Path(path).exists():
+            console.print(f"[error]❌ 오류: 파일을 찾을 수 없습니다: {path}[/error]")
+            sys.exit(1)
+
+    try:
+        output_path = merge(
+            args.shards,
+            args.output,
+            streaming=not args.in_memory,
+            allow_missing=args.allow_missing
+        )
+    except ValueError as e:
+        console.print(f"[error]❌ 오류:[/error] {e}")
+        sys.exit(1)
+    console.print(f"[success]✨ 합치기 완료:[/success] {output_path}")
+
+SUBCOMMANDS = {
+    "worker": run_worker,
+    "submit": submit_job,
+    "jobs": show_jobs,
+    "repair": repair_deck,
+    "renote": renote_deck,
+    "watch": watch_folder,
+    "merge": merge_shards,
+}
+
 def main():
     # .env 파일 로드
     load_dotenv()
+
+    # 서브커맨드 실행
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        SUBCOMMANDS[sys.argv[1]](sys.argv[2:])
+        return
     
     args = parse_args()
+
+    # 이벤트 모드: stdout은 JSON Lines 전용
+    if args.events:
+        console.file = sys.stderr
     
     # 업데이트 명령 실행
     if hasattr(args, 'update') and args.update:
@@ -200,6 +762,10 @@ def main():
     # 입력 파일 확인 (업데이트/UI 모드가 아닐 때만 필수)
     if not args.pdf_path:
         console.print("[warning]사용법: nb2pptx [PDF파일경로] 또는 nb2pptx --ui / --update[/warning]")
+        console.print("[dim]작업 큐: nb2pptx submit [PDF] / nb2pptx worker / nb2pptx jobs[/dim]")
+        console.print("[dim]노트 복구/재생성: nb2pptx repair [PPTX] / nb2pptx renote [PPTX][/dim]")
+        console.print("[dim]폴더 자동 변환: nb2pptx watch [폴더] -o [출력 폴더][/dim]")
+        console.print("[dim]나눠 변환/합치기: nb2pptx [PDF] --shard 1/4 / nb2pptx merge [샤드 PPTX...] -o [PPTX][/dim]")
         console.print("자세한 도움말은 [bold]nb2pptx --help[/bold]를 참고하세요.")
         sys.exit(0)
 
@@ -215,8 +781,67 @@ def main():
             api_key=args.api_key,
             model=args.model,
             dpi=args.dpi,
-            remove_watermark=args.remove_watermark
+            remove_watermark=args.remove_watermark,
+            text_mode=args.text_mode,
+            text_only_min_coverage=args.text_only_coverage,
+            routing=args.route,
+            routing_threshold=args.route_threshold,
+            simple_model=args.simple_model,
+            complex_model=args.complex_model,
+            context_digest=args.digest,
+            digest_max_chars=args.digest_max_chars,
+            context_max_file_mb=args.context_max_file_mb,
+            context_max_total_mb=args.context_max_total_mb,
+            context_cache=not args.no_context_cache,
+            dedup=args.dedup,
+            dedup_threshold=args.dedup_threshold,
+            slide_ppi=args.ppi,
+            streaming=args.stream,
+            media_format=args.media_format,
+            jpeg_quality=args.jpeg_quality,
+            native_text=args.native_text,
+            page_cache=PageCache() if args.render_cache else None,
+            notes_max_length=args.notes_max_length,
+            request_timeout=args.request_timeout,
+            key_rpm=args.key_rpm,
+            provider_options=provider_options(args),
+            event_callback=ev.JsonLinesWriter(sys.stdout) if args.events else None
         )
+
+        if args.plan:
+            # --events이면 stdout은 JSON Lines 전용이므로 예측 출력은 stderr로
+            with contextlib.redirect_stdout(sys.stderr) if args.events else contextlib.nullcontext():
+                plan = converter.plan(
+                    pdf_path,
+                    context_paths=args.context,
+                    generate_notes=not args.no_notes,
+                    concurrency=args.concurrency,
+                    shard=args.shard
+                )
+                print()
+                plan.print_summary()
+                if args.report:
+                    with open(args.report, "w", encoding="utf-8") as f:
+                        json.dump(plan.to_dict(), f, ensure_ascii=False, indent=2)
+                    console.print(f"[dim]예측 결과 저장: {args.report}[/dim]")
+            return
+
+        cancel_token = CancellationToken(timeout=args.deadline) if args.deadline else None
+
+        if args.events:
+            with contextlib.redirect_stdout(sys.stderr):
+                output_path = converter.convert(
+                    pdf_path,
+                    output_path=args.output,
+                    context_paths=args.context,
+                    generate_notes=not args.no_notes,
+                    report_path=args.report,
+                    incremental=args.incremental,
+                    cancel_token=cancel_token,
+                    shard=args.shard
+                )
+            console.print(f"[success]✨ 변환 완료:[/success] {output_path}")
+            return
         
         # 진행률 표시 변수
         progress_bar = Progress(
@@ -230,10 +855,29 @@ def main():
         
         task_id = progress_bar.add_task("준비 중...", total=100)
         
+        stats = {"done": 0, "tokens": 0}
+
         def update_progress(current, total):
             description = f"슬라이드 변환 중... ({current}/{total})"
-            percentage = (current / total) * 100
-            progress_bar.update(task_id, description=description, completed=percentage)
+            if stats["tokens"]:
+                description += f" · {stats['tokens']:,} 토큰"
+            progress_bar.update(task_id, description=description)
+
+        def on_event(event):
+            if event.type == ev.STAGE_STARTED and event.stage in STAGE_LABELS:
+                progress_bar.update(task_id, description=STAGE_LABELS[event.stage])
+            elif event.type == ev.SLIDE_COMPLETED:
+                stats["done"] += 1
+                progress_bar.update(task_id, completed=stats["done"] / event.data["total"] * 100)
+            elif event.type == ev.TOKENS_USED:
+                stats["tokens"] += event.data["input_tokens"] + event.data["output_tokens"]
+
+        converter.events.subscribe(on_event)
+
+        def show_notes(slide_num, chunk, notes):
+            # 생성 중인 노트의 마지막 부분을 진행률 줄에 실시간 표시
+            tail = " ".join(notes.split())[-40:]
+            progress_bar.update(task_id, description=f"슬라이드 {slide_num} 노트 작성 중... [dim]{escape(tail)}[/dim]")
 
         # 변환 시작
         with progress_bar:
@@ -242,7 +886,12 @@ def main():
                 output_path=args.output,
                 context_paths=args.context,
                 generate_notes=not args.no_notes,
-                progress_callback=update_progress
+                progress_callback=update_progress,
+                report_path=args.report,
+                incremental=args.incremental,
+                notes_callback=None if args.no_notes else show_notes,
+                cancel_token=cancel_token,
+                shard=args.shard
             )
             
         console.print()
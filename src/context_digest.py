@@ -0,0 +1,162 @@
+"""
+Context Digest
+대용량 맥락 자료를 한 번만 요약(map-reduce)해 모든 슬라이드 프롬프트에서 재사용
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from .ai_providers import AIProvider
+from .cache import get_cache_dir, text_sha256
+
+
+class ContextDigester:
+    """
+    맥락 자료 요약기.
+
+    1. map: 맥락 텍스트를 청크로 나눠 병렬로 요약
+    2. reduce: 요약들을 합치고, max_chars를 넘으면 묶어서 다시 요약
+    결과는 맥락 파일 해시 기준으로 디스크에 캐시됩니다.
+    """
+
+    MAP_PROMPT = """다음은 발표 자료의 참고 자료 일부입니다. 발표자 노트 작성에 도움이 되도록
+핵심 개념, 정의, 수치, 사례, 인용할 만한 문장을 빠짐없이 간결하게 정리해주세요.
+- 원문의 언어를 유지
+- 최대 {limit}자
+- 서론/맺음말 없이 bullet point로만 작성
+
+---
+{chunk}
+---"""
+
+    REDUCE_PROMPT = """다음은 같은 참고 자료를 부분별로 요약한 내용입니다.
+중복을 제거하고 하나의 요약으로 통합해주세요.
+- 핵심 개념, 수치, 사례는 유지
+- 최대 {limit}자
+- bullet point로만 작성
+
+---
+{chunk}
+---"""
+
+    def __init__(
+        self,
+        provider: AIProvider,
+        max_chars: int = 8000,
+        chunk_chars: int = 12000,
+        max_workers: int = 4,
+        max_rounds: int = 4,
+        generate: Optional[Callable[[str], str]] = None
+    ):
+        """
+        요약기 초기화.
+
+        Args:
+            provider: 요약에 사용할 AI 프로바이더 (generate_text 사용)
+            max_chars: 최종 요약 최대 길이 (문자)
+            chunk_chars: map 단계 청크 크기 (문자)
+            max_workers: map/reduce 병렬 요청 수
+            max_rounds: reduce 최대 반복 횟수
+            generate: 프롬프트 → 요약 텍스트 요청 함수 (None이면 provider.generate_text)
+        """
+        self.provider = provider
+        self.generate = generate or provider.generate_text
+        self.max_chars = max_chars
+        self.chunk_chars = chunk_chars
+        self.max_workers = max_workers
+        self.max_rounds = max_rounds
+
+    def _split(self, text: str, size: int) -> List[str]:
+        """문단 경계를 최대한 지키며 size 이하 청크로 분할."""
+        chunks = []
+        current = []
+        current_len = 0
+
+        for para in text.split('\n\n'):
+            while len(para) > size:
+                if current:
+                    chunks.append('\n\n'.join(current))
+                    current, current_len = [], 0
+                chunks.append(para[:size])
+                para = para[size:]
+
+            if current_len + len(para) + 2 > size and current:
+                chunks.append('\n\n'.join(current))
+                current, current_len = [], 0
+
+            current.append(para)
+            current_len += len(para) + 2
+
+        if current:
+            chunks.append('\n\n'.join(current))
+
+        return [c for c in chunks if c.strip()]
+
+    def _summarize_all(self, template: str, chunks: List[str], limit: int) -> List[str]:
+        """청크들을 병렬로 요약."""
+        prompts = [template.format(limit=limit, chunk=c) for c in chunks]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.generate, prompts))
+
+    def digest(self, context: str) -> str:
+        """
+        맥락 텍스트를 max_chars 이하로 요약.
+
+        Args:
+            context: 원본 맥락 텍스트
+
+        Returns:
+            요약 텍스트 (원본이 충분히 짧으면 원본 그대로)
+        """
+        if len(context) <= self.max_chars:
+            return context
+
+        chunks = self._split(context, self.chunk_chars)
+        # 청크 요약들을 합쳤을 때 max_chars 근처가 되도록 청크별 한도를 배분
+        per_chunk = max(500, self.max_chars // len(chunks))
+        print(f"  🗜️ 맥락 요약 (map): {len(chunks)}개 청크")
+        summaries = self._summarize_all(self.MAP_PROMPT, chunks, per_chunk)
+        combined = '\n\n'.join(summaries)
+
+        rounds = 0
+        while len(combined) > self.max_chars and rounds < self.max_rounds:
+            rounds += 1
+            groups = self._split(combined, self.chunk_chars)
+            per_group = max(500, self.max_chars // len(groups))
+            print(f"  🗜️ 맥락 요약 (reduce {rounds}): {len(groups)}개 묶음")
+            combined = '\n\n'.join(self._summarize_all(self.REDUCE_PROMPT, groups, per_group))
+
+        # 모델이 한도를 지키지 않은 경우 크기 상한 보장
+        return combined[:self.max_chars]
+
+    def cache_key(self, file_hashes: List[str]) -> str:
+        """맥락 파일 해시와 요약 설정으로 캐시 키 생성."""
+        return text_sha256(
+            *file_hashes,
+            str(self.max_chars),
+            str(self.chunk_chars),
+            self.provider.model
+        )
+
+    def cached_digest(self, context: str, file_hashes: List[str]) -> str:
+        """
+        디스크 캐시를 사용하는 digest.
+
+        Args:
+            context: 원본 맥락 텍스트
+            file_hashes: 맥락 파일 내용 해시 리스트
+
+        Returns:
+            요약 텍스트
+        """
+        cache_path = get_cache_dir('digest') / f"{self.cache_key(file_hashes)}.txt"
+        if cache_path.exists():
+            cached = cache_path.read_text(encoding='utf-8')
+            print(f"  ♻️ 캐시된 맥락 요약 사용 ({len(cached)} 문자)")
+            return cached
+
+        digest = self.digest(context)
+        tmp_path = cache_path.with_suffix('.tmp')
+        tmp_path.write_text(digest, encoding='utf-8')
+        tmp_path.replace(cache_path)
+        return digest
@@ -0,0 +1,215 @@
+"""
+Context Materials Loader
+맥락 자료 텍스트 추출 (내용 해시 기반 디스크 캐시, 크기 제한)
+"""
+
+import codecs
+import hashlib
+import uuid
+from pathlib import Path
+from typing import Optional, Union, List, Tuple
+
+from .cache import get_cache_dir, file_sha256, text_sha256, HASH_CHUNK_SIZE
+
+
+class ContextLoader:
+    """
+    맥락 자료 로더.
+
+    - 파일 크기 제한(max_file_size_mb, max_total_size_mb)을 적용합니다.
+    - 추출한 텍스트는 파일 내용 해시로 캐시하고, (경로, 크기, mtime) 인덱스로
+      변경되지 않은 파일은 해시 계산도 건너뜁니다.
+    - PyMuPDF는 스레드 안전하지 않으므로 PDF는 한 번에 하나씩 순서대로 추출합니다.
+    """
+
+    SUPPORTED_FORMATS = ('.txt', '.md', '.pdf')
+
+    def __init__(
+        self,
+        max_file_size_mb: float = 10,
+        max_total_size_mb: float = 50,
+        use_cache: bool = True
+    ):
+        """
+        로더 초기화.
+
+        Args:
+            max_file_size_mb: 단일 파일 최대 크기 (MB)
+            max_total_size_mb: 전체 파일 최대 크기 (MB)
+            use_cache: 디스크 캐시 사용 여부
+        """
+        self.max_file_size = int(max_file_size_mb * 1024 * 1024)
+        self.max_total_size = int(max_total_size_mb * 1024 * 1024)
+        self.use_cache = use_cache
+        self._cache_dir = get_cache_dir('context') if use_cache else None
+
+    def _index_path(self, path: Path) -> Optional[Path]:
+        """(절대 경로, 크기, mtime) → 내용 해시 인덱스 파일 경로."""
+        if self._cache_dir is None:
+            return None
+        stat = path.stat()
+        key = text_sha256(str(path.absolute()), str(stat.st_size), str(stat.st_mtime_ns))
+        return self._cache_dir / f"idx-{key}"
+
+    def _text_cache_path(self, content_hash: str) -> Optional[Path]:
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / f"{content_hash}.txt"
+
+    def _store(self, path: Path, content_hash: str, text: str):
+        """추출 텍스트와 인덱스를 캐시에 기록 (원자적 교체)."""
+        if self._cache_dir is None:
+            return
+        for target, data in (
+            (self._text_cache_path(content_hash), text),
+            (self._index_path(path), content_hash),
+        ):
+            tmp = target.with_name(f"{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+            tmp.write_text(data, encoding='utf-8')
+            tmp.replace(target)
+
+    def hash_file(self, path: Union[str, Path]) -> str:
+        """
+        파일 내용 해시 (mtime 인덱스가 있으면 재계산 생략).
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            SHA-256 해시
+        """
+        path = Path(path)
+        index = self._index_path(path)
+        if index is not None and index.exists():
+            return index.read_text(encoding='utf-8')
+        return file_sha256(path)
+
+    def _lookup(self, path: Path) -> Optional[str]:
+        """mtime 인덱스 → 내용 해시 → 캐시된 텍스트 조회."""
+        index = self._index_path(path)
+        if index is None or not index.exists():
+            return None
+        cached = self._text_cache_path(index.read_text(encoding='utf-8'))
+        if cached.exists():
+            return cached.read_text(encoding='utf-8')
+        return None
+
+    def _read_text_file(self, path: Path) -> Tuple[str, str]:
+        """텍스트 파일을 청크 단위로 읽으며 해시 계산과 디코딩을 한 번에 수행."""
+        digest = hashlib.sha256()
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        parts = []
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b'', final=True))
+        return digest.hexdigest(), ''.join(parts)
+
+    def _read_pdf(self, path: Path) -> str:
+        """PDF 텍스트 추출 (문서를 한 번 열어 페이지 순서대로)."""
+        import fitz  # PyMuPDF
+
+        with fitz.open(str(path)) as doc:
+            return '\n'.join(page.get_text() for page in doc)
+
+    def extract(self, path: Union[str, Path]) -> Optional[str]:
+        """
+        파일 하나의 텍스트 추출 (캐시 우선).
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            추출 텍스트 (실패 시 None)
+        """
+        path = Path(path)
+        cached = self._lookup(path)
+        if cached is not None:
+            return cached
+
+        suffix = path.suffix.lower()
+        try:
+            if suffix in ['.txt', '.md']:
+                content_hash, text = self._read_text_file(path)
+            else:
+                content_hash = file_sha256(path)
+                cache_path = self._text_cache_path(content_hash)
+                if cache_path is not None and cache_path.exists():
+                    # 같은 내용의 파일이 다른 경로/mtime으로 캐시된 경우
+                    text = cache_path.read_text(encoding='utf-8')
+                else:
+                    text = self._read_pdf(path)
+        except ImportError:
+            print(f"⚠️ PDF 텍스트 추출을 위해 PyMuPDF가 필요합니다: pip install pymupdf")
+            return None
+        except Exception as e:
+            print(f"⚠️ 파일 읽기 실패 ({path}): {e}")
+            return None
+
+        self._store(path, content_hash, text)
+        return text
+
+    def select(self, paths: Union[str, Path, List[Union[str, Path]]]) -> List[Path]:
+        """
+        존재 여부, 형식, 크기 제한을 통과한 파일만 선택.
+
+        Args:
+            paths: 파일 경로 또는 경로 리스트
+
+        Returns:
+            처리할 파일 경로 리스트 (입력 순서 유지)
+        """
+        if isinstance(paths, (str, Path)):
+            paths = [paths]
+
+        selected = []
+        total = 0
+
+        for path in map(Path, paths):
+            if not path.exists():
+                print(f"⚠️ 파일을 찾을 수 없음: {path}")
+                continue
+
+            suffix = path.suffix.lower()
+            if suffix not in self.SUPPORTED_FORMATS:
+                print(f"⚠️ 지원하지 않는 파일 형식: {suffix}")
+                continue
+
+            size = path.stat().st_size
+            if size > self.max_file_size:
+                print(f"⚠️ 파일 크기 제한 초과로 건너뜀 ({path.name}: "
+                      f"{size / 1024 / 1024:.1f}MB > {self.max_file_size / 1024 / 1024:.0f}MB)")
+                continue
+
+            if total + size > self.max_total_size:
+                print(f"⚠️ 전체 크기 제한 초과로 건너뜀 ({path.name}, "
+                      f"한도 {self.max_total_size / 1024 / 1024:.0f}MB)")
+                continue
+
+            total += size
+            selected.append(path)
+
+        return selected
+
+    def load(self, paths: Union[str, Path, List[Union[str, Path]]]) -> str:
+        """
+        맥락 자료 로드.
+
+        Args:
+            paths: 파일 경로 또는 경로 리스트 (.txt, .md, .pdf 지원)
+
+        Returns:
+            결합된 맥락 텍스트
+        """
+        selected = self.select(paths)
+        if not selected:
+            return ''
+
+        texts = [self.extract(path) for path in selected]
+
+        return '\n\n'.join(
+            f"--- {path.name} ---\n{text}"
+            for path, text in zip(selected, texts)
+            if text is not None
+        )
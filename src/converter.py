@@ -3,16 +3,29 @@ NotebookLM PDF to PPTX Converter
 Main converter class with AI-powered speaker notes generation
 """
 
+import functools
+import io
 import os
+import time
 import shutil
+import tempfile
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Dict, Any, Iterable, Iterator, Tuple
 from PIL import Image
 
 try:
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
 except ImportError:
     convert_from_path = None
+    pdfinfo_from_path = None
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
 
 try:
     from pptx import Presentation
@@ -26,8 +39,27 @@ from .ai_providers import (
     GeminiProvider,
     OpenAIProvider,
     AnthropicProvider,
-    GrokProvider
+    GrokProvider,
+    OpenAICompatibleProvider
 )
+from .routing import SlideRouter
+from .report import RunReport
+from .context_digest import ContextDigester
+from .context_loader import ContextLoader
+from . import incremental as incr
+from .pptx_utils import slide_picture_blob, slide_notes_text, save_atomic
+from .pptx_writer import PresentationWriter, StreamingPptxWriter, PARTIAL_STATUS
+from .dedup import DuplicateDetector
+from .media import MEDIA_FORMATS, encode_image
+from .native_text import iter_native_pages
+from .page_cache import PageCache
+from .cache import file_sha256
+from . import events as ev
+from . import planner
+from .planner import ConversionPlan
+from .cancellation import CancellationToken, ConversionCancelled, DeadlineExceeded
+from .key_pool import KeyPool, split_keys
+from .sharding import ShardInfo, shard_pages, shard_path
 
 
 class NotebookLMToPPTX:
@@ -53,30 +85,138 @@ class NotebookLMToPPTX:
         'claude': AnthropicProvider,  # alias
         'grok': GrokProvider,
         'xai': GrokProvider,  # alias
+        'openai-compatible': OpenAICompatibleProvider,  # vLLM, llama.cpp, Ollama 등 자체 서버
+        'local': OpenAICompatibleProvider,  # alias
     }
 
+    # 텍스트 레이어 활용 모드
+    # - off: 이미지만 전송 (기존 방식)
+    # - assist: 이미지 + 추출 텍스트를 함께 전송 (작은 모델로도 정확한 노트)
+    # - text-only: 텍스트 비중이 높은 슬라이드는 이미지 없이 텍스트만 전송
+    TEXT_MODES = ('off', 'assist', 'text-only')
+
     def __init__(
         self,
         provider: str = 'gemini',
-        api_key: Optional[str] = None,
+        api_key: Optional[Union[str, List[str]]] = None,
         model: Optional[str] = None,
         dpi: int = 144,
-        remove_watermark: bool = False
+        remove_watermark: bool = False,
+        text_mode: str = 'off',
+        text_only_min_coverage: float = 0.9,
+        routing: bool = False,
+        routing_threshold: float = 0.45,
+        simple_model: Optional[str] = None,
+        complex_model: Optional[str] = None,
+        context_digest: bool = False,
+        digest_max_chars: int = 8000,
+        context_max_file_mb: float = 10,
+        context_max_total_mb: float = 50,
+        context_cache: bool = True,
+        max_workers: int = 4,
+        dedup: bool = False,
+        dedup_threshold: int = 6,
+        slide_ppi: Optional[int] = None,
+        streaming: bool = False,
+        media_format: str = 'png',
+        jpeg_quality: int = 85,
+        native_text: bool = False,
+        page_cache: Optional[PageCache] = None,
+        notes_max_length: Optional[int] = None,
+        event_callback: Optional[callable] = None,
+        request_timeout: Optional[float] = 120,
+        key_rpm: Optional[int] = None,
+        key_pool: Optional[KeyPool] = None,
+        provider_options: Optional[Dict[str, Any]] = None
     ):
         """
         컨버터 초기화.
 
         Args:
-            provider: AI 프로바이더 이름 ('gemini', 'openai', 'anthropic', 'grok')
-            api_key: API 키 (환경변수에서 자동 로드 가능)
+            provider: AI 프로바이더 이름 ('gemini', 'openai', 'anthropic', 'grok', 'openai-compatible')
+            api_key: API 키 (환경변수에서 자동 로드 가능). 여러 개(리스트 또는 쉼표 구분)를 주면
+                키 풀로 요청을 분산하고, 속도 제한/인증 오류가 난 키를 피해 다른 키로 재시도
             model: 사용할 모델명 (None이면 기본값 사용)
             dpi: PDF 렌더링 해상도 (기본: 144 DPI)
             remove_watermark: 우측 하단 워터마크 제거 여부
+            text_mode: PDF 텍스트 레이어 활용 모드 ('off', 'assist', 'text-only')
+            text_only_min_coverage: text-only 모드에서 이미지 없이 보낼 최소 텍스트 비중 (0~1)
+            routing: 슬라이드 복잡도에 따라 빠른/강한 모델로 분배할지 여부
+            routing_threshold: 강한 모델로 보낼 최소 복잡도 점수 (0~1)
+            simple_model: 단순 슬라이드용 모델 (None이면 프로바이더의 FAST_MODEL)
+            complex_model: 복잡한 슬라이드용 모델 (None이면 model 또는 STRONG_MODEL)
+            context_digest: 맥락 자료를 한 번 요약해 모든 슬라이드에서 재사용할지 여부
+            digest_max_chars: 맥락 요약 최대 길이 (문자)
+            context_max_file_mb: 맥락 자료 단일 파일 최대 크기 (MB)
+            context_max_total_mb: 맥락 자료 전체 최대 크기 (MB)
+            context_cache: 맥락 자료 추출 결과 디스크 캐시 사용 여부
+            max_workers: 노트 복구 등 병렬 AI 요청 수
+            dedup: 동일/유사 슬라이드의 이미지와 노트를 재사용할지 여부
+            dedup_threshold: 유사 슬라이드로 볼 최대 지각 해시 거리 (0~64)
+            slide_ppi: 슬라이드 기준 해상도 (픽셀/인치). 지정하면 dpi 대신
+                16:9 슬라이드 크기 × slide_ppi 픽셀로 바로 렌더링 (예: 144 → 1920×1080)
+            streaming: 페이지를 구간 단위로 렌더링하고 완성된 슬라이드를 바로 PPTX에 기록
+                (메모리 사용량이 덱 크기와 무관, 대용량 덱용)
+            media_format: 슬라이드 이미지 형식
+                ('png', 'png-optimized', 'palette', 'jpeg', 'auto': 사진형은 JPEG, 나머지는 팔레트 PNG)
+            jpeg_quality: JPEG 품질 (1~95)
+            native_text: PDF 텍스트를 편집 가능한 텍스트 상자로 복원하고
+                배경은 텍스트를 지운 이미지로 렌더링 (PyMuPDF 필요, Poppler 불필요)
+            page_cache: 렌더링한 페이지를 (PDF 내용 해시, 해상도) 기준으로 재사용할 캐시
+                (같은 덱을 설정만 바꿔 다시 변환할 때 렌더링 생략)
+            notes_max_length: 노트 최대 글자수 (config의 speaker_notes.max_length).
+                응답을 스트리밍으로 받다가 이 길이에 도달하면 생성을 중단하고 문장 단위로 자름
+            event_callback: 진행 이벤트(events.Event)를 받을 콜백.
+                나중에 추가하려면 self.events.subscribe() 사용
+            request_timeout: AI 요청 하나의 제한 시간 (초, 모든 SDK 클라이언트에 전달, None이면 SDK 기본값)
+            key_rpm: 키 풀 사용 시 키별 분당 요청 한도 (None이면 제한 없이 고르게 분배)
+            key_pool: 다른 컨버터와 함께 쓸 키 풀 (주면 api_key, key_rpm 대신 사용).
+                여러 컨버터를 동시에 돌릴 때 키별 한도와 제외된 키를 공유
+            provider_options: 프로바이더 생성 시 추가 인자
+                (openai-compatible: base_url, headers, max_concurrency)
         """
         self._check_dependencies()
+        self._renderer_checked = False
+
+        if text_mode not in self.TEXT_MODES:
+            raise ValueError(
+                f"지원하지 않는 텍스트 모드: {text_mode}. "
+                f"사용 가능: {list(self.TEXT_MODES)}"
+            )
+
+        if media_format not in MEDIA_FORMATS:
+            raise ValueError(
+                f"지원하지 않는 미디어 형식: {media_format}. "
+                f"사용 가능: {list(MEDIA_FORMATS)}"
+            )
+
+        if slide_ppi is not None and slide_ppi <= 0:
+            raise ValueError(f"slide_ppi는 양수여야 합니다: {slide_ppi}")
+
+        if notes_max_length is not None and notes_max_length <= 0:
+            raise ValueError(f"notes_max_length는 양수여야 합니다: {notes_max_length}")
 
         self.dpi = dpi
+        self.slide_ppi = slide_ppi
+        self.streaming = streaming
+        self.media_format = media_format
+        self.jpeg_quality = jpeg_quality
+        self.native_text = native_text
+        self.page_cache = page_cache
+        self.notes_max_length = notes_max_length
+        self.events = ev.EventEmitter(event_callback)
+        self.request_timeout = request_timeout
         self.remove_watermark = remove_watermark
+        self.text_mode = text_mode
+        self.text_only_min_coverage = text_only_min_coverage
+        self.context_digest = context_digest
+        self.digest_max_chars = digest_max_chars
+        self.context_max_file_mb = context_max_file_mb
+        self.context_max_total_mb = context_max_total_mb
+        self.context_cache = context_cache
+        self.max_workers = max(1, max_workers)
+        self.dedup = dedup
+        self.dedup_threshold = dedup_threshold
         self.provider_name = provider.lower()
 
         # AI 프로바이더 설정
@@ -86,30 +226,128 @@ class NotebookLMToPPTX:
                 f"사용 가능: {list(self.PROVIDERS.keys())}"
             )
 
-        # API 키 설정 (환경변수 또는 직접 전달)
-        self.api_key = api_key or self._get_api_key_from_env()
-
-        # 프로바이더 인스턴스 생성
+        # API 키와 프로바이더는 처음 필요할 때 준비
+        # (미리보기나 노트 없는 변환은 API 키 없이 사용 가능)
+        self._api_keys = list(key_pool.keys) if key_pool is not None else split_keys(api_key)
+        self.api_key = self._api_keys[0] if self._api_keys else None
+        self.key_rpm = key_pool.rpm if key_pool is not None else key_rpm
+        self.key_pool: Optional[KeyPool] = key_pool
+        self.provider_options = provider_options or {}
+        self.model = model
+        self._ai_provider: Optional[AIProvider] = None
         provider_class = self.PROVIDERS[self.provider_name]
-        if model:
-            self.ai_provider = provider_class(self.api_key, model)
-        else:
-            self.ai_provider = provider_class(self.api_key)
 
-    def _check_dependencies(self):
-        """필수 의존성 및 외부 도구 확인."""
-        if convert_from_path is None:
-            raise ImportError(
-                "pdf2image 패키지가 필요합니다. "
-                "설치: pip install pdf2image"
+        # (모델, API 키)별 프로바이더 인스턴스 (라우팅, 키 풀에서 재사용)
+        self._providers: Dict[tuple, AIProvider] = {}
+        self._providers_lock = threading.Lock()
+
+        # 복잡도 기반 모델 라우팅
+        self.router = None
+        if routing:
+            self.router = SlideRouter(
+                # 지정되지 않은 모델은 처음 라우팅할 때 기본 프로바이더 모델로 채움
+                # (여기서 프로바이더를 만들면 API 키 확인과 모델 감지가 미리 실행됨)
+                simple_model=simple_model or provider_class.FAST_MODEL,
+                complex_model=complex_model or model or provider_class.STRONG_MODEL,
+                threshold=routing_threshold
             )
 
+        # 마지막 실행 리포트
+        self.last_report: Optional[RunReport] = None
+
+    @property
+    def ai_provider(self) -> AIProvider:
+        """기본 프로바이더 (처음 사용할 때 API 키를 확인하고 생성)."""
+        with self._providers_lock:
+            if self._ai_provider is None:
+                if not self._api_keys:
+                    self._api_keys = self._get_api_keys_from_env()
+                    self.api_key = self._api_keys[0]
+                provider_class = self.PROVIDERS[self.provider_name]
+                if self.key_pool is None and len(self._api_keys) > 1:
+                    self.key_pool = KeyPool(self._api_keys, rpm=self.key_rpm)
+                    print(f"🔑 API 키 {len(self.key_pool)}개로 요청 분산")
+                if self.model:
+                    self._ai_provider = provider_class(
+                        self.api_key, self.model, timeout=self.request_timeout, **self.provider_options
+                    )
+                else:
+                    self._ai_provider = provider_class(
+                        self.api_key, timeout=self.request_timeout, **self.provider_options
+                    )
+                self._providers.setdefault((self._ai_provider.model, self.api_key), self._ai_provider)
+            return self._ai_provider
+
+    def _get_provider(self, model: str, api_key: Optional[str] = None) -> AIProvider:
+        """
+        모델별 프로바이더 인스턴스 (없으면 생성).
+
+        Args:
+            model: 모델명
+            api_key: 사용할 키 (None이면 기본 키, 키 풀은 키마다 별도 클라이언트 사용)
+        """
+        self.ai_provider  # API 키 확인 및 기본 프로바이더 등록
+        key = api_key or self.api_key
+        with self._providers_lock:
+            if (model, key) not in self._providers:
+                provider_class = self.PROVIDERS[self.provider_name]
+                self._providers[(model, key)] = provider_class(
+                    key, model, timeout=self.request_timeout, **self.provider_options
+                )
+            return self._providers[(model, key)]
+
+    def _notes_concurrency(self) -> int:
+        """convert에서 동시에 보낼 노트 요청 수 (키 풀이 있으면 사용 가능한 키 수, 없으면 1)."""
+        self.ai_provider  # API 키 확인 및 키 풀 준비
+        if self.key_pool is None:
+            return 1
+        return max(1, len(self.key_pool.active_keys))
+
+    def _planned_notes_concurrency(self) -> int:
+        """_notes_concurrency 예측 (API 키가 없어도 동작, 키 수만 셈)."""
+        if self.key_pool is not None:
+            return self._notes_concurrency()
+        keys = self._api_keys
+        if not keys:
+            try:
+                keys = self._get_api_keys_from_env()
+            except ValueError:
+                return 1
+        return max(1, len(keys))
+
+    def _resolve_router_models(self) -> SlideRouter:
+        """라우터의 빈 모델을 기본 프로바이더 모델로 채운 뒤 반환."""
+        router = self.router
+        if router.simple_model is None or router.complex_model is None:
+            default_model = self.ai_provider.model
+            router.simple_model = router.simple_model or default_model
+            router.complex_model = router.complex_model or default_model
+        return router
+
+    def _check_dependencies(self):
+        """필수 의존성 확인."""
         if Presentation is None:
             raise ImportError(
                 "python-pptx 패키지가 필요합니다. "
                 "설치: pip install python-pptx"
             )
 
+    def _check_renderer(self):
+        """
+        PDF 렌더링 의존성 및 외부 도구 확인.
+
+        PDF를 렌더링할 때만 필요하므로 기존 PPTX의 노트만 다시 만드는
+        작업(repair_notes, renote_pptx)은 Poppler 없이도 동작합니다.
+        """
+        if self._renderer_checked:
+            return
+
+        if convert_from_path is None:
+            raise ImportError(
+                "pdf2image 패키지가 필요합니다. "
+                "설치: pip install pdf2image"
+            )
+
         # Poppler (pdftoppm) 의존성 확인
         if not shutil.which("pdftoppm") and not shutil.which("pdftocairo"):
             import platform
@@ -137,8 +375,29 @@ class NotebookLMToPPTX:
             error_msg += "="*50 + "\n"
             raise RuntimeError(error_msg)
 
-    def _get_api_key_from_env(self) -> str:
-        """환경변수에서 API 키 가져오기."""
+        self._renderer_checked = True
+
+    def warm_up(self, generate_notes: bool = True):
+        """
+        첫 변환 전에 미리 준비 (SDK 클라이언트 생성, 렌더러 확인).
+
+        감시 모드처럼 파일이 들어오기 전에 컨버터를 만들어 둘 때 사용합니다.
+
+        Args:
+            generate_notes: 노트 생성에 쓸 AI 프로바이더도 준비할지 여부
+        """
+        if generate_notes:
+            self.ai_provider
+        if not self.native_text:
+            self._check_renderer()
+
+    def _get_api_keys_from_env(self) -> List[str]:
+        """
+        환경변수에서 API 키 가져오기.
+
+        {변수}S (예: GOOGLE_API_KEYS)에 쉼표로 여러 키를 넣으면 키 풀로 사용하고,
+        없으면 {변수}를 사용합니다 (여기에도 쉼표로 여러 키 지정 가능).
+        """
         env_vars = {
             'gemini': 'GOOGLE_API_KEY',
             'openai': 'OPENAI_API_KEY',
@@ -146,18 +405,24 @@ class NotebookLMToPPTX:
             'claude': 'ANTHROPIC_API_KEY',
             'grok': 'XAI_API_KEY',
             'xai': 'XAI_API_KEY',
+            'openai-compatible': 'OPENAI_COMPATIBLE_API_KEY',
+            'local': 'OPENAI_COMPATIBLE_API_KEY',
         }
 
         env_var = env_vars.get(self.provider_name)
-        api_key = os.environ.get(env_var, '')
+        api_keys = split_keys(os.environ.get(f"{env_var}S") or os.environ.get(env_var, ''))
 
-        if not api_key:
+        if not api_keys and not self.PROVIDERS[self.provider_name].API_KEY_REQUIRED:
+            # 인증 없는 자체 서버
+            return ['']
+
+        if not api_keys:
             raise ValueError(
                 f"API 키가 필요합니다. "
                 f"환경변수 {env_var}를 설정하거나 api_key 파라미터를 전달하세요."
             )
 
-        return api_key
+        return api_keys
 
     def load_context_materials(
         self,
@@ -166,50 +431,87 @@ class NotebookLMToPPTX:
         """
         맥락 자료 로드.
 
+        파일/페이지 단위로 병렬 추출하고, 추출 결과는 파일 내용 해시로
+        디스크에 캐시합니다. 크기 제한을 넘는 파일은 건너뜁니다.
+
         Args:
             paths: 파일 경로 또는 경로 리스트 (.txt, .md, .pdf 지원)
 
         Returns:
             결합된 맥락 텍스트
         """
+        return self._context_loader().load(paths)
+
+    def _context_loader(self) -> ContextLoader:
+        """현재 설정의 맥락 자료 로더."""
+        return ContextLoader(
+            max_file_size_mb=self.context_max_file_mb,
+            max_total_size_mb=self.context_max_total_mb,
+            use_cache=self.context_cache
+        )
+
+    def build_context_digest(
+        self,
+        context: str,
+        paths: Union[str, Path, List[Union[str, Path]]]
+    ) -> str:
+        """
+        맥락 자료 요약본 생성 (파일 해시 기준 디스크 캐시).
+
+        슬라이드마다 원본 맥락 전체를 보내는 대신, 한 번 만든 요약본을
+        모든 슬라이드 프롬프트에서 재사용합니다.
+
+        Args:
+            context: load_context_materials 결과
+            paths: 맥락 자료 파일 경로 (캐시 키 계산용)
+
+        Returns:
+            digest_max_chars 이하의 요약 텍스트
+        """
         if isinstance(paths, (str, Path)):
             paths = [paths]
 
-        context_parts = []
+        loader = self._context_loader()
+        file_hashes = [loader.hash_file(p) for p in loader.select(paths)]
+        provider = self.ai_provider
+        digester = ContextDigester(
+            provider,
+            max_chars=self.digest_max_chars,
+            # 요약 요청도 키 풀을 거쳐 키별 한도와 재시도를 적용
+            generate=lambda prompt: self._request_notes(
+                provider, 'generate_text', prompt, record={}, limit_length=False
+            )
+        )
+        return digester.cached_digest(context, file_hashes)
 
-        for path in paths:
-            path = Path(path)
+    def prepare_context(
+        self,
+        paths: Union[str, Path, List[Union[str, Path]]],
+        digest: bool = True
+    ) -> Optional[str]:
+        """
+        슬라이드 프롬프트에 넣을 맥락 자료 준비 (로드 + 설정 시 요약).
 
-            if not path.exists():
-                print(f"⚠️ 파일을 찾을 수 없음: {path}")
-                continue
+        Args:
+            paths: 맥락 자료 파일 경로
+            digest: context_digest 설정이 켜져 있을 때 요약본을 만들지 여부
 
-            suffix = path.suffix.lower()
+        Returns:
+            맥락 텍스트 (없으면 None)
+        """
+        print(f"\n📚 맥락 자료 로딩 중...")
+        context = self.load_context_materials(paths)
+        if not context:
+            return None
 
-            if suffix in ['.txt', '.md']:
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                context_parts.append(f"--- {path.name} ---\n{content}")
+        print(f"✅ 맥락 자료 로드 완료 ({len(context)} 문자)")
 
-            elif suffix == '.pdf':
-                # PDF에서 텍스트 추출 (간단한 방법)
-                try:
-                    import fitz  # PyMuPDF
-                    doc = fitz.open(path)
-                    text_parts = []
-                    for page in doc:
-                        text_parts.append(page.get_text())
-                    doc.close()
-                    content = '\n'.join(text_parts)
-                    context_parts.append(f"--- {path.name} ---\n{content}")
-                except ImportError:
-                    print(f"⚠️ PDF 텍스트 추출을 위해 PyMuPDF가 필요합니다: pip install pymupdf")
-                except Exception as e:
-                    print(f"⚠️ PDF 읽기 실패 ({path}): {e}")
-            else:
-                print(f"⚠️ 지원하지 않는 파일 형식: {suffix}")
+        if digest and self.context_digest:
+            print(f"🗜️ 맥락 자료 요약 생성 중...")
+            context = self.build_context_digest(context, paths)
+            print(f"✅ 맥락 요약 완료 ({len(context)} 문자, 모든 슬라이드에서 재사용)")
 
-        return '\n\n'.join(context_parts)
+        return context
 
     def _remove_watermark_from_image(self, image: Image.Image) -> Image.Image:
         """
@@ -239,12 +541,41 @@ class NotebookLMToPPTX:
         
         return image
 
-    def convert_pdf_to_images(self, pdf_path: Union[str, Path]) -> List[Image.Image]:
+    def render_size(self) -> Optional[tuple]:
+        """
+        slide_ppi 기준 렌더링 픽셀 크기.
+
+        슬라이드(13.333×7.5인치)에 표시될 크기 그대로 렌더링하므로, 페이지 크기나
+        비율과 관계없이 PowerPoint에서 다시 늘이거나 줄일 필요가 없습니다.
+
+        Returns:
+            (가로, 세로) 픽셀 또는 None (dpi 기준 렌더링)
+        """
+        if not self.slide_ppi:
+            return None
+        return (
+            round(self.SLIDE_WIDTH.inches * self.slide_ppi),
+            round(self.SLIDE_HEIGHT.inches * self.slide_ppi)
+        )
+
+    def _render_options(self) -> Dict[str, Any]:
+        """convert_from_path 해상도 옵션 (slide_ppi가 있으면 목표 픽셀 크기로 직접 렌더링)."""
+        size = self.render_size()
+        if size:
+            return {'size': size}
+        return {'dpi': self.dpi}
+
+    def convert_pdf_to_images(
+        self,
+        pdf_path: Union[str, Path],
+        page_range: Optional[Tuple[int, int]] = None
+    ) -> List[Image.Image]:
         """
         PDF를 이미지 리스트로 변환.
 
         Args:
             pdf_path: PDF 파일 경로
+            page_range: 변환할 페이지 구간 (첫 페이지, 마지막 페이지) (1부터, None이면 전체)
 
         Returns:
             PIL Image 리스트
@@ -254,12 +585,25 @@ class NotebookLMToPPTX:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
 
+        self._check_renderer()
         print(f"📄 PDF 로딩 중: {pdf_path.name}")
+        size = self.render_size()
+        if size:
+            print(f"📐 슬라이드 크기로 렌더링: {size[0]}×{size[1]} ({self.slide_ppi} PPI)")
+
+        pages = list(range(page_range[0], page_range[1] + 1)) if page_range else None
+        if self.page_cache is not None:
+            blobs = self.convert_pdf_to_blobs(pdf_path, pages, fmt='png')
+            images = [self._decode_page(blobs[page]) for page in sorted(blobs)]
+            print(f"✅ {len(images)}개 슬라이드 변환 완료")
+            return images
 
         images = convert_from_path(
             str(pdf_path),
-            dpi=self.dpi,
-            fmt='png'
+            fmt='png',
+            first_page=page_range[0] if page_range else None,
+            last_page=page_range[1] if page_range else None,
+            **self._render_options()
         )
         
         if self.remove_watermark:
@@ -270,88 +614,968 @@ class NotebookLMToPPTX:
 
         return images
 
+    def extract_page_texts(self, pdf_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        """
+        PDF 텍스트 레이어를 페이지별로 추출.
+
+        텍스트 비중(coverage)은 페이지에서 텍스트 블록이 차지하는 면적을
+        텍스트 + 이미지 + 벡터 도형 면적으로 나눈 값입니다.
+        차트나 사진이 있는 슬라이드일수록 낮아집니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+
+        Returns:
+            페이지별 {'text': str, 'coverage': float} 리스트
+        """
+        if fitz is None:
+            raise ImportError(
+                "텍스트 레이어 추출을 위해 PyMuPDF가 필요합니다. "
+                "설치: pip install pymupdf"
+            )
+
+        pages = []
+        doc = fitz.open(str(pdf_path))
+        try:
+            for page in doc:
+                page_rect = page.rect
+                page_area = abs(page_rect) or 1.0
+                text_area = 0.0
+                visual_area = 0.0
+
+                for block in page.get_text('dict')['blocks']:
+                    area = abs(fitz.Rect(block['bbox']) & page_rect)
+                    if block['type'] == 0:
+                        text_area += area
+                    else:
+                        visual_area += area
+
+                for drawing in page.get_drawings():
+                    area = abs(drawing['rect'] & page_rect)
+                    # 페이지 전체를 덮는 배경 도형은 제외
+                    if area < page_area * 0.8:
+                        visual_area += area
+
+                total_area = text_area + visual_area
+                pages.append({
+                    'text': page.get_text().strip(),
+                    'coverage': text_area / total_area if total_area else 0.0,
+                })
+        finally:
+            doc.close()
+
+        return pages
+
+    def _generate_slide_notes(
+        self,
+        image: Image.Image,
+        context: Optional[str] = None,
+        page_text: Optional[Dict[str, Any]] = None,
+        record: Optional[Dict[str, Any]] = None,
+        previous_notes: Optional[str] = None,
+        slide_num: Optional[int] = None,
+        notes_callback: Optional[callable] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> str:
+        """
+        슬라이드 한 장의 스피커 노트 생성 (텍스트 모드, 모델 라우팅 반영).
+
+        Args:
+            image: 슬라이드 이미지
+            context: 맥락 자료
+            page_text: extract_page_texts 결과 중 해당 페이지 항목
+            record: 리포트용 슬라이드 레코드 (요청 방식, 모델, 라우팅 결과를 기록)
+            previous_notes: 거의 같은 앞 슬라이드의 노트 (있으면 짧은 차이점 프롬프트 사용)
+            slide_num: 슬라이드 번호 (notes_callback에 전달)
+            notes_callback: 노트가 생성되는 동안 조각마다 호출 (슬라이드 번호, 새 조각, 지금까지의 노트)
+            cancel_token: 취소 토큰 (응답 조각마다 확인)
+
+        Returns:
+            생성된 스피커 노트
+        """
+        if record is None:
+            record = {}
+        stream = {
+            'record': record,
+            'slide_num': slide_num,
+            'notes_callback': notes_callback,
+            'cancel_token': cancel_token,
+        }
+
+        slide_text = None
+        if page_text and (self.text_mode != 'off' or self.native_text):
+            # 네이티브 텍스트 모드의 배경 이미지에는 글자가 없으므로 텍스트를 함께 전송
+            slide_text = page_text['text'] or None
+
+        if previous_notes:
+            # 차이점 프롬프트는 가볍기 때문에 맥락 자료 없이 빠른 모델로 처리
+            provider = self._get_provider(self._resolve_router_models().simple_model) if self.router else self.ai_provider
+            record.update(model=provider.model, mode='delta')
+            print(f"  🧬 앞 슬라이드와 유사 → 차이점만 생성")
+            return self._request_notes(
+                provider, 'analyze_slide',
+                image,
+                slide_text=slide_text,
+                previous_notes=previous_notes,
+                **stream
+            )
+
+        provider = self.ai_provider
+        if self.router:
+            decision = self._resolve_router_models().route(image, page_text)
+            provider = self._get_provider(decision['model'])
+            record.update(
+                route=decision['route'],
+                score=decision['score'],
+                features=decision['features']
+            )
+            print(f"  🔀 {decision['route']} → {decision['model']} (복잡도 {decision['score']:.2f})")
+        record['model'] = provider.model
+
+        if (
+            slide_text
+            and self.text_mode == 'text-only'
+            and page_text['coverage'] >= self.text_only_min_coverage
+        ):
+            print(f"  📝 텍스트 전용 요청 (텍스트 비중 {page_text['coverage']:.0%})")
+            record['mode'] = 'text'
+            return self._request_notes(provider, 'analyze_text', slide_text, context, **stream)
+
+        record['mode'] = 'assist' if slide_text else 'image'
+        return self._request_notes(provider, 'analyze_slide', image, context, slide_text=slide_text, **stream)
+
+    def _request_notes(self, provider: AIProvider, method: str, *args, **kwargs) -> str:
+        """
+        프로바이더 요청 실행 (키 풀이 있으면 여유가 가장 큰 키로).
+
+        속도 제한, 인증 오류, 할당량 소진처럼 키 때문에 실패한 요청은 풀에 알리고 다른 키로
+        다시 시도합니다. 그 밖의 오류는 그대로 전달합니다.
+
+        Args:
+            provider: AI 프로바이더 (키 풀 사용 시 같은 모델의 다른 키 인스턴스로 대체)
+            method: 'analyze_slide', 'analyze_text' 또는 'generate_text' (맥락 요약)
+            *args, **kwargs: _request_notes_once 인자
+
+        Returns:
+            생성된 스피커 노트
+        """
+        pool = self.key_pool
+        if pool is None:
+            return self._request_notes_once(provider, method, *args, **kwargs)
+
+        attempts = 2 * len(pool)
+        for attempt in range(1, attempts + 1):
+            key = pool.acquire()
+            keyed = self._get_provider(provider.model, key)
+            error = None
+            try:
+                return self._request_notes_once(keyed, method, *args, **kwargs)
+            except ConversionCancelled:
+                raise
+            except Exception as e:
+                error = keyed.classify_error(e)
+                if error is None or attempt == attempts:
+                    raise
+            finally:
+                pool.release(key, error)
+
+    def _request_notes_once(
+        self,
+        provider: AIProvider,
+        method: str,
+        *args,
+        record: Dict[str, Any],
+        slide_num: Optional[int] = None,
+        notes_callback: Optional[callable] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        limit_length: bool = True,
+        **kwargs
+    ) -> str:
+        """
+        프로바이더 요청 1회 실행.
+
+        notes_callback, notes_max_length, cancel_token 중 하나라도 있으면 스트리밍 버전({method}_stream)을
+        사용해 조각이 도착할 때마다 콜백을 호출하고, 최대 길이에 도달하면 스트림을 닫아 생성을 멈춥니다.
+        취소 여부는 요청 전과 조각 사이마다 확인합니다. 기한이 지나면 스트림을 닫고 이미 받은 노트를
+        반환하며(다음 슬라이드에서 DeadlineExceeded), 취소되면 스트림을 닫고 ConversionCancelled를 발생시킵니다.
+
+        Args:
+            provider: AI 프로바이더
+            method: 'analyze_slide', 'analyze_text' 또는 'generate_text'
+            record: 리포트용 슬라이드 레코드 (잘림 여부 기록)
+            slide_num: 슬라이드 번호
+            notes_callback: 조각마다 호출 (슬라이드 번호, 새 조각, 지금까지의 노트)
+            cancel_token: 취소 토큰
+            limit_length: notes_max_length 적용 여부 (노트가 아닌 요청은 False)
+
+        Returns:
+            생성된 스피커 노트
+        """
+        max_length = self.notes_max_length if limit_length else None
+        provider.reset_usage()
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
+        if notes_callback is None and not max_length and cancel_token is None:
+            notes = getattr(provider, method)(*args, **kwargs)
+            self._emit_usage(provider, slide_num, record)
+            return notes
+
+        chunks = getattr(provider, f'{method}_stream')(*args, **kwargs)
+        notes = ''
+        stopped = False
+        try:
+            for chunk in chunks:
+                notes += chunk
+                if notes_callback:
+                    notes_callback(slide_num, chunk, notes)
+                if max_length and len(notes) >= max_length:
+                    print(f"  ✂️ 최대 길이({max_length}자) 도달, 생성 중단")
+                    record['truncated'] = True
+                    break
+                if cancel_token and (cancel_token.cancelled or cancel_token.expired):
+                    # 다음 조각을 기다리지 않고 중단 (이미 받은 노트는 버리지 않음)
+                    stopped = True
+                    break
+        finally:
+            # 끝까지 읽지 않은 스트림은 닫아서 연결(과 과금되는 생성)을 바로 끊음
+            close = getattr(chunks, 'close', None)
+            if close:
+                close()
+
+        self._emit_usage(provider, slide_num, record)
+        if stopped:
+            if cancel_token.cancelled:
+                cancel_token.raise_if_cancelled()
+            print(f"  ⏰ 작업 기한 초과 → 지금까지 받은 노트로 저장")
+        return self._truncate_notes(notes) if limit_length else notes
+
+    def _deadline_reached(self, slide_num: int):
+        """작업 기한 초과 알림."""
+        print(f"  ⏰ 작업 기한 초과 → 슬라이드 {slide_num}부터 노트 없이 저장합니다 (부분 결과)")
+        self.events.emit(ev.DEADLINE_EXCEEDED, slide=slide_num)
+
+    def _emit_usage(self, provider: AIProvider, slide_num: Optional[int], record: Dict[str, Any]):
+        """프로바이더가 알려준 토큰 사용량을 리포트에 기록하고 이벤트로 전달."""
+        usage = provider.last_usage
+        if usage:
+            record.update(usage)
+            self.events.emit(ev.TOKENS_USED, slide=slide_num, model=provider.model, **usage)
+
+    def _truncate_notes(self, notes: str) -> str:
+        """notes_max_length 이내로 자르기 (가능하면 줄이나 문장 끝에서)."""
+        limit = self.notes_max_length
+        if not limit or len(notes) <= limit:
+            return notes
+
+        cut = notes[:limit]
+        for boundary in (cut.rfind('\n'), cut.rfind('.')):
+            if boundary >= limit // 2:
+                return cut[:boundary + 1].rstrip()
+        return cut.rstrip() + '…'
+
+    def convert_pdf_pages_to_images(
+        self,
+        pdf_path: Union[str, Path],
+        pages: List[int]
+    ) -> Dict[int, Image.Image]:
+        """
+        PDF의 지정한 페이지만 이미지로 변환 (연속 구간 단위로 렌더링).
+
+        Args:
+            pdf_path: PDF 파일 경로
+            pages: 페이지 번호 리스트 (1부터)
+
+        Returns:
+            {페이지 번호: PIL Image}
+        """
+        pdf_path = Path(pdf_path)
+        rendered = {}
+        self._check_renderer()
+
+        if self.page_cache is not None:
+            blobs = self.convert_pdf_to_blobs(pdf_path, pages, fmt='png')
+            return {page: self._decode_page(blob) for page, blob in blobs.items()}
+
+        for first, last in self._page_runs(pages):
+            images = convert_from_path(
+                str(pdf_path),
+                fmt='png',
+                first_page=first,
+                last_page=last,
+                **self._render_options()
+            )
+            for page, image in zip(range(first, last + 1), images):
+                if self.remove_watermark:
+                    image = self._remove_watermark_from_image(image)
+                rendered[page] = image
+
+        return rendered
+
+    def _decode_page(self, blob: bytes) -> Image.Image:
+        """렌더링된 페이지 바이트를 이미지로 디코딩 (워터마크 제거 반영)."""
+        image = Image.open(io.BytesIO(blob)).convert('RGB')
+        if self.remove_watermark:
+            image = self._remove_watermark_from_image(image)
+        return image
+
+    @staticmethod
+    def _page_runs(pages: List[int]) -> List[List[int]]:
+        """페이지 번호들을 연속 구간 [첫 페이지, 마지막 페이지] 리스트로 묶기."""
+        runs = []
+        for page in sorted(set(pages)):
+            if runs and page == runs[-1][1] + 1:
+                runs[-1][1] = page
+            else:
+                runs.append([page, page])
+        return runs
+
+    def convert_pdf_to_blobs(
+        self,
+        pdf_path: Union[str, Path],
+        pages: Optional[List[int]] = None,
+        fmt: Optional[str] = None,
+        render_options: Optional[Dict[str, Any]] = None
+    ) -> Dict[int, bytes]:
+        """
+        PDF 페이지를 인코딩된 이미지 바이트로 변환 (PIL 디코딩/재인코딩 없음).
+
+        Poppler가 임시 폴더에 바로 PNG(media_format='jpeg'이면 JPEG)를 쓰고
+        그 바이트를 그대로 PPTX에 넣습니다. 노트를 만들지 않고 워터마크도 지우지 않는
+        변환(--no-notes)용 빠른 경로입니다. page_cache가 있으면 캐시된 페이지는 렌더링하지 않습니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            pages: 변환할 페이지 번호 리스트 (1부터, None이면 전체)
+            fmt: 'png' 또는 'jpeg' (None이면 media_format에 따라 결정)
+            render_options: 해상도 옵션 (None이면 dpi/slide_ppi 설정 사용)
+
+        Returns:
+            {페이지 번호: 이미지 바이트}
+        """
+        pdf_path = Path(pdf_path)
+
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+
+        self._check_renderer()
+        if fmt is None:
+            fmt = 'jpeg' if self.media_format == 'jpeg' else 'png'
+        if fmt == 'jpeg':
+            image_options = {'fmt': 'jpeg', 'jpegopt': {'quality': self.jpeg_quality, 'optimize': 'y'}}
+        else:
+            image_options = {'fmt': 'png'}
+
+        if render_options is None:
+            render_options = self._render_options()
+
+        if self.page_cache is None:
+            return self._render_blobs(pdf_path, pages, image_options, render_options)
+
+        cache_key = self.page_cache.key(
+            file_sha256(pdf_path),
+            dict(image_options, **render_options)
+        )
+        wanted = pages if pages is not None else range(1, self.page_count(pdf_path) + 1)
+        blobs = {}
+        missing = []
+        for page in wanted:
+            cached = self.page_cache.get(cache_key, page)
+            if cached is None:
+                missing.append(page)
+            else:
+                blobs[page] = cached
+
+        if blobs:
+            print(f"♻️ 렌더링 캐시 사용: {len(blobs)}/{len(blobs) + len(missing)} 페이지")
+            self.events.emit(ev.CACHE_HIT, cache='pages', count=len(blobs), total=len(blobs) + len(missing))
+        if missing:
+            rendered = self._render_blobs(pdf_path, missing, image_options, render_options)
+            self.page_cache.put_many(cache_key, rendered)
+            blobs.update(rendered)
+        return blobs
+
+    def _render_blobs(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]],
+        image_options: Dict[str, Any],
+        render_options: Dict[str, Any]
+    ) -> Dict[int, bytes]:
+        """Poppler로 페이지를 임시 폴더에 바로 인코딩한 뒤 바이트로 읽기."""
+        blobs = {}
+        with tempfile.TemporaryDirectory(prefix='nb2pptx-') as tmp_dir:
+            runs = self._page_runs(pages) if pages is not None else [[None, None]]
+            for first, last in runs:
+                paths = convert_from_path(
+                    str(pdf_path),
+                    first_page=first,
+                    last_page=last,
+                    output_folder=tmp_dir,
+                    paths_only=True,
+                    # 페이지 구간을 나눠 여러 pdftoppm 프로세스로 렌더링
+                    thread_count=self.max_workers,
+                    **image_options,
+                    **render_options
+                )
+                for page, path in enumerate(paths, first or 1):
+                    with open(path, 'rb') as f:
+                        blobs[page] = f.read()
+                    os.remove(path)
+
+        return blobs
+
+    # 미리보기 썸네일 가로 크기 (픽셀)
+    PREVIEW_WIDTH = 320
+
+    def preview(
+        self,
+        pdf_path: Union[str, Path],
+        pages: Optional[List[int]] = None,
+        width: int = PREVIEW_WIDTH
+    ) -> Dict[int, Image.Image]:
+        """
+        전체 변환 전에 확인용 저해상도 썸네일 렌더링.
+
+        지정한 페이지만 연속 구간 단위로 렌더링하며, 워터마크 제거 설정을 그대로 반영합니다.
+        page_cache가 있으면 썸네일도 캐시되어 설정을 바꿔 다시 미리볼 때 렌더링을 생략하고,
+        여기서 계산한 PDF 해시는 이어지는 전체 변환에서 재사용됩니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            pages: 미리볼 페이지 번호 리스트 (1부터, None이면 전체)
+            width: 썸네일 가로 크기 (세로는 페이지 비율에 맞춤)
+
+        Returns:
+            {페이지 번호: PIL Image}
+        """
+        blobs = self.convert_pdf_to_blobs(
+            pdf_path,
+            pages,
+            fmt='png',
+            render_options={'size': (width, None)}
+        )
+        return {page: self._decode_page(blobs[page]) for page in sorted(blobs)}
+
+    def plan(
+        self,
+        pdf_path: Union[str, Path],
+        context_paths: Optional[Union[str, Path, List[Union[str, Path]]]] = None,
+        generate_notes: bool = True,
+        concurrency: int = 1,
+        shard: Optional[Tuple[int, int]] = None
+    ) -> ConversionPlan:
+        """
+        변환하지 않고 토큰 사용량, 비용, 소요 시간 예측 (API 키 불필요).
+
+        페이지 수와 크기는 렌더링 없이 읽고, 이미지 토큰은 프로바이더별 규칙으로 계산합니다.
+        맥락 자료는 실제로 추출해 크기를 재며 (추출 결과는 캐시되어 변환 때 재사용),
+        속도와 출력 토큰 수는 이전 실행 기록(planner.record_run)의 중앙값을 사용합니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            context_paths: 맥락 자료 파일 경로
+            generate_notes: AI 스피커 노트 생성 여부
+            concurrency: 함께 예측할 병렬 실행 수 (샤드/워커로 나눠 실행할 때).
+                convert 자체의 동시 요청 수(키 풀의 키 수)는 항상 함께 예측
+            shard: (샤드 번호, 샤드 수)이면 해당 샤드의 페이지 구간만 예측
+
+        Returns:
+            ConversionPlan
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+
+        provider_class = self.PROVIDERS[self.provider_name]
+        model = self.model or provider_class.DEFAULT_MODEL or self.ai_provider.model
+        if self.router:
+            router = self._resolve_router_models()
+            models = [router.simple_model, router.complex_model]
+        else:
+            models = [model]
+        models = list(dict.fromkeys(models))
+
+        # 슬라이드 이미지 크기 (AI에 보내는 이미지 = 렌더링 결과)
+        page_sizes = self.page_sizes(pdf_path)
+        if shard:
+            first, last = shard_pages(len(page_sizes), *shard)
+            page_sizes = page_sizes[first - 1:last]
+        sizes = []
+        for width, height in page_sizes:
+            sizes.append(self.render_size() or (
+                round(width / 72 * self.dpi),
+                round(height / 72 * self.dpi)
+            ))
+        pages = len(sizes)
+
+        rates = planner.observed_rates(self.provider_name, models[-1])
+        plan = ConversionPlan(
+            pdf=str(pdf_path),
+            pages=pages,
+            provider=self.provider_name,
+            models=models,
+            generate_notes=generate_notes,
+            image_sizes={f"{w}x{h}": n for (w, h), n in Counter(sizes).most_common()},
+            notes_seconds=rates['notes_seconds'],
+            overhead_seconds=rates['overhead_seconds'],
+            history_runs=rates['runs'],
+            key_concurrency=self._planned_notes_concurrency() if generate_notes else 1,
+            concurrency=max(1, concurrency)
+        )
+
+        if generate_notes and pages:
+            plan.image_tokens = round(sum(provider_class.estimate_image_tokens(w, h) for w, h in sizes) / pages)
+            plan.prompt_tokens = planner.estimate_text_tokens(len(AIProvider.NOTES_GUIDE) + 100)
+
+            if context_paths:
+                context = self.load_context_materials(context_paths) or ''
+                plan.context_chars = len(context)
+                if context and self.context_digest and len(context) > self.digest_max_chars:
+                    digest_tokens = planner.estimate_text_tokens(self.digest_max_chars)
+                    plan.digest_tokens = (planner.estimate_text_tokens(len(context)), digest_tokens)
+                    plan.context_tokens = digest_tokens
+                else:
+                    plan.context_tokens = planner.estimate_text_tokens(len(context))
+
+            plan.output_tokens = round(rates['output_tokens'])
+            if self.notes_max_length:
+                plan.output_tokens = min(plan.output_tokens, planner.estimate_text_tokens(self.notes_max_length))
+
+            per_slide = plan.image_tokens + plan.prompt_tokens + plan.context_tokens
+            plan.input_tokens_total = per_slide * pages + plan.digest_tokens[0]
+            plan.output_tokens_total = plan.output_tokens * pages + plan.digest_tokens[1]
+            for name in models:
+                price = provider_class.price(name)
+                plan.cost_usd[name] = round(
+                    (plan.input_tokens_total * price[0] + plan.output_tokens_total * price[1]) / 1_000_000, 4
+                ) if price else None
+
+            if self.router:
+                plan.notes.append("라우팅 사용: 실제 비용은 두 모델 예상 비용 사이입니다.")
+            if self.text_mode != 'off':
+                plan.notes.append(f"텍스트 모드({self.text_mode})의 슬라이드 텍스트 토큰은 반영하지 않았습니다.")
+            if self.dedup:
+                plan.notes.append("중복 제거 사용: 동일 슬라이드만큼 AI 요청이 줄어듭니다.")
+
+        for n in sorted({1, plan.key_concurrency, plan.concurrency}):
+            plan.wall_seconds[n] = plan.estimate_wall_seconds(n)
+        return plan
+
+    # 스트리밍 모드에서 한 번에 렌더링하는 페이지 수
+    STREAM_RENDER_BATCH = 8
+
+    def iter_pdf_images(
+        self,
+        pdf_path: Union[str, Path],
+        page_count: int,
+        skip: Iterable[int] = (),
+        encoded: bool = False,
+        first_page: int = 1
+    ) -> Iterator[Optional[Union[Image.Image, bytes]]]:
+        """
+        PDF 페이지를 STREAM_RENDER_BATCH 단위로 렌더링하며 순서대로 내놓기.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            page_count: 전체 페이지 수 (first_page를 지정하면 마지막 페이지 번호)
+            skip: 렌더링하지 않을 페이지 번호 (해당 위치에는 None)
+            encoded: PNG 바이트로 내놓기 (convert_pdf_to_blobs 빠른 경로)
+            first_page: 첫 페이지 번호 (샤드 변환)
+
+        Yields:
+            페이지 순서대로 PIL Image, PNG 바이트 또는 None
+        """
+        skip = set(skip)
+        pages = [p for p in range(first_page, page_count + 1) if p not in skip]
+        rendered = {}
+
+        for page in range(first_page, page_count + 1):
+            if page in skip:
+                yield None
+                continue
+
+            if page not in rendered:
+                start = pages.index(page)
+                batch = pages[start:start + self.STREAM_RENDER_BATCH]
+                if encoded:
+                    rendered = self.convert_pdf_to_blobs(pdf_path, batch)
+                else:
+                    rendered = self.convert_pdf_pages_to_images(pdf_path, batch)
+
+            yield rendered.pop(page)
+
+    def iter_native_slides(
+        self,
+        pdf_path: Union[str, Path],
+        text_layers: Dict[int, List[Dict[str, Any]]],
+        page_range: Optional[Tuple[int, int]] = None
+    ) -> Iterator[Image.Image]:
+        """
+        네이티브 텍스트 모드: 텍스트를 지운 배경 이미지를 순서대로 내놓고
+        페이지별 텍스트 상자는 text_layers에 채우기.
+
+        배경은 슬라이드 크기(slide_ppi, 없으면 dpi를 슬라이드 기준 해상도로 사용)로 렌더링합니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            text_layers: 텍스트 상자를 기록할 dict ({슬라이드 번호: 텍스트 상자 리스트})
+            page_range: 변환할 페이지 구간 (첫 페이지, 마지막 페이지) (None이면 전체,
+                슬라이드 번호는 구간의 첫 페이지가 1)
+
+        Yields:
+            배경 이미지
+        """
+        if fitz is None:
+            raise ImportError(
+                "네이티브 텍스트 모드를 위해 PyMuPDF가 필요합니다. "
+                "설치: pip install pymupdf"
+            )
+
+        size = self.render_size() or (
+            round(self.SLIDE_WIDTH.inches * self.dpi),
+            round(self.SLIDE_HEIGHT.inches * self.dpi)
+        )
+        pages = iter_native_pages(pdf_path, size, self.SLIDE_WIDTH, self.SLIDE_HEIGHT, page_range)
+        for page_num, (background, boxes) in enumerate(pages, 1):
+            if self.remove_watermark:
+                background = self._remove_watermark_from_image(background)
+            text_layers[page_num] = boxes
+            yield background
+
+    def page_count(self, pdf_path: Union[str, Path]) -> int:
+        """렌더링 없이 PDF 페이지 수 조회."""
+        if fitz is not None:
+            with fitz.open(str(pdf_path)) as doc:
+                return doc.page_count
+        self._check_renderer()
+        return pdfinfo_from_path(str(pdf_path))['Pages']
+
+    def shard_info(self, pdf_path: Union[str, Path], index: int, count: int) -> ShardInfo:
+        """
+        샤드가 맡을 페이지 구간과 원본 PDF 정보 (렌더링 없음).
+
+        Args:
+            pdf_path: PDF 파일 경로
+            index: 샤드 번호 (1부터)
+            count: 샤드 수
+
+        Returns:
+            ShardInfo
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+        total = self.page_count(pdf_path)
+        first, last = shard_pages(total, index, count)
+        return ShardInfo(index, count, first, last, total, file_sha256(pdf_path)[:16])
+
+    def page_sizes(self, pdf_path: Union[str, Path]) -> List[tuple]:
+        """
+        렌더링 없이 페이지 크기 조회.
+
+        Returns:
+            페이지별 (가로, 세로) 포인트 (Poppler만 있으면 모든 페이지를 첫 페이지 크기로 간주)
+        """
+        if fitz is not None:
+            with fitz.open(str(pdf_path)) as doc:
+                return [(page.rect.width, page.rect.height) for page in doc]
+        self._check_renderer()
+        info = pdfinfo_from_path(str(pdf_path))
+        width, _, height = info['Page size'].split()[:3]
+        return [(float(width), float(height))] * info['Pages']
+
+    def _encode_slide_image(self, image: Image.Image) -> bytes:
+        """슬라이드 이미지를 media_format 정책에 따라 인코딩."""
+        return encode_image(image, self.media_format, self.jpeg_quality)
+
+    def _open_writer(self, output_path: Path):
+        """출력 방식에 맞는 PPTX writer 생성."""
+        writer_class = StreamingPptxWriter if self.streaming else PresentationWriter
+        return writer_class(output_path, self.SLIDE_WIDTH, self.SLIDE_HEIGHT)
+
     def create_pptx(
         self,
-        images: List[Image.Image],
+        images: Iterable,
         output_path: Union[str, Path],
         context: Optional[str] = None,
         generate_notes: bool = True,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        page_texts: Optional[List[Dict[str, Any]]] = None,
+        reused_slides: Optional[Dict[int, Dict[str, Any]]] = None,
+        slide_count: Optional[int] = None,
+        text_layers: Optional[Dict[int, List[Dict[str, Any]]]] = None,
+        slide_callback: Optional[callable] = None,
+        notes_callback: Optional[callable] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        shard: Optional[ShardInfo] = None
     ) -> Path:
         """
         이미지 리스트로 PPTX 생성.
 
         Args:
-            images: PIL Image 리스트
+            images: PIL Image 또는 인코딩된 이미지 바이트 리스트(또는 순서대로 내놓는 iterator)
+                (reused_slides에 있는 슬라이드는 None 가능)
             output_path: 출력 PPTX 파일 경로
             context: 스피커 노트 생성용 맥락 자료
             generate_notes: AI 스피커 노트 생성 여부
             progress_callback: 진행 상황 콜백 함수 (current, total)
+            page_texts: 페이지별 텍스트 레이어 (extract_page_texts 결과)
+            reused_slides: 이전 결과에서 그대로 가져올 슬라이드
+                {슬라이드 번호: {'blob': 이미지 바이트, 'notes': 노트}}
+            slide_count: 전체 슬라이드 수 (images가 iterator일 때 필요)
+            text_layers: 슬라이드별 편집 가능한 텍스트 상자 {슬라이드 번호: 텍스트 상자 리스트}
+                (images가 iterator이면 해당 이미지를 내놓을 때까지 채워져 있으면 됨)
+            slide_callback: 슬라이드가 완성될 때마다 호출 (슬라이드 번호, 이미지 바이트, 노트)
+            notes_callback: 노트가 생성되는 동안 조각마다 호출 (슬라이드 번호, 새 조각, 지금까지의 노트)
+            cancel_token: 취소 토큰. 취소되면 저장하지 않고 ConversionCancelled를 발생시키고,
+                기한이 지나면 남은 슬라이드는 노트 없이 기록해 부분 결과로 저장
+            shard: 샤드 변환이면 샤드 정보. images는 샤드 구간의 페이지들이고,
+                리포트와 이벤트의 슬라이드 번호는 원본 덱 기준 페이지 번호가 되며
+                PPTX에 샤드 태그를 남겨 merge_shards로 합칠 수 있게 함
 
         Returns:
             생성된 PPTX 파일 경로
         """
         output_path = Path(output_path)
 
-        # 새 프레젠테이션 생성
-        prs = Presentation()
-        prs.slide_width = self.SLIDE_WIDTH
-        prs.slide_height = self.SLIDE_HEIGHT
-
-        # 빈 레이아웃 가져오기
-        blank_layout = prs.slide_layouts[6]  # 빈 슬라이드
-
-        total = len(images)
-
-        for idx, image in enumerate(images, 1):
-            slide_num = idx
-
-            if progress_callback:
-                progress_callback(idx, total)
-            else:
-                print(f"🔄 슬라이드 {slide_num}/{total} 처리 중...")
-
-            # 슬라이드 추가
-            slide = prs.slides.add_slide(blank_layout)
-
-            # 이미지를 임시 파일로 저장
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                image.save(tmp.name, 'PNG')
-                tmp_path = tmp.name
+        total = slide_count if slide_count is not None else len(images)
+        report = RunReport(self.provider_name, self.ai_provider.model if generate_notes else None, total)
+        self.last_report = report
+        # 샤드 변환: 슬라이드 번호 = 원본 덱의 페이지 번호
+        offset = shard.first_page - 1 if shard else 0
+        if shard:
+            report.info.update(
+                shard=f"{shard.index}/{shard.count}",
+                pages=[shard.first_page, shard.last_page],
+                total_pages=shard.total_pages
+            )
 
+        # 동일/유사 슬라이드 탐지 (슬라이드마다 순서대로 검사).
+        # 텍스트 상자가 있으면 배경이 같아도 내용이 다를 수 있으므로 사용하지 않음
+        detector = None
+        if self.dedup and text_layers is None:
+            detector = DuplicateDetector(self.dedup_threshold)
+
+        # 슬라이드별 이미지 바이트와 노트 (중복 슬라이드 재사용용).
+        # 스트리밍 모드에서는 이미지 바이트를 보관하지 않고 동일 슬라이드는 다시 인코딩합니다
+        # (같은 바이트가 나오므로 writer가 미디어 파트 하나를 공유).
+        blobs = {}
+        slide_notes = {}
+
+        deadline_hit = False
+
+        # 노트 요청 동시 실행 (키 풀이 있으면 사용 가능한 키 수만큼, 키별 여유는 풀이 조절).
+        # 슬라이드는 완료 순서와 상관없이 페이지 순서대로 기록합니다.
+        concurrency = self._notes_concurrency() if generate_notes else 1
+        executor = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+        if executor:
+            print(f"⚡ 노트 요청 최대 {concurrency}개 동시 실행")
+        pending = deque()
+
+        def request_notes(record: Dict[str, Any], *args, **kwargs) -> str:
+            started = time.time()
             try:
-                # 풀슬라이드 이미지 삽입
-                slide.shapes.add_picture(
-                    tmp_path,
-                    Inches(0),
-                    Inches(0),
-                    width=self.SLIDE_WIDTH,
-                    height=self.SLIDE_HEIGHT
-                )
+                return self._generate_slide_notes(*args, record=record, **kwargs)
             finally:
-                # 임시 파일 삭제
-                os.unlink(tmp_path)
+                record['seconds'] = round(time.time() - started, 2)
 
-            # AI 스피커 노트 생성
-            if generate_notes:
+        def submit(call) -> Future:
+            if executor:
+                return executor.submit(call)
+            future = Future()
+            try:
+                future.set_result(call())
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        def write(item: Dict[str, Any]):
+            nonlocal deadline_hit
+            idx, slide_num, notes = item['idx'], item['slide_num'], item['notes']
+            future = item['future']
+            if future is not None:
+                record = report.slide(slide_num)
                 try:
-                    print(f"  🤖 AI 스피커 노트 생성 중... ({self.provider_name})")
-                    notes = self.ai_provider.analyze_slide(image, context)
-
-                    # 노트 슬라이드에 추가
-                    notes_slide = slide.notes_slide
-                    notes_frame = notes_slide.notes_text_frame
-                    notes_frame.text = notes
-
-                    print(f"  ✅ 스피커 노트 생성 완료")
-
+                    notes = future.result()
+                    record['status'] = 'ok'
+                    print(f"  ✅ 슬라이드 {slide_num} 스피커 노트 생성 완료" if executor else "  ✅ 스피커 노트 생성 완료")
+                except DeadlineExceeded:
+                    # 요청 전에 기한이 지남: 이 슬라이드부터 노트 없이 기록
+                    notes = None
+                    record['status'] = 'skipped'
+                    if not deadline_hit:
+                        deadline_hit = True
+                        self._deadline_reached(slide_num)
+                except ConversionCancelled:
+                    raise
                 except Exception as e:
-                    print(f"  ⚠️ 스피커 노트 생성 실패: {e}")
+                    record['status'] = 'failed'
+                    record['error'] = str(e)
+                    print(f"  ⚠️ 슬라이드 {slide_num} 스피커 노트 생성 실패: {e}")
+                    self.events.emit(
+                        ev.SLIDE_FAILED, slide=slide_num, error=str(e),
+                        seconds=record.get('seconds')
+                    )
+
+            writer.add_slide(item['blob'], notes, text_layers.get(idx) if text_layers else None)
+            self.events.emit(
+                ev.SLIDE_COMPLETED,
+                slide=slide_num,
+                total=total,
+                status=report.slides.get(slide_num, {}).get('status', 'image'),
+                seconds=round(time.time() - item['started'], 3),
+                notes_chars=len(notes) if notes else 0
+            )
+            if slide_callback:
+                slide_callback(idx, item['blob'], notes)
+            if notes:
+                slide_notes[idx] = notes
+            if not self.streaming:
+                blobs[idx] = item['blob']
+
+        def flush(limit: int = 0, through: Optional[int] = None):
+            """앞에서부터 완료된 슬라이드 기록 (대기 슬라이드가 limit 이하가 될 때까지, through까지는 반드시)."""
+            while pending and (
+                len(pending) > limit
+                or (through is not None and pending[0]['idx'] <= through)
+                or pending[0]['future'] is None
+                or pending[0]['future'].done()
+            ):
+                write(pending.popleft())
+
+        writer = self._open_writer(output_path)
+        try:
+            for idx, image in enumerate(images, 1):
+                slide_num = idx + offset
+                slide_started = time.time()
+
+                if cancel_token:
+                    if cancel_token.cancelled:
+                        raise ConversionCancelled(cancel_token.reason)
+                    if cancel_token.expired and not deadline_hit:
+                        deadline_hit = True
+                        self._deadline_reached(slide_num)
+                self.events.emit(ev.SLIDE_STARTED, slide=slide_num, total=total)
+
+                if progress_callback:
+                    progress_callback(idx, total)
+                elif shard:
+                    print(f"🔄 슬라이드 {slide_num} ({idx}/{total}, 샤드 {shard.index}/{shard.count}) 처리 중...")
+                else:
+                    print(f"🔄 슬라이드 {slide_num}/{total} 처리 중...")
+
+                reused = reused_slides.get(idx) if reused_slides else None
+                duplicate = None
+                if detector and not reused and not isinstance(image, bytes):
+                    duplicate = detector.check(idx, image)
+                elif detector:
+                    detector.check(idx, None)
+                if duplicate:
+                    # 원본 슬라이드의 노트가 아직 생성 중이면 먼저 기다림
+                    flush(through=duplicate['of'])
+
+                notes = None
+                if reused:
+                    # 이전 결과의 이미지를 재인코딩 없이 그대로 삽입
+                    blob = reused['blob']
+                    record = report.slide(slide_num)
+                    record['reused_from'] = reused['previous']
+
+                    if reused['notes'] or not generate_notes:
+                        notes = reused['notes'] or None
+                        record['status'] = 'reused'
+                        print(f"  ♻️ 변경 없음 (이전 슬라이드 {reused['previous']} 재사용)")
+                        self.events.emit(ev.CACHE_HIT, slide=slide_num, cache='incremental', of=reused['previous'])
+                        generate = False
+                    else:
+                        # 이전 실행에서 노트 생성에 실패한 슬라이드는 이미지로 다시 생성
+                        image = Image.open(io.BytesIO(blob)).convert('RGB')
+                        generate = True
+                elif duplicate and duplicate['kind'] == 'exact':
+                    # 동일 슬라이드: 같은 이미지 파트 공유, 노트 재사용
+                    original = duplicate['of']
+                    blob = blobs.get(original) or self._encode_slide_image(image)
+                    record = report.slide(slide_num)
+                    record.update(dedup='exact', dedup_of=original + offset)
+
+                    generate = generate_notes and original not in slide_notes
+                    if not generate:
+                        notes = slide_notes.get(original)
+                        record['status'] = 'deduplicated'
+                        print(f"  🧬 슬라이드 {original + offset}과(와) 동일 (이미지/노트 재사용)")
+                        self.events.emit(ev.CACHE_HIT, slide=slide_num, cache='dedup', of=original + offset)
+                elif isinstance(image, bytes):
+                    # 이미 인코딩된 이미지는 그대로 삽입 (노트가 필요할 때만 디코딩)
+                    blob = image
+                    generate = generate_notes
+                    if generate:
+                        image = Image.open(io.BytesIO(blob)).convert('RGB')
+                else:
+                    blob = self._encode_slide_image(image)
+                    generate = generate_notes
+
+                # 기한이 지난 뒤에는 이미지만 기록 (노트는 나중에 repair로 채울 수 있음)
+                if generate and deadline_hit:
+                    report.slide(slide_num)['status'] = 'skipped'
+                    generate = False
+
+                # AI 스피커 노트 생성 (동시 실행이면 요청만 보내고 다음 슬라이드로)
+                future = None
+                if generate:
+                    record = report.slide(slide_num)
+
+                    # 유사 슬라이드: 앞 슬라이드 노트를 넘겨 달라진 부분만 짧게 생성
+                    previous_notes = None
+                    if duplicate and duplicate['kind'] == 'near':
+                        previous_notes = slide_notes.get(duplicate['of'])
+                        if previous_notes:
+                            record.update(dedup='near', dedup_of=duplicate['of'] + offset)
 
-        # PPTX 저장
-        prs.save(str(output_path))
+                    print(f"  🤖 AI 스피커 노트 생성 중... ({self.provider_name})")
+                    future = submit(functools.partial(
+                        request_notes,
+                        record,
+                        image,
+                        context,
+                        page_texts[idx - 1] if page_texts else None,
+                        previous_notes=previous_notes,
+                        slide_num=slide_num,
+                        notes_callback=notes_callback,
+                        cancel_token=cancel_token
+                    ))
+
+                pending.append({
+                    'idx': idx, 'slide_num': slide_num, 'blob': blob,
+                    'notes': notes, 'future': future, 'started': slide_started,
+                })
+                flush(limit=concurrency)
+
+            flush()
+
+            if deadline_hit:
+                skipped = sum(1 for r in report.slides.values() if r.get('status') == 'skipped')
+                writer.mark_partial(
+                    f"작업 기한 초과로 슬라이드 {skipped}개의 노트가 비어 있습니다 "
+                    f"(nb2pptx repair로 채울 수 있음)"
+                )
+                report.info['partial'] = True
+            if shard:
+                writer.mark_shard(shard.to_tag())
+
+            # PPTX 저장
+            with self.events.stage('save'):
+                writer.close()
+        except BaseException:
+            writer.abort()
+            raise
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        report.finish()
         print(f"\n🎉 PPTX 저장 완료: {output_path}")
+        if generate_notes or reused_slides:
+            report.print_summary()
 
         return output_path
 
@@ -361,7 +1585,13 @@ class NotebookLMToPPTX:
         output_path: Optional[Union[str, Path]] = None,
         context_paths: Optional[Union[str, Path, List[Union[str, Path]]]] = None,
         generate_notes: bool = True,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        report_path: Optional[Union[str, Path]] = None,
+        incremental: bool = False,
+        slide_callback: Optional[callable] = None,
+        notes_callback: Optional[callable] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        shard: Optional[Tuple[int, int]] = None
     ) -> Path:
         """
         PDF를 PPTX로 변환 (메인 메서드).
@@ -372,15 +1602,29 @@ class NotebookLMToPPTX:
             context_paths: 맥락 자료 파일 경로
             generate_notes: AI 스피커 노트 생성 여부
             progress_callback: 진행 상황 콜백 함수
+            report_path: 실행 리포트(JSON) 저장 경로 (None이면 저장 안 함)
+            incremental: 이전 출력과 매니페스트를 비교해 바뀐 페이지만 다시 처리
+            slide_callback: 슬라이드가 완성될 때마다 호출 (슬라이드 번호, 이미지 바이트, 노트)
+            notes_callback: 노트가 생성되는 동안 조각마다 호출 (슬라이드 번호, 새 조각, 지금까지의 노트)
+            cancel_token: 취소 토큰 (CancellationToken(timeout=초)로 작업 전체 기한 지정).
+                기한이 지나면 완료된 노트까지만 담아 부분 결과로 저장
+            shard: (샤드 번호, 샤드 수). 지정하면 페이지를 고르게 나눈 구간 중 해당 구간만
+                변환해 샤드 PPTX(기본 이름 deck.shard-i-of-N.pptx)로 저장 (nb2pptx merge로 합치기)
 
         Returns:
             생성된 PPTX 파일 경로
         """
         pdf_path = Path(pdf_path)
+        run_started = time.time()
+
+        shard_info = self.shard_info(pdf_path, *shard) if shard else None
+        page_range = (shard_info.first_page, shard_info.last_page) if shard_info else None
 
         # 출력 경로 자동 설정
         if output_path is None:
             output_path = pdf_path.with_suffix('.pptx')
+            if shard_info:
+                output_path = shard_path(output_path, shard_info.index, shard_info.count)
         else:
             output_path = Path(output_path)
 
@@ -390,36 +1634,388 @@ class NotebookLMToPPTX:
         print(f"{'='*50}")
         print(f"\n📥 입력: {pdf_path}")
         print(f"📤 출력: {output_path}")
-        print(f"🤖 AI: {self.provider_name} ({self.ai_provider.model})")
+        if shard_info:
+            print(f"🧩 샤드 {shard_info.index}/{shard_info.count}: "
+                  f"페이지 {shard_info.first_page}-{shard_info.last_page} / {shard_info.total_pages}")
+        if generate_notes:
+            print(f"🤖 AI: {self.provider_name} ({self.ai_provider.model})")
+        else:
+            print(f"🤖 AI: 사용 안 함 (슬라이드 이미지만 변환)")
 
         # 맥락 자료 로드
         context = None
         if context_paths:
-            print(f"\n📚 맥락 자료 로딩 중...")
-            context = self.load_context_materials(context_paths)
-            if context:
-                print(f"✅ 맥락 자료 로드 완료 ({len(context)} 문자)")
+            with self.events.stage('context'):
+                context = self.prepare_context(context_paths, digest=generate_notes)
+
+        if cancel_token and cancel_token.cancelled:
+            raise ConversionCancelled(cancel_token.reason)
 
         # PDF → 이미지 변환
         print(f"\n🔄 PDF 변환 중...")
-        images = self.convert_pdf_to_images(pdf_path)
+        fingerprints = None
+        reused_slides = None
+        if incremental and self.native_text:
+            print("ℹ️ 네이티브 텍스트 모드에서는 증분 변환을 지원하지 않아 전체 변환합니다.")
+            incremental = False
+        if incremental and shard_info:
+            print("ℹ️ 샤드 변환에서는 증분 변환을 지원하지 않아 샤드 구간 전체를 변환합니다.")
+            incremental = False
+        if incremental:
+            fingerprints, reused_slides = self._plan_incremental(pdf_path, output_path)
+
+        # 노트도 워터마크 제거도 없고 Poppler가 바로 쓸 수 있는 형식이면 디코딩할 필요가 없음
+        fast_path = (
+            not self.native_text
+            and not generate_notes
+            and not self.remove_watermark
+            and self.media_format in ('png', 'jpeg')
+        )
+        slide_count = None
+        text_layers = None
+
+        # 스트리밍 모드는 렌더링이 slides 단계에서 슬라이드와 함께 진행됨 (lazy=True)
+        with self.events.stage('render', lazy=self.streaming):
+            if self.native_text:
+                print(f"🔤 네이티브 텍스트 복원: 텍스트는 편집 가능한 텍스트 상자로, 배경은 이미지로 변환")
+                text_layers = {}
+                images = self.iter_native_slides(pdf_path, text_layers, page_range)
+                if shard_info:
+                    slide_count = shard_info.last_page - shard_info.first_page + 1
+                if self.streaming:
+                    slide_count = slide_count or self.page_count(pdf_path)
+                else:
+                    images = list(images)
+                    print(f"✅ {len(images)}개 슬라이드 변환 완료 "
+                          f"(텍스트 상자 {sum(len(b) for b in text_layers.values())}개)")
+            elif self.streaming:
+                if not pdf_path.exists():
+                    raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+                last_page = len(fingerprints) if fingerprints else self.page_count(pdf_path)
+                first_page = 1
+                if shard_info:
+                    first_page, last_page = page_range
+                slide_count = last_page - first_page + 1
+                print(f"🌊 스트리밍 변환: {slide_count}개 슬라이드를 "
+                      f"{self.STREAM_RENDER_BATCH}장씩 렌더링하며 바로 기록")
+                images = self.iter_pdf_images(
+                    pdf_path,
+                    last_page,
+                    skip=reused_slides or (),
+                    encoded=fast_path,
+                    first_page=first_page
+                )
+            elif reused_slides:
+                changed = [i for i in range(1, len(fingerprints) + 1) if i not in reused_slides]
+                print(f"♻️ 증분 변환: {len(reused_slides)}개 재사용, {len(changed)}개 다시 렌더링")
+                if not changed:
+                    rendered = {}
+                elif fast_path:
+                    rendered = self.convert_pdf_to_blobs(pdf_path, changed)
+                else:
+                    rendered = self.convert_pdf_pages_to_images(pdf_path, changed)
+                images = [rendered.get(i) for i in range(1, len(fingerprints) + 1)]
+            elif fast_path:
+                print(f"⚡ 이미지 전용 빠른 변환 (디코딩/재인코딩 없음)")
+                rendered = self.convert_pdf_to_blobs(
+                    pdf_path,
+                    list(range(page_range[0], page_range[1] + 1)) if page_range else None
+                )
+                images = [rendered[i] for i in sorted(rendered)]
+                print(f"✅ {len(images)}개 슬라이드 변환 완료")
+            else:
+                images = self.convert_pdf_to_images(pdf_path, page_range)
+
+        # 텍스트 레이어 추출 (라우터는 텍스트 모드와 상관없이 글자 수/비중을 복잡도 신호로 사용)
+        page_texts = None
+        if generate_notes and (self.text_mode != 'off' or self.native_text or self.router):
+            try:
+                with self.events.stage('text_layer'):
+                    page_texts = self.extract_page_texts(pdf_path)
+                if page_range:
+                    page_texts = page_texts[page_range[0] - 1:page_range[1]]
+                with_text = sum(1 for p in page_texts if p['text'])
+                print(f"📝 텍스트 레이어 추출 완료 ({with_text}/{len(page_texts)} 페이지)")
+            except Exception as e:
+                print(f"⚠️ 텍스트 레이어 추출 실패 (이미지만 사용): {e}")
 
         # PPTX 생성
         print(f"\n🎨 PPTX 생성 중...")
-        result_path = self.create_pptx(
-            images,
-            output_path,
-            context=context,
-            generate_notes=generate_notes,
-            progress_callback=progress_callback
-        )
+        with self.events.stage('slides'):
+            result_path = self.create_pptx(
+                images,
+                output_path,
+                context=context,
+                generate_notes=generate_notes,
+                progress_callback=progress_callback,
+                page_texts=page_texts,
+                reused_slides=reused_slides,
+                slide_count=slide_count,
+                text_layers=text_layers,
+                slide_callback=slide_callback,
+                notes_callback=notes_callback,
+                cancel_token=cancel_token,
+                shard=shard_info
+            )
+
+        if fingerprints is not None:
+            incr.save_manifest(result_path, fingerprints, self._render_settings())
+        else:
+            # 증분 변환이 아닌 실행(네이티브 텍스트, 샤드 포함)이 덮어쓴 출력의 이전 매니페스트는 무효
+            incr.remove_manifest(result_path)
+
+        # 다음 --plan 예측에 쓸 속도/토큰 기록
+        if self.last_report:
+            planner.record_run(self.last_report, time.time() - run_started)
+
+        if report_path and self.last_report:
+            self.last_report.info.update(
+                pdf=str(pdf_path),
+                output=str(result_path),
+                dpi=self.dpi,
+                slide_ppi=self.slide_ppi,
+                render_size=self.render_size(),
+                media_format=self.media_format,
+                native_text=self.native_text,
+                text_mode=self.text_mode,
+            )
+            self.last_report.save(report_path)
+            print(f"📋 실행 리포트 저장: {report_path}")
 
         print(f"\n{'='*50}")
         print(f"✨ 변환 완료!")
         print(f"{'='*50}\n")
+        if self.last_report and self.last_report.info.get('partial'):
+            print(f"⏰ 작업 기한이 지나 부분 결과로 저장했습니다. "
+                  f"빈 노트는 'nb2pptx repair {result_path}'로 채울 수 있습니다.\n")
 
         return result_path
 
+    def _annotate_slides(
+        self,
+        slides: List[tuple],
+        context: Optional[str],
+        report: RunReport,
+        progress_callback: Optional[callable] = None
+    ) -> Dict[int, str]:
+        """
+        여러 슬라이드의 스피커 노트를 병렬로 생성.
+
+        Args:
+            slides: (슬라이드 번호, PIL Image) 리스트
+            context: 맥락 자료
+            report: 슬라이드 레코드를 기록할 실행 리포트
+            progress_callback: 완료될 때마다 호출 (완료 수, 전체 수)
+
+        Returns:
+            {슬라이드 번호: 노트} (실패한 슬라이드는 제외)
+        """
+        def annotate(slide_num: int, image: Image.Image) -> str:
+            record = report.slide(slide_num)
+            started = time.time()
+            self.events.emit(ev.SLIDE_STARTED, slide=slide_num, total=total)
+            try:
+                return self._generate_slide_notes(image, context, record=record, slide_num=slide_num)
+            finally:
+                record['seconds'] = round(time.time() - started, 2)
+
+        results = {}
+        total = len(slides)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for slide_num, image in slides:
+                self.events.emit(ev.SLIDE_QUEUED, slide=slide_num, total=total)
+                futures[executor.submit(annotate, slide_num, image)] = slide_num
+            for done, future in enumerate(as_completed(futures), 1):
+                slide_num = futures[future]
+                record = report.slide(slide_num)
+                try:
+                    results[slide_num] = future.result()
+                    record['status'] = 'ok'
+                    print(f"  ✅ 슬라이드 {slide_num} 노트 생성 완료")
+                    self.events.emit(
+                        ev.SLIDE_COMPLETED, slide=slide_num, total=total, status='ok',
+                        seconds=record.get('seconds'), notes_chars=len(results[slide_num] or '')
+                    )
+                except Exception as e:
+                    record['status'] = 'failed'
+                    record['error'] = str(e)
+                    print(f"  ⚠️ 슬라이드 {slide_num} 노트 생성 실패: {e}")
+                    self.events.emit(
+                        ev.SLIDE_FAILED, slide=slide_num, total=total,
+                        error=str(e), seconds=record.get('seconds')
+                    )
+
+                if progress_callback:
+                    progress_callback(done, total)
+
+        return results
+
+    def repair_notes(
+        self,
+        pptx_path: Union[str, Path],
+        output_path: Optional[Union[str, Path]] = None,
+        context_paths: Optional[Union[str, Path, List[Union[str, Path]]]] = None,
+        progress_callback: Optional[callable] = None
+    ) -> Path:
+        """
+        노트가 비어 있는 슬라이드만 다시 생성 (PDF 불필요).
+
+        슬라이드에 삽입된 풀슬라이드 이미지로 노트를 병렬 생성해 채웁니다.
+        결과는 self.last_report에 기록됩니다.
+
+        Args:
+            pptx_path: 기존 PPTX 경로
+            output_path: 저장 경로 (None이면 제자리 저장)
+            context_paths: 맥락 자료 파일 경로
+            progress_callback: 진행 상황 콜백 함수 (완료 수, 전체 수)
+
+        Returns:
+            저장된 PPTX 경로
+        """
+        return self.renote_pptx(
+            pptx_path,
+            output_path=output_path,
+            context_paths=context_paths,
+            only_missing=True,
+            progress_callback=progress_callback
+        )
+
+    def renote_pptx(
+        self,
+        pptx_path: Union[str, Path],
+        output_path: Optional[Union[str, Path]] = None,
+        context_paths: Optional[Union[str, Path, List[Union[str, Path]]]] = None,
+        only_missing: bool = False,
+        progress_callback: Optional[callable] = None
+    ) -> Path:
+        """
+        기존 PPTX의 스피커 노트를 다시 생성 (PDF, Poppler 불필요).
+
+        PPTX 미디어 파트에 들어 있는 풀슬라이드 이미지를 그대로 읽어 쓰므로
+        렌더링 없이 다른 프로바이더/모델로 노트를 비교할 수 있습니다.
+        결과는 self.last_report에 기록됩니다.
+
+        Args:
+            pptx_path: 기존 PPTX 경로
+            output_path: 저장 경로 (None이면 제자리 저장)
+            context_paths: 맥락 자료 파일 경로
+            only_missing: 노트가 비어 있는 슬라이드만 처리
+            progress_callback: 진행 상황 콜백 함수 (완료 수, 전체 수)
+
+        Returns:
+            저장된 PPTX 경로
+        """
+        pptx_path = Path(pptx_path)
+        output_path = Path(output_path) if output_path else pptx_path
+
+        if not pptx_path.exists():
+            raise FileNotFoundError(f"PPTX 파일을 찾을 수 없습니다: {pptx_path}")
+
+        prs = Presentation(str(pptx_path))
+        slides = list(prs.slides)
+        report = RunReport(self.provider_name, self.ai_provider.model, len(slides))
+        report.info.update(
+            pptx=str(pptx_path),
+            operation='repair' if only_missing else 'renote'
+        )
+        self.last_report = report
+
+        targets = []
+        for slide_num, slide in enumerate(slides, 1):
+            if only_missing and slide_notes_text(slide).strip():
+                continue
+
+            blob = slide_picture_blob(slide)
+            if blob is None:
+                print(f"⚠️ 슬라이드 {slide_num}: 그림이 없어 건너뜁니다.")
+                continue
+
+            targets.append((slide_num, Image.open(io.BytesIO(blob)).convert('RGB')))
+
+        if only_missing:
+            print(f"🩹 노트가 비어 있는 슬라이드: {len(targets)}/{len(slides)}")
+        else:
+            print(f"📝 노트를 다시 생성할 슬라이드: {len(targets)}/{len(slides)}")
+        if not targets:
+            report.finish()
+            if output_path.resolve() != pptx_path.resolve():
+                # 바꿀 노트가 없어도 요청한 경로에 결과 파일을 만듦
+                shutil.copyfile(pptx_path, output_path)
+            return output_path
+
+        context = self.prepare_context(context_paths) if context_paths else None
+
+        # 제자리 저장이면 노트만 바뀌므로 증분 변환 매니페스트를 계속 쓸 수 있게 유지
+        manifest = incr.load_manifest(pptx_path) if output_path == pptx_path else None
+        keep_manifest = manifest is not None and incr.manifest_matches_output(manifest, pptx_path)
+
+        with self.events.stage('notes', total=len(targets)):
+            notes = self._annotate_slides(targets, context, report, progress_callback)
+        for slide_num, text in notes.items():
+            slides[slide_num - 1].notes_slide.notes_text_frame.text = text
+
+        # 기한 초과로 저장된 부분 결과가 모두 채워졌으면 표시 해제
+        core = prs.core_properties
+        if core.content_status == PARTIAL_STATUS and len(notes) == len(targets):
+            core.content_status = ''
+            core.comments = ''
+
+        with self.events.stage('save'):
+            save_atomic(prs, output_path)
+        if keep_manifest:
+            incr.refresh_manifest_output(output_path)
+        report.finish()
+        print(f"\n🎉 노트 생성 완료 ({len(notes)}/{len(targets)}): {output_path}")
+        report.print_summary()
+
+        return output_path
+
+    def _render_settings(self) -> Dict[str, Any]:
+        """슬라이드 이미지에 영향을 주는 설정 (증분 변환 호환성 판단용)."""
+        return {
+            'dpi': self.dpi,
+            'slide_ppi': self.slide_ppi,
+            'remove_watermark': self.remove_watermark,
+            'media_format': self.media_format,
+            'jpeg_quality': self.jpeg_quality,
+        }
+
+    def _plan_incremental(
+        self,
+        pdf_path: Path,
+        output_path: Path
+    ):
+        """
+        증분 변환 계획 수립.
+
+        Returns:
+            (페이지 지문 리스트, 재사용 슬라이드 dict 또는 None)
+        """
+        fingerprints = incr.page_fingerprints(pdf_path)
+        manifest = incr.load_manifest(output_path)
+
+        if manifest is None or not output_path.exists():
+            print("ℹ️ 이전 매니페스트가 없어 전체 변환합니다.")
+            return fingerprints, None
+
+        if manifest.get('settings') != self._render_settings():
+            print("ℹ️ 렌더링 설정(DPI/PPI/워터마크/이미지 형식)이 바뀌어 전체 변환합니다.")
+            return fingerprints, None
+
+        if not incr.manifest_matches_output(manifest, output_path):
+            print("ℹ️ 매니페스트 저장 후 출력 PPTX가 바뀌어 전체 변환합니다.")
+            return fingerprints, None
+
+        try:
+            previous_slides = incr.read_previous_slides(output_path)
+        except Exception as e:
+            print(f"⚠️ 이전 PPTX 읽기 실패, 전체 변환합니다: {e}")
+            return fingerprints, None
+
+        return fingerprints, incr.plan_incremental(fingerprints, manifest, previous_slides)
+
 
 def quick_convert(
     pdf_path: str,
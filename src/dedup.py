@@ -0,0 +1,168 @@
+"""
+Duplicate Slide Detection
+지각 해시(perceptual hash)로 동일/유사 슬라이드를 찾아 이미지와 노트를 재사용
+"""
+
+import hashlib
+from typing import Optional, List, Dict, Any
+from PIL import Image, ImageChops
+
+# 빌드업 판정용 축소 이미지 크기와 픽셀 변화 기준
+THUMB_SIZE = (160, 90)
+PIXEL_TOLERANCE = 24
+
+
+def dhash(image: Image.Image, hash_size: int = 8) -> int:
+    """
+    차이 해시(difference hash) 계산.
+
+    (hash_size+1)×hash_size 흑백 축소본에서 가로로 인접한 픽셀의 밝기 차이 부호를
+    비트로 만듭니다. 해상도/압축 차이에 강하고 계산이 매우 빠릅니다.
+
+    Args:
+        image: 슬라이드 이미지
+        hash_size: 해시 한 변 크기 (비트 수 = hash_size²)
+
+    Returns:
+        정수 해시
+    """
+    small = image.convert('L').resize((hash_size + 1, hash_size), Image.BILINEAR)
+    pixels = list(small.getdata())
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    """두 해시의 해밍 거리."""
+    return bin(a ^ b).count('1')
+
+
+def _thumbnail(image: Image.Image) -> Image.Image:
+    return image.convert('L').resize(THUMB_SIZE, Image.BILINEAR)
+
+
+def _mask(image: Image.Image) -> Image.Image:
+    """PIXEL_TOLERANCE를 넘는 픽셀만 켜진 1비트 마스크."""
+    return image.point(lambda v: 255 if v > PIXEL_TOLERANCE else 0).convert('1')
+
+
+def is_buildup(previous: Image.Image, current: Image.Image, min_preserved: float = 0.95) -> bool:
+    """
+    current가 previous에 내용을 덧붙인 슬라이드인지 판정.
+
+    지각 해시는 배경이 넓은 슬라이드끼리 모두 비슷하게 나오므로, 앞 슬라이드의
+    내용(배경이 아닌 픽셀)이 현재 슬라이드에 그대로 남아 있는지로 다시 확인합니다.
+
+    Args:
+        previous: 앞 슬라이드 축소 흑백 이미지
+        current: 현재 슬라이드 축소 흑백 이미지
+        min_preserved: 유지되어야 하는 앞 슬라이드 내용 픽셀 비율
+
+    Returns:
+        빌드업(유사 슬라이드) 여부
+    """
+    histogram = previous.histogram()
+    background = histogram.index(max(histogram))
+
+    ink = _mask(previous.point(lambda v: abs(v - background)))
+    ink_pixels = ink.convert('L').histogram()[255]
+    if ink_pixels == 0:
+        return False
+
+    changed = _mask(ImageChops.difference(previous, current))
+    changed_ink = ImageChops.logical_and(ink, changed).convert('L').histogram()[255]
+
+    return 1 - changed_ink / ink_pixels >= min_preserved
+
+
+class DuplicateDetector:
+    """
+    슬라이드를 순서대로 하나씩 검사하는 중복 탐지기.
+
+    - exact: 앞선 슬라이드 중 픽셀이 완전히 같은 슬라이드 (반복되는 섹션 구분 슬라이드 등)
+    - near: 바로 앞 슬라이드와 해시 거리가 near_threshold 이하이고,
+      앞 슬라이드 내용이 그대로 남아 있는 슬라이드 (빌드업 애니메이션 등)
+
+    이미지 자체는 보관하지 않고 해시와 축소본만 유지하므로 슬라이드를
+    스트리밍으로 처리할 때도 사용할 수 있습니다.
+    """
+
+    def __init__(self, near_threshold: int = 6):
+        """
+        Args:
+            near_threshold: 유사 슬라이드로 볼 최대 해밍 거리 (0이면 유사 판정 안 함)
+        """
+        self.near_threshold = near_threshold
+        self._first_by_pixels: Dict[tuple, int] = {}
+        self._previous_hash: Optional[int] = None
+        self._previous_thumb: Optional[Image.Image] = None
+
+    def check(self, slide_num: int, image: Optional[Image.Image]) -> Optional[Dict[str, Any]]:
+        """
+        슬라이드 한 장 검사.
+
+        Args:
+            slide_num: 슬라이드 번호 (1부터)
+            image: 슬라이드 이미지 (None이면 건너뛰고 유사 비교를 끊음)
+
+        Returns:
+            {'kind': 'exact'|'near', 'of': 원본 슬라이드 번호, 'distance': int} 또는 None
+        """
+        if image is None:
+            self._previous_hash = None
+            self._previous_thumb = None
+            return None
+
+        pixel_key = (image.size, image.mode, hashlib.sha1(image.tobytes()).hexdigest())
+        perceptual = dhash(image)
+        thumb = _thumbnail(image)
+        result = None
+
+        if pixel_key in self._first_by_pixels:
+            result = {
+                'kind': 'exact',
+                'of': self._first_by_pixels[pixel_key],
+                'distance': 0,
+            }
+        else:
+            self._first_by_pixels[pixel_key] = slide_num
+            if self._previous_hash is not None and self.near_threshold > 0:
+                distance = hamming(self._previous_hash, perceptual)
+                if distance <= self.near_threshold and is_buildup(self._previous_thumb, thumb):
+                    result = {
+                        'kind': 'near',
+                        'of': slide_num - 1,
+                        'distance': distance,
+                    }
+
+        self._previous_hash = perceptual
+        self._previous_thumb = thumb
+        return result
+
+
+def find_duplicates(
+    images: List[Optional[Image.Image]],
+    near_threshold: int = 6
+) -> Dict[int, Dict[str, Any]]:
+    """
+    슬라이드 전체에서 동일/유사 슬라이드 찾기 (한 번에 일괄 계산).
+
+    Args:
+        images: 슬라이드 이미지 리스트 (None인 항목은 건너뜀)
+        near_threshold: 유사 슬라이드로 볼 최대 해밍 거리 (0이면 유사 판정 안 함)
+
+    Returns:
+        {슬라이드 번호(1부터): {'kind': 'exact'|'near', 'of': 원본 슬라이드 번호, 'distance': int}}
+    """
+    detector = DuplicateDetector(near_threshold)
+    duplicates = {}
+    for slide_num, image in enumerate(images, 1):
+        result = detector.check(slide_num, image)
+        if result:
+            duplicates[slide_num] = result
+    return duplicates
@@ -0,0 +1,158 @@
+"""
+Conversion Events
+변환 진행 상황을 타입이 있는 이벤트로 전달 (Python 콜백, JSON Lines, Rich 진행률 표시)
+"""
+
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Callable, List, TextIO
+
+# 이벤트 타입
+STAGE_STARTED = 'stage_started'      # 단계 시작 (stage: context, render, text_layer, slides, notes, save)
+STAGE_FINISHED = 'stage_finished'    # 단계 종료 (seconds)
+SLIDE_QUEUED = 'slide_queued'        # 병렬 처리 대기열에 들어감
+SLIDE_STARTED = 'slide_started'      # 슬라이드 처리 시작
+SLIDE_COMPLETED = 'slide_completed'  # 슬라이드 처리 완료 (status: ok, failed, reused 등, seconds)
+SLIDE_FAILED = 'slide_failed'        # 노트 생성 실패 (error, seconds)
+RETRY = 'retry'                      # 작업 재시도 예정 (작업 큐)
+CACHE_HIT = 'cache_hit'              # 캐시/이전 결과 재사용 (cache: pages, incremental, dedup)
+TOKENS_USED = 'tokens_used'          # AI 요청 토큰 사용량 (model, input_tokens, output_tokens)
+DEADLINE_EXCEEDED = 'deadline_exceeded'  # 작업 기한 초과, 남은 슬라이드는 노트 없이 부분 결과로 저장
+
+EVENT_TYPES = (
+    STAGE_STARTED, STAGE_FINISHED,
+    SLIDE_QUEUED, SLIDE_STARTED, SLIDE_COMPLETED, SLIDE_FAILED,
+    RETRY, CACHE_HIT, TOKENS_USED, DEADLINE_EXCEEDED,
+)
+
+
+@dataclass(frozen=True)
+class Event:
+    """변환 이벤트 하나."""
+
+    type: str
+    timestamp: float
+    stage: Optional[str] = None
+    slide: Optional[int] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 (비어 있는 필드는 생략)."""
+        result = {'type': self.type, 'timestamp': round(self.timestamp, 3)}
+        if self.stage is not None:
+            result['stage'] = self.stage
+        if self.slide is not None:
+            result['slide'] = self.slide
+        result.update(self.data)
+        return result
+
+
+class EventEmitter:
+    """
+    이벤트를 등록된 콜백들에 전달.
+
+    콜백은 작업 스레드에서 호출될 수 있으므로 빠르게 반환해야 하며,
+    콜백에서 난 예외는 변환을 멈추지 않도록 무시합니다.
+    """
+
+    def __init__(self, callback: Optional[Callable[[Event], None]] = None):
+        """
+        Args:
+            callback: 처음부터 등록할 콜백
+        """
+        self._callbacks: List[Callable[[Event], None]] = [callback] if callback else []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[Event], None]):
+        """콜백 등록."""
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Event], None]):
+        """콜백 해제."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def emit(
+        self,
+        event_type: str,
+        stage: Optional[str] = None,
+        slide: Optional[int] = None,
+        **data
+    ) -> Optional[Event]:
+        """
+        이벤트 생성 후 전달.
+
+        Args:
+            event_type: 이벤트 타입 (EVENT_TYPES 중 하나)
+            stage: 단계 이름
+            slide: 슬라이드 번호
+            **data: 추가 필드
+
+        Returns:
+            전달한 이벤트 (등록된 콜백이 없으면 None)
+        """
+        if not self._callbacks:
+            return None
+        event = Event(event_type, time.time(), stage, slide, data)
+        self.dispatch(event)
+        return event
+
+    def dispatch(self, event: Event):
+        """이미 만들어진 이벤트 전달 (다른 EventEmitter에서 받은 이벤트 중계용)."""
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"⚠️ 이벤트 콜백 오류 ({event.type}): {e}", file=sys.stderr)
+
+    def stage(self, stage: str, **data) -> '_Stage':
+        """with 블록을 단계 시작/종료 이벤트로 감싸기."""
+        return _Stage(self, stage, data)
+
+
+class _Stage:
+    """EventEmitter.stage 컨텍스트 매니저."""
+
+    def __init__(self, emitter: EventEmitter, stage: str, data: Dict[str, Any]):
+        self.emitter = emitter
+        self.stage = stage
+        self.data = data
+
+    def __enter__(self):
+        self.started = time.time()
+        self.emitter.emit(STAGE_STARTED, stage=self.stage, **self.data)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.emitter.emit(
+            STAGE_FINISHED,
+            stage=self.stage,
+            seconds=round(time.time() - self.started, 3),
+            ok=exc_type is None
+        )
+        return False
+
+
+class JsonLinesWriter:
+    """이벤트를 한 줄에 하나씩 JSON으로 쓰는 콜백 (오케스트레이션 도구 연동용)."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Args:
+            stream: 출력 스트림 (None이면 sys.stdout)
+        """
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event):
+        line = json.dumps(event.to_dict(), ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + '\n')
+            self.stream.flush()
@@ -0,0 +1,178 @@
+"""
+Incremental Re-conversion
+페이지 지문(fingerprint) 매니페스트로 바뀐 슬라이드만 다시 렌더링/주석 생성
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional, Union, List, Dict, Any
+
+from .cache import file_sha256
+from .pptx_utils import slide_picture_blob, slide_notes_text
+
+# 2: 출력 PPTX 해시(output_sha256) 추가
+MANIFEST_VERSION = 2
+
+
+def manifest_path_for(output_path: Union[str, Path]) -> Path:
+    """출력 PPTX에 대응하는 매니페스트 경로 (deck.pptx → deck.manifest.json)."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.manifest.json")
+
+
+def page_fingerprints(pdf_path: Union[str, Path]) -> List[str]:
+    """
+    페이지별 지문 계산 (렌더링 없이 PDF 구조만 사용).
+
+    지문은 페이지 크기, 콘텐츠 스트림, 페이지가 참조하는 이미지 스트림의 해시입니다.
+    같은 이미지를 여러 페이지가 공유하면 해시를 한 번만 계산합니다.
+
+    Args:
+        pdf_path: PDF 파일 경로
+
+    Returns:
+        페이지 순서대로 지문(SHA-256) 리스트
+    """
+    import fitz  # PyMuPDF
+
+    image_hashes = {}
+    fingerprints = []
+
+    doc = fitz.open(str(pdf_path))
+    try:
+        for page in doc:
+            digest = hashlib.sha256()
+            digest.update(repr(tuple(page.rect)).encode('ascii'))
+            digest.update(page.read_contents())
+
+            for image in page.get_images(full=True):
+                xref = image[0]
+                if xref not in image_hashes:
+                    image_hashes[xref] = hashlib.sha256(doc.xref_stream_raw(xref) or b'').hexdigest()
+                digest.update(image_hashes[xref].encode('ascii'))
+
+            fingerprints.append(digest.hexdigest())
+    finally:
+        doc.close()
+
+    return fingerprints
+
+
+def load_manifest(output_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """이전 실행의 매니페스트 로드 (없거나 손상되었으면 None)."""
+    path = manifest_path_for(output_path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(
+    output_path: Union[str, Path],
+    fingerprints: List[str],
+    settings: Dict[str, Any]
+) -> Path:
+    """
+    매니페스트 저장 (저장 시점의 출력 PPTX 해시 포함).
+
+    Args:
+        output_path: 출력 PPTX 경로 (이미 저장된 파일)
+        fingerprints: 슬라이드 순서대로 페이지 지문
+        settings: 렌더링 설정 (바뀌면 전체 재변환)
+
+    Returns:
+        매니페스트 경로
+    """
+    path = manifest_path_for(output_path)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': MANIFEST_VERSION,
+            'settings': settings,
+            'output_sha256': file_sha256(output_path),
+            'fingerprints': fingerprints,
+        }, f, indent=2)
+    return path
+
+
+def remove_manifest(output_path: Union[str, Path]):
+    """매니페스트 삭제 (증분 변환이 아닌 실행이 출력 PPTX를 덮어쓴 경우)."""
+    manifest_path_for(output_path).unlink(missing_ok=True)
+
+
+def manifest_matches_output(manifest: Dict[str, Any], output_path: Union[str, Path]) -> bool:
+    """출력 PPTX가 매니페스트를 저장한 뒤 다른 실행이나 도구로 바뀌지 않았는지."""
+    return manifest.get('output_sha256') == file_sha256(output_path)
+
+
+def refresh_manifest_output(output_path: Union[str, Path]):
+    """
+    슬라이드는 그대로 두고 노트만 바꾼 경우(renote/repair) 매니페스트의 출력 해시 갱신.
+
+    Args:
+        output_path: 다시 저장한 출력 PPTX 경로
+    """
+    manifest = load_manifest(output_path)
+    if manifest is None:
+        return
+    manifest['output_sha256'] = file_sha256(output_path)
+    with open(manifest_path_for(output_path), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def read_previous_slides(pptx_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    이전 PPTX에서 슬라이드별 풀슬라이드 이미지와 노트 읽기.
+
+    Args:
+        pptx_path: 이전 출력 PPTX 경로
+
+    Returns:
+        슬라이드 순서대로 {'blob': bytes, 'notes': str} 리스트 (이미지가 없으면 blob=None)
+    """
+    from pptx import Presentation
+
+    prs = Presentation(str(pptx_path))
+    return [
+        {'blob': slide_picture_blob(slide), 'notes': slide_notes_text(slide)}
+        for slide in prs.slides
+    ]
+
+
+def plan_incremental(
+    fingerprints: List[str],
+    manifest: Dict[str, Any],
+    previous_slides: List[Dict[str, Any]]
+) -> Dict[int, Dict[str, Any]]:
+    """
+    새 페이지 지문과 이전 매니페스트를 비교해 재사용할 슬라이드 결정.
+
+    지문으로 매칭하므로 페이지가 삽입/삭제/이동되어도 바뀌지 않은 슬라이드는 재사용됩니다.
+
+    Args:
+        fingerprints: 새 PDF의 페이지 지문
+        manifest: 이전 매니페스트
+        previous_slides: read_previous_slides 결과
+
+    Returns:
+        {새 슬라이드 번호(1부터): {'blob', 'notes', 'previous': 이전 슬라이드 번호}}
+    """
+    available = {}
+    old_fingerprints = manifest.get('fingerprints', [])
+    for old_idx, fp in enumerate(old_fingerprints[:len(previous_slides)], 1):
+        if previous_slides[old_idx - 1]['blob'] is not None:
+            available.setdefault(fp, []).append(old_idx)
+
+    reused = {}
+    for new_idx, fp in enumerate(fingerprints, 1):
+        candidates = available.get(fp)
+        if candidates:
+            old_idx = candidates.pop(0)
+            reused[new_idx] = dict(previous_slides[old_idx - 1], previous=old_idx)
+
+    return reused
@@ -0,0 +1,523 @@
+"""
+SQLite Job Queue
+여러 워커 프로세스/호스트가 공유하는 내구성 있는 변환 작업 큐
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import dataclasses
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Union, List, Dict, Any
+
+from . import events as ev
+from .cancellation import CancellationToken
+
+
+# 작업 상태
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+DEFAULT_QUEUE_PATH = 'nb2pptx_jobs.db'
+
+# options 중 컨버터 생성자로 전달되는 항목 (나머지는 convert 호출 옵션)
+CONVERTER_OPTIONS = (
+    'remove_watermark',
+    'text_mode',
+    'text_only_min_coverage',
+    'routing',
+    'routing_threshold',
+    'simple_model',
+    'complex_model',
+    'context_digest',
+    'digest_max_chars',
+    'context_max_file_mb',
+    'context_max_total_mb',
+    'context_cache',
+    'max_workers',
+    'dedup',
+    'dedup_threshold',
+    'slide_ppi',
+    'streaming',
+    'media_format',
+    'jpeg_quality',
+    'native_text',
+    'notes_max_length',
+    'request_timeout',
+    'key_rpm',
+    'provider_options',
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    pdf_path TEXT NOT NULL,
+    output_path TEXT,
+    provider TEXT NOT NULL,
+    model TEXT,
+    dpi INTEGER NOT NULL,
+    context_paths TEXT NOT NULL,
+    options TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    heartbeat_at REAL,
+    progress_current INTEGER NOT NULL DEFAULT 0,
+    progress_total INTEGER NOT NULL DEFAULT 0,
+    result_path TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority, created_at);
+CREATE TABLE IF NOT EXISTS job_slides (
+    job_id TEXT NOT NULL,
+    slide_num INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job_id, slide_num)
+);
+"""
+
+
+def default_worker_id() -> str:
+    """호스트명과 PID로 워커 ID 생성."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class JobQueue:
+    """
+    SQLite 기반 변환 작업 큐.
+
+    브로커 없이 하나의 DB 파일을 여러 워커가 공유합니다.
+    워커는 리스(lease)를 잡고 작업을 가져가며, 하트비트로 리스를 연장합니다.
+    리스가 만료된 작업(워커 사망)은 다음 claim 시 자동으로 재대기열에 들어갑니다.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_QUEUE_PATH, wal: bool = True):
+        """
+        큐 초기화.
+
+        Args:
+            db_path: SQLite DB 파일 경로
+            wal: WAL 저널 모드 사용 여부 (NFS 등 공유 스토리지에서는 False 권장)
+        """
+        self.db_path = Path(db_path)
+        self.wal = wal
+
+        with self._connect() as conn:
+            if self.wal:
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """작업 단위 커넥션 (스레드/프로세스 간 공유하지 않음)."""
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=30000")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 즉시 잡는 트랜잭션."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _row_to_job(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job['context_paths'] = json.loads(job['context_paths'])
+        job['options'] = json.loads(job['options'])
+        return job
+
+    def submit(
+        self,
+        pdf_path: Union[str, Path],
+        output_path: Optional[Union[str, Path]] = None,
+        provider: str = 'gemini',
+        model: Optional[str] = None,
+        dpi: int = 144,
+        context_paths: Optional[List[Union[str, Path]]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        max_attempts: int = 3
+    ) -> str:
+        """
+        변환 작업 등록.
+
+        Args:
+            pdf_path: 입력 PDF 경로 (워커가 접근 가능한 경로여야 함)
+            output_path: 출력 PPTX 경로 (None이면 PDF 옆에 생성)
+            provider: AI 프로바이더 이름
+            model: 모델명 (None이면 프로바이더 기본값)
+            dpi: PDF 렌더링 해상도
+            context_paths: 맥락 자료 경로 리스트
+            options: 추가 옵션 (generate_notes, remove_watermark, text_mode 등)
+            priority: 우선순위 (클수록 먼저 처리)
+            max_attempts: 최대 시도 횟수
+
+        Returns:
+            작업 ID
+        """
+        job_id = uuid.uuid4().hex
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, pdf_path, output_path, provider, model, dpi,"
+                " context_paths, options, priority, max_attempts, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id, QUEUED,
+                    str(Path(pdf_path).absolute()),
+                    str(Path(output_path).absolute()) if output_path else None,
+                    provider, model, dpi,
+                    json.dumps([str(Path(p).absolute()) for p in (context_paths or [])]),
+                    json.dumps(options or {}),
+                    priority, max_attempts, time.time()
+                )
+            )
+        return job_id
+
+    def _requeue_expired(self, conn: sqlite3.Connection, now: float):
+        """리스가 만료된 작업을 재대기열에 넣거나 실패 처리."""
+        conn.execute(
+            "UPDATE jobs SET status=?, error='리스 만료 (최대 시도 횟수 초과)', finished_at=?,"
+            " worker_id=NULL, lease_expires_at=NULL"
+            " WHERE status=? AND lease_expires_at < ? AND attempts >= max_attempts",
+            (FAILED, now, RUNNING, now)
+        )
+        conn.execute(
+            "UPDATE jobs SET status=?, error='리스 만료 (워커 응답 없음)',"
+            " worker_id=NULL, lease_expires_at=NULL"
+            " WHERE status=? AND lease_expires_at < ?",
+            (QUEUED, RUNNING, now)
+        )
+
+    def claim(self, worker_id: str, lease_seconds: float = 300) -> Optional[Dict[str, Any]]:
+        """
+        대기 중인 작업 하나를 리스와 함께 가져오기.
+
+        Args:
+            worker_id: 워커 식별자
+            lease_seconds: 리스 유지 시간 (초)
+
+        Returns:
+            작업 레코드 (없으면 None)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            self._requeue_expired(conn, now)
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status=?"
+                " ORDER BY priority DESC, created_at ASC LIMIT 1",
+                (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET status=?, worker_id=?, lease_expires_at=?, heartbeat_at=?,"
+                " attempts=attempts+1, started_at=? WHERE id=?",
+                (RUNNING, worker_id, now + lease_seconds, now, now, row['id'])
+            )
+            job = conn.execute("SELECT * FROM jobs WHERE id=?", (row['id'],)).fetchone()
+        return self._row_to_job(job)
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float = 300) -> bool:
+        """
+        리스 연장.
+
+        Returns:
+            리스를 여전히 보유하면 True (다른 워커에 넘어갔으면 False)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET lease_expires_at=?, heartbeat_at=?"
+                " WHERE id=? AND worker_id=? AND status=?",
+                (now + lease_seconds, now, job_id, worker_id, RUNNING)
+            )
+            return cur.rowcount == 1
+
+    def record_progress(self, job_id: str, current: int, total: int):
+        """슬라이드 단위 진행 상황 기록 (current 슬라이드 시작 = 이전 슬라이드 완료)."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET progress_current=?, progress_total=? WHERE id=?",
+                (current, total, job_id)
+            )
+            conn.execute(
+                "UPDATE job_slides SET status=?, updated_at=?"
+                " WHERE job_id=? AND slide_num<? AND status!=?",
+                (DONE, now, job_id, current, DONE)
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO job_slides (job_id, slide_num, status, updated_at)"
+                " VALUES (?, ?, ?, ?)",
+                (job_id, current, RUNNING, now)
+            )
+
+    def complete(self, job_id: str, worker_id: str, result_path: Union[str, Path]) -> bool:
+        """작업 완료 처리."""
+        now = time.time()
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status=?, result_path=?, finished_at=?, error=NULL,"
+                " lease_expires_at=NULL, progress_current=progress_total"
+                " WHERE id=? AND worker_id=? AND status=?",
+                (DONE, str(result_path), now, job_id, worker_id, RUNNING)
+            )
+            conn.execute(
+                "UPDATE job_slides SET status=?, updated_at=? WHERE job_id=?",
+                (DONE, now, job_id)
+            )
+            return cur.rowcount == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """
+        작업 실패 처리. 시도 횟수가 남아 있으면 재대기열에 넣습니다.
+
+        Returns:
+            재대기열에 들어갔으면 True
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id=? AND worker_id=? AND status=?",
+                (job_id, worker_id, RUNNING)
+            ).fetchone()
+            if row is None:
+                return False
+
+            retry = row['attempts'] < row['max_attempts']
+            conn.execute(
+                "UPDATE jobs SET status=?, error=?, worker_id=NULL, lease_expires_at=NULL,"
+                " finished_at=? WHERE id=?",
+                (QUEUED if retry else FAILED, error, None if retry else now, job_id)
+            )
+            return retry
+
+    def cancel(self, job_id: str) -> bool:
+        """대기 중인 작업 취소."""
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status=?, finished_at=? WHERE id=? AND status=?",
+                (CANCELLED, time.time(), job_id, QUEUED)
+            )
+            return cur.rowcount == 1
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 레코드 조회."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
+        return self._row_to_job(row)
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """작업 목록 조회 (최신순)."""
+        with self._connect() as conn:
+            if status:
+                rows = conn.execute(
+                    "SELECT * FROM jobs WHERE status=? ORDER BY created_at DESC LIMIT ?",
+                    (status, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+        return [self._row_to_job(r) for r in rows]
+
+    def slide_progress(self, job_id: str) -> List[Dict[str, Any]]:
+        """작업의 슬라이드별 진행 상태 조회."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT slide_num, status, updated_at FROM job_slides"
+                " WHERE job_id=? ORDER BY slide_num",
+                (job_id,)
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+
+class QueueWorker:
+    """
+    큐에서 작업을 가져와 NotebookLMToPPTX.convert로 처리하는 워커.
+
+    같은 설정(provider, model, dpi, 워터마크)의 컨버터는 재사용하여
+    SDK 클라이언트 초기화 비용을 줄입니다.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 300,
+        poll_interval: float = 2.0,
+        api_key: Optional[str] = None,
+        event_callback: Optional[callable] = None
+    ):
+        """
+        워커 초기화.
+
+        Args:
+            queue: 작업 큐
+            worker_id: 워커 식별자 (None이면 자동 생성)
+            lease_seconds: 리스 유지 시간 (하트비트는 1/3 주기로 전송)
+            poll_interval: 빈 큐 폴링 간격 (초)
+            api_key: API 키 (None이면 환경변수 사용)
+            event_callback: 진행 이벤트(events.Event) 콜백. 컨버터 이벤트에 job_id를 붙여 전달하고
+                실패한 작업이 재대기열에 들어가면 retry 이벤트를 보냄
+        """
+        self.queue = queue
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.api_key = api_key
+        self._converters = {}
+        self._stop = threading.Event()
+        self.events = ev.EventEmitter(event_callback)
+
+    def stop(self):
+        """현재 작업을 마친 뒤 종료하도록 요청."""
+        self._stop.set()
+
+    def _get_converter(self, job: Dict[str, Any]):
+        from .converter import NotebookLMToPPTX
+
+        init_options = {
+            k: v for k, v in job['options'].items() if k in CONVERTER_OPTIONS
+        }
+        key = (
+            job['provider'], job['model'], job['dpi'],
+            json.dumps(init_options, sort_keys=True)
+        )
+        if key not in self._converters:
+            self._converters[key] = NotebookLMToPPTX(
+                provider=job['provider'],
+                api_key=self.api_key,
+                model=job['model'],
+                dpi=job['dpi'],
+                **init_options
+            )
+        return self._converters[key]
+
+    def _heartbeat_loop(self, job_id: str, done: threading.Event, cancel_token: CancellationToken):
+        interval = max(1.0, self.lease_seconds / 3)
+        while not done.wait(interval):
+            if not self.queue.heartbeat(job_id, self.worker_id, self.lease_seconds):
+                # 다른 워커가 작업을 가져갔으므로 중복 처리를 멈춤
+                print(f"⚠️ 작업 {job_id}의 리스를 잃었습니다. 변환을 중단합니다.")
+                cancel_token.cancel('리스 상실')
+                return
+
+    def process(self, job: Dict[str, Any]) -> bool:
+        """
+        작업 하나 처리.
+
+        Returns:
+            성공 여부
+        """
+        job_id = job['id']
+        done = threading.Event()
+        # 작업 기한은 이 시도가 시작된 시점부터 계산
+        cancel_token = CancellationToken(timeout=job['options'].get('deadline'))
+        heartbeat = threading.Thread(
+            target=self._heartbeat_loop, args=(job_id, done, cancel_token), daemon=True
+        )
+        heartbeat.start()
+
+        def forward(event: ev.Event):
+            self.events.dispatch(dataclasses.replace(event, data=dict(event.data, job_id=job_id)))
+
+        converter = None
+        try:
+            converter = self._get_converter(job)
+            converter.events.subscribe(forward)
+            result_path = converter.convert(
+                job['pdf_path'],
+                output_path=job['output_path'],
+                context_paths=job['context_paths'] or None,
+                generate_notes=job['options'].get('generate_notes', True),
+                report_path=job['options'].get('report_path'),
+                incremental=job['options'].get('incremental', False),
+                shard=tuple(job['options']['shard']) if job['options'].get('shard') else None,
+                progress_callback=lambda cur, total: self.queue.record_progress(job_id, cur, total),
+                cancel_token=cancel_token
+            )
+        except Exception as e:
+            done.set()
+            heartbeat.join()
+            retry = self.queue.fail(job_id, self.worker_id, f"{type(e).__name__}: {e}")
+            print(f"❌ 작업 실패 ({job_id}): {e}" + (" → 재시도 예정" if retry else ""))
+            if retry:
+                self.events.emit(
+                    ev.RETRY, job_id=job_id, attempts=job.get('attempts'),
+                    max_attempts=job.get('max_attempts'), error=str(e)
+                )
+            return False
+        finally:
+            if converter is not None:
+                converter.events.unsubscribe(forward)
+
+        done.set()
+        heartbeat.join()
+        if not self.queue.complete(job_id, self.worker_id, result_path):
+            # 리스가 만료되어 다른 워커가 작업을 가져감. 출력 경로가 같으므로
+            # 결과 파일은 지우지 않고 그 워커의 완료 기록에 맡김
+            print(f"⚠️ 작업 {job_id}의 리스를 잃어 완료로 기록하지 못했습니다: {result_path}")
+            return False
+        print(f"✅ 작업 완료 ({job_id}): {result_path}")
+        return True
+
+    def run(self, max_jobs: Optional[int] = None, exit_when_empty: bool = False) -> int:
+        """
+        작업 루프 실행.
+
+        Args:
+            max_jobs: 처리할 최대 작업 수 (None이면 무제한)
+            exit_when_empty: 큐가 비면 종료
+
+        Returns:
+            처리한 작업 수
+        """
+        processed = 0
+        print(f"👷 워커 시작: {self.worker_id} (큐: {self.queue.db_path})")
+
+        while not self._stop.is_set():
+            if max_jobs is not None and processed >= max_jobs:
+                break
+
+            job = self.queue.claim(self.worker_id, self.lease_seconds)
+            if job is None:
+                if exit_when_empty:
+                    break
+                self._stop.wait(self.poll_interval)
+                continue
+
+            print(f"\n📥 작업 시작: {job['id']} ({Path(job['pdf_path']).name}, 시도 {job['attempts']}회차)")
+            self.process(job)
+            processed += 1
+
+        return processed
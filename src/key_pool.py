@@ -0,0 +1,198 @@
+"""
+API Key Pool
+같은 프로바이더의 API 키 여러 개에 요청을 나눠 처리량을 키 수만큼 늘리기
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional, List, Dict, Any
+
+
+class KeyPoolExhausted(RuntimeError):
+    """사용할 수 있는 API 키가 없음 (모두 인증/할당량 오류로 제외됨)."""
+
+
+class KeyPool:
+    """
+    API 키 풀.
+
+    요청마다 여유가 가장 큰 키를 고릅니다. 여유는 키별 분당 요청 한도(rpm)에서 최근 1분간 보낸
+    요청 수를 뺀 값이며, 같으면 처리 중인 요청이 적은 키를 씁니다 (여러 프로세스가 같은 키 목록을
+    써도 겹치지 않도록 동점이면 무작위). 속도 제한(429)을 받은 키는 잠시 쉬게 하고(연속될수록 길게),
+    인증 오류나 할당량 소진이 확인된 키는 풀에서 제외합니다.
+    """
+
+    WINDOW_SECONDS = 60.0
+    COOLDOWN_SECONDS = 5.0       # 첫 속도 제한 후 대기 시간
+    MAX_COOLDOWN_SECONDS = 120.0
+
+    def __init__(self, keys: List[str], rpm: Optional[int] = None):
+        """
+        Args:
+            keys: API 키 목록 (중복은 제거)
+            rpm: 키별 분당 요청 한도 (None이면 제한 없이 고르게 분배)
+        """
+        keys = list(dict.fromkeys(k for k in keys if k))
+        if not keys:
+            raise ValueError("API 키가 하나 이상 필요합니다.")
+        self.keys = keys
+        self.rpm = rpm
+        self._state: Dict[str, Dict[str, Any]] = {
+            key: {
+                'recent': deque(),    # 최근 요청 시각
+                'in_flight': 0,
+                'cooldown_until': 0.0,
+                'strikes': 0,         # 연속 속도 제한 횟수
+                'disabled': None,     # 제외 사유
+                'requests': 0,
+                'errors': 0,
+            }
+            for key in keys
+        }
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def active_keys(self) -> List[str]:
+        """풀에서 제외되지 않은 키."""
+        return [k for k in self.keys if not self._state[k]['disabled']]
+
+    def _headroom(self, state: Dict[str, Any], now: float) -> Optional[int]:
+        """최근 1분 기준 남은 요청 수 (한도가 없으면 None)."""
+        recent = state['recent']
+        while recent and recent[0] <= now - self.WINDOW_SECONDS:
+            recent.popleft()
+        if self.rpm:
+            return self.rpm - len(recent)
+        return None
+
+    def acquire(self, timeout: Optional[float] = None) -> str:
+        """
+        요청에 쓸 키 하나 빌리기 (release로 반납).
+
+        모든 키가 쉬는 중이거나 한도에 도달했으면 여유가 생길 때까지 기다립니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            API 키
+
+        Raises:
+            KeyPoolExhausted: 남은 키가 없거나 timeout 안에 여유가 생기지 않음
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._cond:
+            while True:
+                now = time.time()
+                candidates = []
+                wake = []
+                for key in self.keys:
+                    state = self._state[key]
+                    if state['disabled']:
+                        continue
+                    if state['cooldown_until'] > now:
+                        wake.append(state['cooldown_until'])
+                        continue
+                    headroom = self._headroom(state, now)
+                    if headroom is not None and headroom <= 0:
+                        wake.append(state['recent'][0] + self.WINDOW_SECONDS)
+                        continue
+                    candidates.append((
+                        headroom or 0,
+                        -state['in_flight'],
+                        -len(state['recent']),
+                        random.random(),
+                        key
+                    ))
+
+                if candidates:
+                    key = max(candidates)[-1]
+                    state = self._state[key]
+                    state['in_flight'] += 1
+                    state['recent'].append(now)
+                    state['requests'] += 1
+                    return key
+
+                if not self.active_keys:
+                    reasons = ', '.join(f"{self.mask(k)}: {self._state[k]['disabled']}" for k in self.keys)
+                    raise KeyPoolExhausted(f"사용할 수 있는 API 키가 없습니다 ({reasons})")
+
+                # 가장 먼저 여유가 생기는 시각까지 대기 (release 시에도 깨어남)
+                wait = (min(wake) - now) if wake else 1.0
+                if deadline is not None:
+                    if now >= deadline:
+                        raise KeyPoolExhausted("API 키 여유를 기다리다 시간이 초과되었습니다.")
+                    wait = min(wait, deadline - now)
+                self._cond.wait(max(0.05, wait))
+
+    def release(self, key: str, error: Optional[str] = None):
+        """
+        빌린 키 반납.
+
+        Args:
+            key: acquire로 받은 키
+            error: 요청 결과 분류 (None: 성공 또는 키와 무관한 오류,
+                'rate_limit': 잠시 쉬게 함, 'auth' / 'quota': 풀에서 제외)
+        """
+        with self._cond:
+            state = self._state[key]
+            state['in_flight'] = max(0, state['in_flight'] - 1)
+            if error == 'rate_limit':
+                state['errors'] += 1
+                state['strikes'] += 1
+                cooldown = min(self.MAX_COOLDOWN_SECONDS, self.COOLDOWN_SECONDS * 2 ** (state['strikes'] - 1))
+                state['cooldown_until'] = time.time() + cooldown
+                print(f"  ⏳ API 키 {self.mask(key)} 속도 제한 → {cooldown:.0f}초 휴식")
+            elif error in ('auth', 'quota'):
+                state['errors'] += 1
+                state['disabled'] = '인증 오류' if error == 'auth' else '할당량 소진'
+                print(f"  🚫 API 키 {self.mask(key)} 제외 ({state['disabled']}), 남은 키 {len(self.active_keys)}개")
+            else:
+                state['strikes'] = 0
+            self._cond.notify_all()
+
+    def status(self) -> List[Dict[str, Any]]:
+        """키별 상태 (키는 마스킹)."""
+        now = time.time()
+        with self._cond:
+            return [
+                {
+                    'key': self.mask(key),
+                    'requests': state['requests'],
+                    'errors': state['errors'],
+                    'in_flight': state['in_flight'],
+                    'cooling': state['cooldown_until'] > now,
+                    'disabled': state['disabled'],
+                }
+                for key, state in self._state.items()
+            ]
+
+    @staticmethod
+    def mask(key: str) -> str:
+        """로그용 키 표시 (끝 4자리만)."""
+        return f"…{key[-4:]}" if len(key) > 4 else '…'
+
+
+def split_keys(value) -> List[str]:
+    """
+    API 키 입력을 목록으로 변환.
+
+    Args:
+        value: 키 하나, 쉼표로 구분한 여러 키, 또는 그 리스트
+
+    Returns:
+        키 리스트 (빈 값 제외, 순서 유지)
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    keys = []
+    for item in value:
+        keys.extend(k.strip() for k in item.split(',') if k.strip())
+    return list(dict.fromkeys(keys))
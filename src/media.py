@@ -0,0 +1,78 @@
+"""
+Slide Media Encoding
+슬라이드 이미지 인코딩 정책 (PNG / 최적화 PNG / 팔레트 PNG / JPEG / 자동 선택)
+"""
+
+import io
+from PIL import Image
+
+# - png: 기본 PNG (가장 빠름)
+# - png-optimized: 무손실 PNG, 압축 최적화 (느리지만 더 작음)
+# - palette: 256색 팔레트 PNG (단색 위주 그래픽/텍스트 슬라이드에 적합)
+# - jpeg: JPEG (사진 위주 슬라이드에 적합)
+# - auto: 슬라이드마다 사진형이면 JPEG, 아니면 팔레트 PNG
+MEDIA_FORMATS = ('png', 'png-optimized', 'palette', 'jpeg', 'auto')
+
+# 사진형 판정용 축소 크기와 기준
+_ANALYSIS_SIZE = (256, 144)
+_TOP_COLORS = 32
+_FLAT_MIN_COVERAGE = 0.6
+
+
+def is_photo_like(image: Image.Image) -> bool:
+    """
+    사진형(연속 톤) 슬라이드인지 판정.
+
+    단색 배경, 도형, 텍스트 위주 슬라이드는 소수의 색이 대부분의 면적을 차지합니다.
+    축소본에서 상위 _TOP_COLORS개 색이 차지하는 비율이 _FLAT_MIN_COVERAGE 미만이면
+    사진형으로 봅니다.
+
+    Args:
+        image: 슬라이드 이미지
+
+    Returns:
+        사진형 여부
+    """
+    small = image.convert('RGB').resize(_ANALYSIS_SIZE, Image.NEAREST)
+    colors = small.getcolors(maxcolors=_ANALYSIS_SIZE[0] * _ANALYSIS_SIZE[1])
+    counts = sorted((count for count, _ in colors), reverse=True)
+    coverage = sum(counts[:_TOP_COLORS]) / (_ANALYSIS_SIZE[0] * _ANALYSIS_SIZE[1])
+    return coverage < _FLAT_MIN_COVERAGE
+
+
+def resolve_format(image: Image.Image, media_format: str) -> str:
+    """'auto'를 실제 형식('jpeg' 또는 'palette')으로 결정."""
+    if media_format != 'auto':
+        return media_format
+    return 'jpeg' if is_photo_like(image) else 'palette'
+
+
+def encode_image(image: Image.Image, media_format: str = 'png', jpeg_quality: int = 85) -> bytes:
+    """
+    정책에 따라 슬라이드 이미지 인코딩.
+
+    Args:
+        image: 슬라이드 이미지
+        media_format: MEDIA_FORMATS 중 하나
+        jpeg_quality: JPEG 품질 (1~95)
+
+    Returns:
+        인코딩된 이미지 바이트 (PNG 또는 JPEG)
+    """
+    if media_format not in MEDIA_FORMATS:
+        raise ValueError(f"지원하지 않는 미디어 형식: {media_format}. 사용 가능: {list(MEDIA_FORMATS)}")
+
+    media_format = resolve_format(image, media_format)
+    buffer = io.BytesIO()
+
+    if media_format == 'jpeg':
+        image.convert('RGB').save(buffer, 'JPEG', quality=jpeg_quality, optimize=True)
+    elif media_format == 'palette':
+        palette = image.convert('RGB').quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+        palette.save(buffer, 'PNG', optimize=True)
+    elif media_format == 'png-optimized':
+        image.save(buffer, 'PNG', optimize=True)
+    else:
+        image.save(buffer, 'PNG')
+
+    return buffer.getvalue()
@@ -0,0 +1,156 @@
+"""
+Native Text Reconstruction
+PDF 텍스트 레이어를 편집 가능한 PPTX 텍스트 상자로 복원하고, 배경은 텍스트를 지운 이미지로 렌더링
+"""
+
+from pathlib import Path
+from typing import Optional, Union, List, Dict, Any, Iterator, Tuple
+from PIL import Image
+
+from .pptx_writer import MIN_FONT_SIZE, MAX_FONT_SIZE
+
+# 좌우 방향(가로쓰기)이 아닌 줄은 배경 이미지에 그대로 남김
+_HORIZONTAL = (1.0, 0.0)
+
+# PyMuPDF span flags
+_FLAG_ITALIC = 2
+_FLAG_BOLD = 16
+
+
+def _visible(span: Dict[str, Any]) -> bool:
+    """
+    화면에 보이는 span인지.
+
+    크기가 0이거나, 렌더 모드 3(보이지 않는 텍스트, OCR 레이어 등) 또는 완전 투명이라
+    PyMuPDF가 alpha 0으로 알려준 글자는 텍스트 상자로 만들지 않습니다.
+    """
+    return bool(span['text']) and span['size'] > 0 and span.get('alpha', 255) > 0
+
+
+def clean_font_name(name: str) -> str:
+    """
+    PDF 폰트 이름을 PowerPoint에서 쓸 수 있는 이름으로 정리.
+
+    서브셋 접두사(ABCDEF+)와 스타일 접미사(-Bold, -Regular 등)를 제거합니다.
+    """
+    name = name.split('+')[-1]
+    return name.split('-')[0] or name
+
+
+def extract_text_boxes(page, slide_width: int, slide_height: int) -> List[Dict[str, Any]]:
+    """
+    페이지의 가로쓰기 텍스트를 줄 단위 텍스트 상자로 추출.
+
+    Args:
+        page: PyMuPDF 페이지
+        slide_width: 슬라이드 가로 (EMU)
+        slide_height: 슬라이드 세로 (EMU)
+
+    Returns:
+        텍스트 상자 리스트. 각 항목은
+        {'left', 'top', 'width', 'height': EMU, 'bbox': PDF 좌표,
+         'runs': [{'text', 'font', 'size'(pt), 'bold', 'italic', 'color'(RRGGBB)}]}
+    """
+    rect = page.rect
+    scale_x = slide_width / rect.width
+    scale_y = slide_height / rect.height
+    # 글자 크기는 슬라이드 가로 기준 비율로 환산 (EMU → pt: 12700)
+    font_scale = slide_width / 12700 / rect.width
+
+    boxes = []
+    for block in page.get_text('dict')['blocks']:
+        if block['type'] != 0:
+            continue
+        for line in block['lines']:
+            if tuple(round(v, 3) for v in line['dir']) != _HORIZONTAL:
+                continue
+
+            runs = [
+                {
+                    'text': span['text'],
+                    'font': clean_font_name(span['font']),
+                    'size': round(min(max(span['size'] * font_scale, MIN_FONT_SIZE), MAX_FONT_SIZE), 1),
+                    'bold': bool(span['flags'] & _FLAG_BOLD),
+                    'italic': bool(span['flags'] & _FLAG_ITALIC),
+                    'color': f"{span['color']:06X}",
+                }
+                for span in line['spans']
+                if _visible(span)
+            ]
+            if not ''.join(r['text'] for r in runs).strip():
+                continue
+
+            x0, y0, x1, y1 = line['bbox']
+            boxes.append({
+                'left': int(max(0, x0 - rect.x0) * scale_x),
+                'top': int(max(0, y0 - rect.y0) * scale_y),
+                'width': max(1, int((x1 - x0) * scale_x)),
+                'height': max(1, int((y1 - y0) * scale_y)),
+                'bbox': (x0, y0, x1, y1),
+                'runs': runs,
+            })
+
+    return boxes
+
+
+def render_background(page, size: Tuple[int, int], boxes: List[Dict[str, Any]]) -> Image.Image:
+    """
+    복원한 텍스트를 지운 배경 이미지 렌더링.
+
+    이미지와 벡터 도형은 남기고 텍스트 상자로 옮긴 글자만 제거합니다
+    (페이지는 메모리에서만 수정되며 파일에는 저장되지 않음).
+
+    Args:
+        page: PyMuPDF 페이지
+        size: (가로, 세로) 픽셀
+        boxes: extract_text_boxes 결과
+
+    Returns:
+        배경 이미지
+    """
+    import fitz  # PyMuPDF
+
+    if boxes:
+        for box in boxes:
+            page.add_redact_annot(fitz.Rect(box['bbox']), fill=False)
+        page.apply_redactions(
+            images=fitz.PDF_REDACT_IMAGE_NONE,
+            graphics=fitz.PDF_REDACT_LINE_ART_NONE
+        )
+
+    rect = page.rect
+    matrix = fitz.Matrix(size[0] / rect.width, size[1] / rect.height)
+    pixmap = page.get_pixmap(matrix=matrix, alpha=False)
+    return Image.frombytes('RGB', (pixmap.width, pixmap.height), pixmap.samples)
+
+
+def iter_native_pages(
+    pdf_path: Union[str, Path],
+    size: Tuple[int, int],
+    slide_width: int,
+    slide_height: int,
+    page_range: Optional[Tuple[int, int]] = None
+) -> Iterator[Tuple[Image.Image, List[Dict[str, Any]]]]:
+    """
+    페이지마다 (텍스트를 지운 배경 이미지, 텍스트 상자) 를 순서대로 내놓기.
+
+    Args:
+        pdf_path: PDF 파일 경로
+        size: 배경 이미지 (가로, 세로) 픽셀
+        slide_width: 슬라이드 가로 (EMU)
+        slide_height: 슬라이드 세로 (EMU)
+        page_range: (첫 페이지, 마지막 페이지) (1부터, None이면 전체)
+
+    Yields:
+        (배경 이미지, 텍스트 상자 리스트)
+    """
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(str(pdf_path))
+    try:
+        pages = doc.pages(page_range[0] - 1, page_range[1]) if page_range else doc
+        for page in pages:
+            boxes = extract_text_boxes(page, slide_width, slide_height)
+            yield render_background(page, size, boxes), boxes
+    finally:
+        doc.close()
@@ -0,0 +1,106 @@
+"""
+Rendered Page Cache
+렌더링한 페이지 이미지(Poppler 출력 바이트)를 (PDF 내용 해시, 렌더링 설정) 기준으로 디스크에 캐시
+"""
+
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional, Union, Dict, Any
+
+from .cache import get_cache_dir, text_sha256
+
+
+class PageCache:
+    """
+    크기 제한이 있는 렌더링 페이지 캐시.
+
+    항목은 {캐시 디렉터리}/{키}/{페이지 번호} 파일로 저장됩니다. 읽을 때마다 mtime을 갱신하고,
+    전체 크기가 max_size_mb를 넘으면 가장 오래 사용하지 않은 페이지부터 지웁니다 (LRU).
+    """
+
+    def __init__(self, max_size_mb: float = 512, directory: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            max_size_mb: 캐시 최대 크기 (MB)
+            directory: 캐시 디렉터리 (None이면 캐시 루트의 'pages')
+        """
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.directory = Path(directory) if directory else get_cache_dir('pages')
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def key(self, pdf_hash: str, settings: Dict[str, Any]) -> str:
+        """PDF 내용 해시와 렌더링 설정으로 캐시 키 생성."""
+        return text_sha256(pdf_hash, json.dumps(settings, sort_keys=True))
+
+    def _path(self, key: str, page: int) -> Path:
+        return self.directory / key / f"{page:05d}"
+
+    def get(self, key: str, page: int) -> Optional[bytes]:
+        """캐시된 페이지 바이트 (없으면 None)."""
+        path = self._path(key, page)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # LRU 순서 갱신
+        except OSError:
+            pass
+        return data
+
+    def put_many(self, key: str, pages: Dict[int, bytes]):
+        """
+        페이지 여러 장 저장 후 한 번만 정리.
+
+        Args:
+            key: 캐시 키
+            pages: {페이지 번호: 이미지 바이트}
+        """
+        if not pages:
+            return
+        (self.directory / key).mkdir(parents=True, exist_ok=True)
+        for page, data in pages.items():
+            path = self._path(key, page)
+            tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        self.evict()
+
+    def size(self) -> int:
+        """현재 캐시 크기 (바이트)."""
+        return sum(f.stat().st_size for f in self.directory.glob('*/*') if f.is_file())
+
+    def evict(self):
+        """전체 크기가 max_size 이하가 될 때까지 오래된 페이지부터 삭제."""
+        with self._lock:
+            entries = []
+            for path in self.directory.glob('*/*'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_size:
+                return
+
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_size:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                except FileNotFoundError:
+                    continue
+
+            for folder in self.directory.iterdir():
+                try:
+                    if folder.is_dir() and not any(folder.iterdir()):
+                        folder.rmdir()
+                except OSError:
+                    continue
@@ -0,0 +1,203 @@
+"""
+Conversion Planner
+변환 전에 렌더링 없이 토큰 사용량, 비용, 소요 시간을 예측 (nb2pptx --plan)
+"""
+
+import json
+import math
+import statistics
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
+
+from .cache import get_cache_dir
+
+# 텍스트 토큰 환산 (한국어/영어가 섞인 프롬프트의 대략적인 글자 수 / 토큰)
+CHARS_PER_TOKEN = 2.0
+
+# 이전 실행 기록이 없을 때의 기본값
+DEFAULT_OUTPUT_TOKENS = 700     # 2~3분 분량 노트
+DEFAULT_NOTES_SECONDS = 10.0    # 슬라이드 하나의 노트 생성 시간
+DEFAULT_OVERHEAD_SECONDS = 0.3  # 슬라이드 하나의 렌더링/인코딩/저장 시간
+
+# 실행 기록 파일 (캐시 루트의 'metrics' 아래, 최근 항목만 유지)
+HISTORY_FILE = 'runs.jsonl'
+HISTORY_LIMIT = 200
+# 예측에 사용할 최근 실행 수
+HISTORY_WINDOW = 20
+
+
+def estimate_text_tokens(chars: int) -> int:
+    """글자 수로 텍스트 토큰 수 추정."""
+    return math.ceil(chars / CHARS_PER_TOKEN)
+
+
+def _history_path() -> Path:
+    return get_cache_dir('metrics') / HISTORY_FILE
+
+
+def record_run(report, wall_seconds: float):
+    """
+    변환 실행 결과를 예측용 기록에 추가.
+
+    Args:
+        report: 변환의 RunReport
+        wall_seconds: convert() 전체 소요 시간 (맥락 자료, 렌더링, 저장 포함)
+    """
+    records = list(report.slides.values())
+    ok = [r for r in records if r.get('status') == 'ok' and 'seconds' in r]
+    with_usage = [r for r in ok if 'output_tokens' in r]
+    total = report.total_slides or len(records)
+    if not total:
+        return
+
+    entry = {
+        'timestamp': round(time.time(), 3),
+        'provider': report.provider,
+        'model': report.model,
+        'slides': total,
+        'ai_slides': len(ok),
+        # AI 요청을 뺀 슬라이드당 시간 (렌더링, 인코딩, 저장 등)
+        'overhead_seconds': round(max(0.0, wall_seconds - sum(r['seconds'] for r in ok)) / total, 3),
+        'notes_seconds': round(statistics.mean(r['seconds'] for r in ok), 3) if ok else None,
+        'input_tokens': round(statistics.mean(r['input_tokens'] for r in with_usage)) if with_usage else None,
+        'output_tokens': round(statistics.mean(r['output_tokens'] for r in with_usage)) if with_usage else None,
+    }
+
+    path = _history_path()
+    try:
+        lines = path.read_text(encoding='utf-8').splitlines() if path.exists() else []
+        lines = lines[-(HISTORY_LIMIT - 1):] + [json.dumps(entry, ensure_ascii=False)]
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        tmp.replace(path)
+    except OSError as e:
+        print(f"⚠️ 실행 기록 저장 실패: {e}")
+
+
+def load_history() -> List[Dict[str, Any]]:
+    """저장된 실행 기록 (오래된 순)."""
+    path = _history_path()
+    if not path.exists():
+        return []
+    entries = []
+    for line in path.read_text(encoding='utf-8').splitlines():
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return entries
+
+
+def observed_rates(provider: str, model: str) -> Dict[str, Any]:
+    """
+    최근 실행 기록에서 측정한 속도와 출력 토큰 수.
+
+    노트 생성 시간과 출력 토큰은 같은 프로바이더/모델 기록만, 슬라이드당 부가 시간은
+    모든 기록을 사용합니다. 기록이 없으면 기본값을 돌려줍니다.
+
+    Returns:
+        {'notes_seconds', 'overhead_seconds', 'output_tokens', 'runs'}
+    """
+    history = load_history()
+    same = [e for e in history if e.get('provider') == provider and e.get('model') == model]
+    same = same[-HISTORY_WINDOW:]
+
+    def median(entries, key, default):
+        values = [e[key] for e in entries if e.get(key) is not None]
+        return statistics.median(values) if values else default
+
+    return {
+        'notes_seconds': median(same, 'notes_seconds', DEFAULT_NOTES_SECONDS),
+        'overhead_seconds': median(history[-HISTORY_WINDOW:], 'overhead_seconds', DEFAULT_OVERHEAD_SECONDS),
+        'output_tokens': median(same, 'output_tokens', DEFAULT_OUTPUT_TOKENS),
+        'runs': sum(1 for e in same if e.get('notes_seconds') is not None),
+    }
+
+
+@dataclass
+class ConversionPlan:
+    """변환 예측 결과 (모든 값은 추정치)."""
+
+    pdf: str
+    pages: int
+    provider: str
+    models: List[str]
+    generate_notes: bool
+    # 슬라이드 이미지 크기: {"가로x세로": 페이지 수}
+    image_sizes: Dict[str, int] = field(default_factory=dict)
+    image_tokens: int = 0           # 슬라이드당 이미지 토큰 (평균)
+    prompt_tokens: int = 0          # 슬라이드당 지시문 토큰
+    context_chars: int = 0          # 맥락 자료 글자 수 (추출 결과)
+    context_tokens: int = 0         # 슬라이드당 맥락 토큰 (요약 사용 시 요약본 기준)
+    digest_tokens: Tuple[int, int] = (0, 0)  # 맥락 요약 1회 (입력, 출력)
+    output_tokens: int = 0          # 슬라이드당 출력 토큰
+    input_tokens_total: int = 0
+    output_tokens_total: int = 0
+    cost_usd: Dict[str, Optional[float]] = field(default_factory=dict)  # 모델별 예상 비용
+    notes_seconds: float = 0.0      # 슬라이드당 노트 생성 시간
+    overhead_seconds: float = 0.0   # 슬라이드당 렌더링/인코딩/저장 시간
+    history_runs: int = 0           # 예측에 사용한 이전 실행 수
+    key_concurrency: int = 1        # convert 한 번이 실제로 보내는 동시 요청 수 (키 풀의 키 수)
+    concurrency: int = 1            # 함께 예측할 병렬 실행 수 (샤드/워커로 나눠 실행)
+    wall_seconds: Dict[int, float] = field(default_factory=dict)  # {동시 요청 수: 예상 소요 시간}
+    notes: List[str] = field(default_factory=list)  # 추정의 한계
+
+    def estimate_wall_seconds(self, concurrency: int) -> float:
+        """동시 요청 수에 따른 예상 소요 시간 (초)."""
+        seconds = self.pages * self.overhead_seconds
+        if self.generate_notes:
+            seconds += math.ceil(self.pages / max(1, concurrency)) * self.notes_seconds
+            if self.digest_tokens[0]:
+                seconds += self.notes_seconds
+        return round(seconds, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리."""
+        return asdict(self)
+
+    def print_summary(self):
+        """예측 결과를 콘솔에 출력."""
+        print(f"🧮 변환 예측: {self.pdf} ({self.pages}페이지)")
+        sizes = ', '.join(f"{size} ×{count}" for size, count in self.image_sizes.items())
+        print(f"   🖼️ 슬라이드 이미지: {sizes}")
+        if not self.generate_notes:
+            print(f"   🤖 AI: 사용 안 함 (토큰/비용 없음)")
+        else:
+            print(f"   🤖 AI: {self.provider} ({', '.join(self.models)})")
+            print(f"   🔢 슬라이드당 입력 약 {self.image_tokens + self.prompt_tokens + self.context_tokens:,} 토큰"
+                  f" (이미지 {self.image_tokens:,} + 지시문 {self.prompt_tokens:,} + 맥락 {self.context_tokens:,}),"
+                  f" 출력 약 {self.output_tokens:,} 토큰")
+            if self.context_chars:
+                print(f"   📚 맥락 자료: {self.context_chars:,}자")
+            if self.digest_tokens[0]:
+                print(f"   🗜️ 맥락 요약 1회: 입력 {self.digest_tokens[0]:,} / 출력 {self.digest_tokens[1]:,} 토큰")
+            print(f"   Σ 전체 토큰: 입력 {self.input_tokens_total:,} / 출력 {self.output_tokens_total:,}")
+            for model, cost in self.cost_usd.items():
+                print(f"   💵 {model}: " + (f"약 ${cost:,.2f}" if cost is not None else "가격 정보 없음"))
+
+        basis = f"최근 {self.history_runs}회 실행 기준" if self.history_runs else "이전 실행 기록 없음, 기본값"
+        print(f"   ⏱️ 예상 소요 시간 ({basis}: 슬라이드당 노트 {self.notes_seconds:.1f}초"
+              f" + 처리 {self.overhead_seconds:.2f}초)")
+        for concurrency, seconds in self.wall_seconds.items():
+            if concurrency == 1:
+                label = "순차 변환"
+            elif concurrency == self.key_concurrency:
+                label = f"API 키 {concurrency}개 동시 요청"
+            else:
+                # convert 한 번으로는 이만큼 동시에 요청하지 않음
+                label = f"샤드/워커 {concurrency}개 병렬 (--shard, watch --workers, 큐 워커)"
+            print(f"      {label}: {_format_duration(seconds)}")
+        for note in self.notes:
+            print(f"   ℹ️ {note}")
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
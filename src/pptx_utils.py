@@ -0,0 +1,154 @@
+"""
+PPTX Helpers
+기존 PPTX에서 풀슬라이드 이미지와 스피커 노트를 읽고 쓰는 유틸리티
+"""
+
+import os
+import zipfile
+from pathlib import Path
+from typing import Optional, Union, IO, List, Dict, Any
+
+# 이미 압축된 미디어는 zip에서 다시 deflate하지 않고 그대로 저장
+STORED_EXTENSIONS = ('.png', '.jpeg', '.jpg', '.gif')
+
+
+def zip_compression(member_name: str) -> int:
+    """zip 멤버의 압축 방식 (압축된 미디어는 STORED, 나머지는 DEFLATED)."""
+    if member_name.lower().endswith(STORED_EXTENSIONS):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def slide_picture_blob(slide) -> Optional[bytes]:
+    """슬라이드의 첫 번째 그림(풀슬라이드 이미지) 바이트 (없으면 None)."""
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+    for shape in slide.shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            return shape.image.blob
+    return None
+
+
+def slide_notes_text(slide) -> str:
+    """슬라이드 스피커 노트 텍스트 (노트 슬라이드가 없으면 빈 문자열)."""
+    if not slide.has_notes_slide:
+        return ''
+    return slide.notes_slide.notes_text_frame.text
+
+
+def slide_text_boxes(slide) -> List[Dict[str, Any]]:
+    """
+    슬라이드의 텍스트 상자를 native_text.extract_text_boxes 형식으로 읽기.
+
+    PPTX writer가 만든 텍스트 상자(문단 하나, 런마다 서식 지정)를 그대로 다시 쓸 수 있게 합니다.
+    """
+    boxes = []
+    for shape in slide.shapes:
+        if shape.is_placeholder or not shape.has_text_frame:
+            continue
+        runs = []
+        for paragraph in shape.text_frame.paragraphs:
+            for run in paragraph.runs:
+                font = run.font
+                try:
+                    color = str(font.color.rgb or '000000')
+                except AttributeError:
+                    color = '000000'
+                runs.append({
+                    'text': run.text,
+                    'font': font.name or '',
+                    'size': font.size.pt if font.size else 18.0,
+                    'bold': bool(font.bold),
+                    'italic': bool(font.italic),
+                    'color': color,
+                })
+        if runs:
+            boxes.append({
+                'left': shape.left, 'top': shape.top,
+                'width': shape.width, 'height': shape.height,
+                'runs': runs,
+            })
+    return boxes
+
+
+class _MediaAwareZipWriter:
+    """python-pptx 물리 패키지 writer 대체: 멤버마다 zip_compression 적용."""
+
+    def __init__(self, pkg_file: Union[str, IO[bytes]]):
+        self._zipf = zipfile.ZipFile(pkg_file, 'w', zipfile.ZIP_DEFLATED, strict_timestamps=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._zipf.close()
+
+    def write(self, pack_uri, blob: bytes):
+        name = pack_uri.membername
+        self._zipf.writestr(name, blob, compress_type=zip_compression(name))
+
+
+# 빠른 저장 경로가 재정의하는 python-pptx PackageWriter 내부 메서드 (1.x에서 확인)
+_PACKAGE_WRITER_STEPS = ('_write_content_types_stream', '_write_pkg_rels', '_write_parts')
+
+
+def _fast_save_supported() -> bool:
+    """빠른 저장 경로가 의존하는 python-pptx 내부 구조가 확인한 버전과 같은지."""
+    try:
+        import pptx
+        from pptx.opc.serialized import PackageWriter
+    except ImportError:
+        return False
+    return (
+        pptx.__version__.split('.')[0] == '1'
+        and all(callable(getattr(PackageWriter, name, None)) for name in _PACKAGE_WRITER_STEPS)
+    )
+
+
+def save_presentation(prs, pkg_file: Union[str, Path, IO[bytes]]):
+    """
+    프레젠테이션 저장 (이미지 파트는 deflate 없이 저장).
+
+    python-pptx의 prs.save()는 이미 압축된 PNG/JPEG까지 다시 deflate합니다.
+    패키지 직렬화는 python-pptx PackageWriter를 그대로 쓰고 zip 기록만 바꿉니다.
+    이 경로는 python-pptx 내부 API에 의존하므로 확인한 1.x에서만 사용하고, 다른 버전이거나
+    어떤 이유로든 실패하면 공개 API인 prs.save()로 저장합니다.
+    """
+    if isinstance(pkg_file, Path):
+        pkg_file = str(pkg_file)
+    if not _fast_save_supported():
+        prs.save(pkg_file)
+        return
+    # 스트림이면 실패 시 기록한 부분을 지우고 처음부터 다시 저장
+    start = None if isinstance(pkg_file, str) else pkg_file.tell()
+
+    try:
+        from pptx.opc.serialized import PackageWriter
+
+        class _Writer(PackageWriter):
+            def _write(self):
+                with _MediaAwareZipWriter(self._pkg_file) as phys_writer:
+                    self._write_content_types_stream(phys_writer)
+                    self._write_pkg_rels(phys_writer)
+                    self._write_parts(phys_writer)
+
+        package = prs.part.package
+        _Writer.write(pkg_file, package._rels, tuple(package.iter_parts()))
+    except Exception:
+        if start is not None:
+            pkg_file.seek(start)
+            pkg_file.truncate()
+        prs.save(pkg_file)
+
+
+def save_atomic(prs, output_path: Union[str, Path]) -> Path:
+    """임시 파일에 저장한 뒤 교체 (저장 중 실패해도 기존 파일 보존, 임시 파일은 삭제)."""
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        save_presentation(prs, tmp_path)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return output_path
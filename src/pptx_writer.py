@@ -0,0 +1,425 @@
+"""
+PPTX Writers
+풀슬라이드 이미지 + 스피커 노트 슬라이드를 PPTX로 저장하는 writer
+
+- PresentationWriter: python-pptx로 메모리에 덱 전체를 만든 뒤 한 번에 저장 (기본)
+- StreamingPptxWriter: 슬라이드가 완성될 때마다 zip에 바로 기록 (대용량 덱용)
+
+두 writer는 같은 인터페이스(add_slide, mark_partial, mark_shard, close, abort)를 가집니다.
+"""
+
+import hashlib
+import io
+import os
+import re
+import zipfile
+from pathlib import Path
+from typing import Optional, Union, Dict, List, Any
+from xml.sax.saxutils import escape
+
+from .pptx_utils import save_presentation, zip_compression
+
+NS_P = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+NS_R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+NS_PKG_RELS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+NS_CT = 'http://schemas.openxmlformats.org/package/2006/content-types'
+NS_CORE = 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties'
+NS_DC = 'http://purl.org/dc/elements/1.1/'
+
+RT_SLIDE = f'{NS_R}/slide'
+RT_SLIDE_LAYOUT = f'{NS_R}/slideLayout'
+RT_NOTES_SLIDE = f'{NS_R}/notesSlide'
+RT_NOTES_MASTER = f'{NS_R}/notesMaster'
+RT_IMAGE = f'{NS_R}/image'
+
+CT_SLIDE = 'application/vnd.openxmlformats-officedocument.presentationml.slide+xml'
+CT_NOTES_SLIDE = 'application/vnd.openxmlformats-officedocument.presentationml.notesSlide+xml'
+IMAGE_CONTENT_TYPES = {'png': 'image/png', 'jpeg': 'image/jpeg'}
+
+# python-pptx 기본 템플릿의 빈 슬라이드 레이아웃 (slide_layouts[6])
+BLANK_LAYOUT_PART = 'slideLayout7.xml'
+
+# PowerPoint가 허용하는 글자 크기 범위 (pt, ST_TextFontSize 100~400000 centipoints)
+MIN_FONT_SIZE = 1.0
+MAX_FONT_SIZE = 4000.0
+
+_XML_HEADER = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+# XML 1.0에서 허용되지 않는 제어 문자
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_SLIDE_XML = (
+    _XML_HEADER +
+    '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+    ' xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<p:cSld><p:spTree>'
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>'
+    '<p:pic><p:nvPicPr><p:cNvPr id="2" name="Picture 1"/>'
+    '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+    '<p:blipFill><a:blip r:embed="rId2"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+    '<p:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>'
+    '{shapes}'
+    '</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>'
+)
+
+_NOTES_XML = (
+    _XML_HEADER +
+    '<p:notes xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+    ' xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<p:cSld><p:spTree>'
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Slide Image Placeholder 1"/>'
+    '<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr><p:nvPr><p:ph type="sldImg" idx="2"/></p:nvPr>'
+    '</p:nvSpPr><p:spPr/></p:sp>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="3" name="Notes Placeholder 2"/>'
+    '<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr><p:nvPr><p:ph type="body" idx="3" sz="quarter"/></p:nvPr>'
+    '</p:nvSpPr><p:spPr/><p:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</p:txBody></p:sp>'
+    '</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:notes>'
+)
+
+
+def image_extension(blob: bytes) -> str:
+    """이미지 바이트의 형식 ('png' 또는 'jpeg')."""
+    if blob[:3] == b'\xff\xd8\xff':
+        return 'jpeg'
+    return 'png'
+
+
+def _relationships_xml(rels: List[tuple]) -> str:
+    """(rId, 관계 타입, 대상) 리스트로 .rels XML 생성."""
+    items = ''.join(
+        f'<Relationship Id="{rid}" Type="{rtype}" Target="{target}"/>'
+        for rid, rtype, target in rels
+    )
+    return f'{_XML_HEADER}<Relationships xmlns="{NS_PKG_RELS}">{items}</Relationships>'
+
+
+def font_centipoints(size: float) -> int:
+    """
+    글자 크기(pt)를 허용 범위로 제한해 1/100pt 단위로 변환.
+
+    python-pptx의 Pt(size).centipoints와 같은 값이므로 두 writer의 결과가 같습니다.
+    """
+    size = min(max(size, MIN_FONT_SIZE), MAX_FONT_SIZE)
+    return int(size * 12700) // 127
+
+
+def _text_box_xml(shape_id: int, box: Dict[str, Any]) -> str:
+    """텍스트 상자 하나의 <p:sp> XML (여백/자동 맞춤/줄바꿈 없음)."""
+    runs = []
+    for run in box['runs']:
+        text = _INVALID_XML_CHARS.sub('', run['text'])
+        attrs = f' lang="ko-KR" sz="{font_centipoints(run["size"])}"'
+        if run['bold']:
+            attrs += ' b="1"'
+        if run['italic']:
+            attrs += ' i="1"'
+        font = escape(run['font'], {'"': '&quot;'})
+        runs.append(
+            f'<a:r><a:rPr{attrs} dirty="0"><a:solidFill><a:srgbClr val="{run["color"]}"/></a:solidFill>'
+            f'<a:latin typeface="{font}"/><a:ea typeface="{font}"/></a:rPr>'
+            f'<a:t>{escape(text)}</a:t></a:r>'
+        )
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {shape_id - 1}"/>'
+        '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="{box["left"]}" y="{box["top"]}"/>'
+        f'<a:ext cx="{box["width"]}" cy="{box["height"]}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+        '<p:txBody><a:bodyPr wrap="none" lIns="0" tIns="0" rIns="0" bIns="0"><a:noAutofit/></a:bodyPr>'
+        f'<a:lstStyle/><a:p>{"".join(runs)}</a:p></p:txBody></p:sp>'
+    )
+
+
+def _notes_paragraphs(notes: str) -> str:
+    """노트 텍스트를 줄 단위 문단 XML로 변환 (python-pptx text_frame.text와 같은 규칙)."""
+    paragraphs = []
+    for line in notes.split('\n'):
+        line = _INVALID_XML_CHARS.sub('', line)
+        if line:
+            paragraphs.append(f'<a:p><a:r><a:t>{escape(line)}</a:t></a:r></a:p>')
+        else:
+            paragraphs.append('<a:p/>')
+    return ''.join(paragraphs)
+
+
+# 기한 초과 등으로 노트가 일부만 채워진 덱의 문서 속성 (core.xml contentStatus)
+PARTIAL_STATUS = 'partial'
+
+
+class PresentationWriter:
+    """python-pptx로 메모리에 덱을 만든 뒤 close()에서 한 번에 저장."""
+
+    def __init__(self, output_path: Union[str, Path], slide_width: int, slide_height: int):
+        """
+        Args:
+            output_path: 출력 PPTX 경로
+            slide_width: 슬라이드 가로 (EMU)
+            slide_height: 슬라이드 세로 (EMU)
+        """
+        from pptx import Presentation
+
+        self.output_path = Path(output_path)
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+        self._prs = Presentation()
+        self._prs.slide_width = slide_width
+        self._prs.slide_height = slide_height
+        self._layout = self._prs.slide_layouts[6]  # 빈 슬라이드
+
+    def add_slide(
+        self,
+        image_blob: bytes,
+        notes: Optional[str] = None,
+        text_boxes: Optional[List[Dict[str, Any]]] = None
+    ):
+        """풀슬라이드 이미지, 노트, 텍스트 상자(native_text.extract_text_boxes 형식)로 슬라이드 추가."""
+        from pptx.dml.color import RGBColor
+        from pptx.enum.text import MSO_AUTO_SIZE
+        from pptx.util import Centipoints
+
+        slide = self._prs.slides.add_slide(self._layout)
+        slide.shapes.add_picture(
+            io.BytesIO(image_blob), 0, 0,
+            width=self.slide_width,
+            height=self.slide_height
+        )
+
+        for box in text_boxes or []:
+            shape = slide.shapes.add_textbox(box['left'], box['top'], box['width'], box['height'])
+            frame = shape.text_frame
+            frame.word_wrap = False
+            frame.auto_size = MSO_AUTO_SIZE.NONE
+            frame.margin_left = frame.margin_right = frame.margin_top = frame.margin_bottom = 0
+            paragraph = frame.paragraphs[0]
+            for run in box['runs']:
+                text_run = paragraph.add_run()
+                text_run.text = run['text']
+                text_run.font.name = run['font']
+                text_run.font.size = Centipoints(font_centipoints(run['size']))
+                text_run.font.bold = run['bold']
+                text_run.font.italic = run['italic']
+                text_run.font.color.rgb = RGBColor.from_string(run['color'])
+
+        if notes:
+            slide.notes_slide.notes_text_frame.text = notes
+
+    def mark_partial(self, reason: str):
+        """부분 결과 표시 (문서 속성의 콘텐츠 상태와 설명)."""
+        self._prs.core_properties.content_status = PARTIAL_STATUS
+        self._prs.core_properties.comments = reason
+
+    def mark_shard(self, tag: str):
+        """샤드 표시 (문서 속성의 식별자, sharding.ShardInfo.to_tag 형식)."""
+        self._prs.core_properties.identifier = tag
+
+    def close(self) -> Path:
+        """PPTX 저장 (이미지 파트는 deflate 없이)."""
+        save_presentation(self._prs, self.output_path)
+        return self.output_path
+
+    def abort(self):
+        """저장하지 않고 종료 (메모리 writer는 할 일 없음)."""
+
+
+class StreamingPptxWriter:
+    """
+    슬라이드가 완성될 때마다 PPTX zip에 바로 기록하는 writer.
+
+    슬라이드 XML, 미디어, 노트 파트는 add_slide에서 즉시 기록하고,
+    슬라이드 목록이 들어가는 presentation.xml, 관계(.rels), [Content_Types].xml만
+    close()에서 마지막으로 기록합니다. 메모리 사용량은 덱 전체가 아니라
+    슬라이드 한 장 크기에 비례합니다.
+
+    동일한 이미지는 python-pptx와 마찬가지로 미디어 파트 하나를 공유하고,
+    이미 압축된 이미지는 deflate 없이 저장합니다.
+    임시 파일에 기록한 뒤 close()에서 교체하므로 실패해도 기존 파일은 보존됩니다.
+    """
+
+    def __init__(self, output_path: Union[str, Path], slide_width: int, slide_height: int):
+        """
+        Args:
+            output_path: 출력 PPTX 경로
+            slide_width: 슬라이드 가로 (EMU)
+            slide_height: 슬라이드 세로 (EMU)
+        """
+        self.output_path = Path(output_path)
+        self.slide_width = int(slide_width)
+        self.slide_height = int(slide_height)
+        self._tmp_path = self.output_path.with_name(f".{self.output_path.name}.tmp")
+        self._zip = zipfile.ZipFile(self._tmp_path, 'w', zipfile.ZIP_DEFLATED)
+
+        self._slide_count = 0
+        self._notes_parts: List[int] = []
+        self._media: Dict[str, str] = {}  # SHA-1 → 미디어 파일명
+        self._image_extensions = set()
+        self._partial_reason: Optional[str] = None
+        self._shard_tag: Optional[str] = None
+        self._skeleton = self._build_skeleton()
+
+    def _build_skeleton(self) -> Dict[str, bytes]:
+        """
+        슬라이드 없는 기본 덱(마스터, 레이아웃, 노트 마스터)을 만들어 zip에 복사.
+
+        마지막에 다시 써야 하는 파트는 반환합니다.
+        """
+        from pptx import Presentation
+
+        prs = Presentation()
+        prs.slide_width = self.slide_width
+        prs.slide_height = self.slide_height
+        prs.notes_master  # 노트 마스터 파트 생성
+        buffer = io.BytesIO()
+        prs.save(buffer)
+
+        deferred = {}
+        with zipfile.ZipFile(buffer) as skeleton:
+            for info in skeleton.infolist():
+                data = skeleton.read(info.filename)
+                if info.filename in (
+                    '[Content_Types].xml',
+                    'ppt/presentation.xml',
+                    'ppt/_rels/presentation.xml.rels',
+                    'docProps/core.xml',
+                ):
+                    deferred[info.filename] = data
+                else:
+                    self._zip.writestr(info.filename, data)
+        return deferred
+
+    def add_slide(
+        self,
+        image_blob: bytes,
+        notes: Optional[str] = None,
+        text_boxes: Optional[List[Dict[str, Any]]] = None
+    ):
+        """풀슬라이드 이미지, 노트, 텍스트 상자로 슬라이드를 추가하고 즉시 기록."""
+        self._slide_count += 1
+        num = self._slide_count
+
+        key = hashlib.sha1(image_blob).hexdigest()
+        media_name = self._media.get(key)
+        if media_name is None:
+            ext = image_extension(image_blob)
+            media_name = f"image{len(self._media) + 1}.{ext}"
+            self._media[key] = media_name
+            self._image_extensions.add(ext)
+            member = f"ppt/media/{media_name}"
+            self._zip.writestr(member, image_blob, compress_type=zip_compression(member))
+
+        slide_rels = [
+            ('rId1', RT_SLIDE_LAYOUT, f'../slideLayouts/{BLANK_LAYOUT_PART}'),
+            ('rId2', RT_IMAGE, f'../media/{media_name}'),
+        ]
+        if notes:
+            slide_rels.append(('rId3', RT_NOTES_SLIDE, f'../notesSlides/notesSlide{num}.xml'))
+            self._zip.writestr(
+                f"ppt/notesSlides/notesSlide{num}.xml",
+                _NOTES_XML.format(paragraphs=_notes_paragraphs(notes))
+            )
+            self._zip.writestr(
+                f"ppt/notesSlides/_rels/notesSlide{num}.xml.rels",
+                _relationships_xml([
+                    ('rId1', RT_NOTES_MASTER, '../notesMasters/notesMaster1.xml'),
+                    ('rId2', RT_SLIDE, f'../slides/slide{num}.xml'),
+                ])
+            )
+            self._notes_parts.append(num)
+
+        self._zip.writestr(
+            f"ppt/slides/slide{num}.xml",
+            _SLIDE_XML.format(
+                cx=self.slide_width,
+                cy=self.slide_height,
+                shapes=''.join(_text_box_xml(i, box) for i, box in enumerate(text_boxes or [], 3))
+            )
+        )
+        self._zip.writestr(f"ppt/slides/_rels/slide{num}.xml.rels", _relationships_xml(slide_rels))
+
+    def mark_partial(self, reason: str):
+        """부분 결과 표시 (close()에서 문서 속성에 기록)."""
+        self._partial_reason = reason
+
+    def mark_shard(self, tag: str):
+        """샤드 표시 (close()에서 문서 속성의 식별자로 기록)."""
+        self._shard_tag = tag
+
+    def _finish_package(self):
+        """슬라이드 목록, 관계, 콘텐츠 타입, 문서 속성 기록."""
+        from lxml import etree
+
+        # 프레젠테이션 관계: 기존 rId 뒤에 슬라이드 관계 추가
+        rels = etree.fromstring(self._skeleton['ppt/_rels/presentation.xml.rels'])
+        used = [int(r.get('Id')[3:]) for r in rels if r.get('Id', '').startswith('rId')]
+        first_rid = max(used, default=0) + 1
+        slide_rids = []
+        for i in range(self._slide_count):
+            rid = f"rId{first_rid + i}"
+            slide_rids.append(rid)
+            etree.SubElement(rels, f'{{{NS_PKG_RELS}}}Relationship', Id=rid, Type=RT_SLIDE,
+                             Target=f'slides/slide{i + 1}.xml')
+
+        # presentation.xml: sldSz 앞에 sldIdLst 삽입
+        presentation = etree.fromstring(self._skeleton['ppt/presentation.xml'])
+        if self._slide_count:
+            id_list = etree.Element(f'{{{NS_P}}}sldIdLst')
+            for i, rid in enumerate(slide_rids):
+                etree.SubElement(id_list, f'{{{NS_P}}}sldId', id=str(256 + i)).set(f'{{{NS_R}}}id', rid)
+            presentation.find(f'{{{NS_P}}}sldSz').addprevious(id_list)
+
+        # 콘텐츠 타입
+        types = etree.fromstring(self._skeleton['[Content_Types].xml'])
+        defaults = {d.get('Extension') for d in types.findall(f'{{{NS_CT}}}Default')}
+        for ext in sorted(self._image_extensions - defaults):
+            types.insert(0, etree.Element(f'{{{NS_CT}}}Default', Extension=ext,
+                                          ContentType=IMAGE_CONTENT_TYPES[ext]))
+        for i in range(1, self._slide_count + 1):
+            etree.SubElement(types, f'{{{NS_CT}}}Override', PartName=f'/ppt/slides/slide{i}.xml',
+                             ContentType=CT_SLIDE)
+        for i in self._notes_parts:
+            etree.SubElement(types, f'{{{NS_CT}}}Override', PartName=f'/ppt/notesSlides/notesSlide{i}.xml',
+                             ContentType=CT_NOTES_SLIDE)
+
+        # 문서 속성: 부분 결과면 contentStatus와 설명, 샤드면 식별자 추가
+        core = etree.fromstring(self._skeleton['docProps/core.xml'])
+        properties = []
+        if self._partial_reason:
+            properties += [
+                (f'{{{NS_CORE}}}contentStatus', PARTIAL_STATUS),
+                (f'{{{NS_DC}}}description', self._partial_reason),
+            ]
+        if self._shard_tag:
+            properties.append((f'{{{NS_DC}}}identifier', self._shard_tag))
+        for tag, value in properties:
+            element = core.find(tag)
+            if element is None:
+                element = etree.SubElement(core, tag)
+            element.text = value
+
+        for name, element in (
+            ('ppt/_rels/presentation.xml.rels', rels),
+            ('ppt/presentation.xml', presentation),
+            ('[Content_Types].xml', types),
+            ('docProps/core.xml', core),
+        ):
+            self._zip.writestr(name, etree.tostring(element, xml_declaration=True,
+                                                    encoding='UTF-8', standalone=True))
+
+    def close(self) -> Path:
+        """패키지 마무리 후 출력 경로로 교체."""
+        try:
+            self._finish_package()
+            self._zip.close()
+        except Exception:
+            self.abort()
+            raise
+        os.replace(self._tmp_path, self.output_path)
+        return self.output_path
+
+    def abort(self):
+        """기록 중인 임시 파일 삭제."""
+        self._zip.close()
+        if self._tmp_path.exists():
+            self._tmp_path.unlink()
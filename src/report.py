@@ -0,0 +1,117 @@
+"""
+Run Report
+변환 실행 결과(슬라이드별 모델, 라우팅, 소요 시간 등) 기록
+"""
+
+import json
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Union, Dict, Any
+
+
+class RunReport:
+    """
+    변환 1회 실행 리포트.
+
+    슬라이드별 레코드를 모아 요약과 함께 JSON으로 저장합니다.
+    """
+
+    def __init__(self, provider: str, model: str, total_slides: int = 0):
+        """
+        리포트 초기화.
+
+        Args:
+            provider: AI 프로바이더 이름
+            model: 기본 모델명
+            total_slides: 전체 슬라이드 수
+        """
+        self.provider = provider
+        self.model = model
+        self.total_slides = total_slides
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.info: Dict[str, Any] = {}
+        self.slides: Dict[int, Dict[str, Any]] = {}
+
+    def slide(self, slide_num: int) -> Dict[str, Any]:
+        """슬라이드 레코드 (없으면 생성) 반환."""
+        if slide_num not in self.slides:
+            self.slides[slide_num] = {'slide': slide_num}
+        return self.slides[slide_num]
+
+    def finish(self):
+        """실행 종료 시각 기록."""
+        self.finished_at = time.time()
+
+    def summary(self) -> Dict[str, Any]:
+        """요약 통계."""
+        records = list(self.slides.values())
+        durations = [r['seconds'] for r in records if 'seconds' in r]
+        end = self.finished_at or time.time()
+
+        return {
+            'total_slides': self.total_slides,
+            'elapsed_seconds': round(end - self.started_at, 2),
+            'notes_ok': sum(1 for r in records if r.get('status') == 'ok'),
+            'notes_failed': sum(1 for r in records if r.get('status') == 'failed'),
+            'reused': sum(1 for r in records if r.get('status') == 'reused'),
+            # 작업 기한이 지나 노트 없이 저장한 슬라이드
+            'skipped': sum(1 for r in records if r.get('status') == 'skipped'),
+            # 최대 길이에 도달해 스트리밍 생성을 중간에 멈춘 노트
+            'truncated': sum(1 for r in records if r.get('truncated')),
+            'dedup': {
+                'exact': sum(1 for r in records if r.get('dedup') == 'exact'),
+                'near': sum(1 for r in records if r.get('dedup') == 'near'),
+                # 동일 슬라이드는 AI 호출과 이미지 인코딩/저장을 모두 생략
+                'calls_saved': sum(1 for r in records if r.get('status') == 'deduplicated'),
+            },
+            'input_tokens': sum(r.get('input_tokens', 0) for r in records),
+            'output_tokens': sum(r.get('output_tokens', 0) for r in records),
+            'avg_slide_seconds': round(sum(durations) / len(durations), 2) if durations else None,
+            'models': dict(Counter(r['model'] for r in records if r.get('model'))),
+            'modes': dict(Counter(r['mode'] for r in records if r.get('mode'))),
+            'routes': dict(Counter(r['route'] for r in records if r.get('route'))),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리."""
+        return {
+            'provider': self.provider,
+            'model': self.model,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            **self.info,
+            'summary': self.summary(),
+            'slides': [self.slides[k] for k in sorted(self.slides)],
+        }
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """JSON 파일로 저장."""
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def print_summary(self):
+        """요약을 콘솔에 출력."""
+        summary = self.summary()
+        print(f"📋 실행 리포트: 노트 성공 {summary['notes_ok']} / 실패 {summary['notes_failed']}"
+              f" (총 {summary['elapsed_seconds']}초)")
+        if summary['reused']:
+            print(f"   ♻️ 재사용: {summary['reused']}개 슬라이드 (AI 호출 없음)")
+        if summary['skipped']:
+            print(f"   ⏰ 기한 초과로 노트 생략: {summary['skipped']}개 슬라이드 (부분 결과, nb2pptx repair로 채우기)")
+        if summary['truncated']:
+            print(f"   ✂️ 길이 제한으로 조기 종료: {summary['truncated']}개 슬라이드")
+        dedup = summary['dedup']
+        if dedup['exact'] or dedup['near']:
+            print(f"   🧬 중복 제거: 동일 {dedup['exact']}개 (AI 호출 {dedup['calls_saved']}회 절약),"
+                  f" 유사 {dedup['near']}개 (차이점 프롬프트)")
+        if summary['routes']:
+            routes = ', '.join(f"{k} {v}" for k, v in summary['routes'].items())
+            models = ', '.join(f"{k} {v}" for k, v in summary['models'].items())
+            print(f"   🔀 라우팅: {routes} ({models})")
+        if summary['modes']:
+            modes = ', '.join(f"{k} {v}" for k, v in summary['modes'].items())
+            print(f"   📝 요청 방식: {modes}")
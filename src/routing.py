@@ -0,0 +1,136 @@
+"""
+Complexity-based Model Routing
+슬라이드 복잡도를 저렴하게 측정해 빠른 모델 / 강한 모델로 분배
+"""
+
+from typing import Optional, Dict, Any
+from PIL import Image, ImageFilter
+
+
+class SlideRouter:
+    """
+    슬라이드 복잡도 기반 모델 라우터.
+
+    점수(0~1)는 다음 신호의 가중 평균입니다.
+    - text: 텍스트 레이어 글자 수
+    - entropy: 흑백 이미지 히스토그램 엔트로피 (사진/그라데이션일수록 높음)
+    - edges: 엣지 밀도 (차트, 다이어그램, 표일수록 높음)
+    - visual: 텍스트가 아닌 시각 요소 비중 (1 - 텍스트 비중)
+
+    점수가 threshold 이상이면 complex_model, 미만이면 simple_model을 사용합니다.
+    """
+
+    DEFAULT_WEIGHTS = {
+        'text': 0.2,
+        'entropy': 0.2,
+        'edges': 0.3,
+        'visual': 0.3,
+    }
+
+    # 각 신호를 1.0으로 정규화하는 기준값
+    TEXT_CHARS_HIGH = 600
+    EDGE_DENSITY_HIGH = 0.12
+    ENTROPY_LOW = 3.0
+    ENTROPY_HIGH = 7.0
+
+    # 점수 계산용 축소 이미지 너비 (속도 우선)
+    ANALYSIS_WIDTH = 320
+
+    def __init__(
+        self,
+        simple_model: Optional[str],
+        complex_model: Optional[str],
+        threshold: float = 0.45,
+        weights: Optional[Dict[str, float]] = None
+    ):
+        """
+        라우터 초기화.
+
+        Args:
+            simple_model: 단순 슬라이드용 빠른 모델 (None이면 route 전에 채워야 함)
+            complex_model: 복잡한 슬라이드용 강한 모델 (None이면 route 전에 채워야 함)
+            threshold: complex_model로 보낼 최소 점수 (0~1)
+            weights: 신호별 가중치 (DEFAULT_WEIGHTS 키 일부만 지정 가능)
+        """
+        self.simple_model = simple_model
+        self.complex_model = complex_model
+        self.threshold = threshold
+        self.weights = dict(self.DEFAULT_WEIGHTS)
+        if weights:
+            self.weights.update(weights)
+
+    def _image_features(self, image: Image.Image) -> Dict[str, float]:
+        """축소 흑백 이미지에서 엔트로피와 엣지 밀도 계산."""
+        gray = image.convert('L')
+        if gray.width > self.ANALYSIS_WIDTH:
+            height = max(1, round(gray.height * self.ANALYSIS_WIDTH / gray.width))
+            gray = gray.resize((self.ANALYSIS_WIDTH, height))
+
+        edges = gray.filter(ImageFilter.FIND_EDGES)
+        histogram = edges.histogram()
+        edge_pixels = sum(histogram[32:])
+        total_pixels = gray.width * gray.height
+
+        return {
+            'entropy': gray.entropy(),
+            'edge_density': edge_pixels / total_pixels if total_pixels else 0.0,
+        }
+
+    def score(
+        self,
+        image: Image.Image,
+        page_text: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        슬라이드 복잡도 점수 계산.
+
+        Args:
+            image: 슬라이드 이미지
+            page_text: 텍스트 레이어 정보 ({'text', 'coverage'}), 없으면 이미지 신호만 사용
+
+        Returns:
+            {'score': float, 'features': {...}}
+        """
+        features = self._image_features(image)
+        edge_signal = min(features['edge_density'] / self.EDGE_DENSITY_HIGH, 1.0)
+        entropy_signal = (features['entropy'] - self.ENTROPY_LOW) / (self.ENTROPY_HIGH - self.ENTROPY_LOW)
+
+        signals = {
+            'entropy': min(max(entropy_signal, 0.0), 1.0),
+            'edges': edge_signal,
+        }
+
+        if page_text is not None:
+            features['text_chars'] = len(page_text['text'])
+            features['text_coverage'] = page_text['coverage']
+            signals['text'] = min(features['text_chars'] / self.TEXT_CHARS_HIGH, 1.0)
+            signals['visual'] = 1.0 - page_text['coverage']
+        else:
+            # 텍스트 레이어가 없으면 엣지 밀도로 시각 요소 비중을 대신함
+            signals['visual'] = edge_signal
+
+        used = [k for k in signals if self.weights.get(k)]
+        total_weight = sum(self.weights[k] for k in used) or 1.0
+        score = sum(self.weights[k] * signals[k] for k in used) / total_weight
+
+        return {
+            'score': round(score, 3),
+            'features': {k: round(v, 4) for k, v in features.items()},
+        }
+
+    def route(
+        self,
+        image: Image.Image,
+        page_text: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        슬라이드에 사용할 모델 결정.
+
+        Returns:
+            {'model', 'route' ('simple'|'complex'), 'score', 'features'}
+        """
+        result = self.score(image, page_text)
+        is_complex = result['score'] >= self.threshold
+        result['route'] = 'complex' if is_complex else 'simple'
+        result['model'] = self.complex_model if is_complex else self.simple_model
+        return result
@@ -0,0 +1,212 @@
+"""
+Deck Sharding
+큰 덱을 페이지 구간(샤드)으로 나눠 여러 워커에서 변환하고 하나의 PPTX로 합치기
+(nb2pptx --shard i/N, nb2pptx merge)
+"""
+
+import re
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union, List, Tuple
+
+from .pptx_utils import slide_picture_blob, slide_notes_text, slide_text_boxes
+from .pptx_writer import NS_DC, PARTIAL_STATUS, PresentationWriter, StreamingPptxWriter
+
+# 샤드 PPTX의 문서 속성(core.xml identifier)에 기록하는 태그
+SHARD_TAG_PREFIX = 'nb2pptx-shard/1'
+
+_SPEC_PATTERN = re.compile(r'^\s*(\d+)\s*/\s*(\d+)\s*$')
+
+
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """
+    'i/N' 형식의 샤드 지정 해석.
+
+    Args:
+        spec: 샤드 지정 (예: '2/4', 1부터)
+
+    Returns:
+        (샤드 번호, 샤드 수)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 범위를 벗어남
+    """
+    match = _SPEC_PATTERN.match(spec or '')
+    if not match:
+        raise ValueError(f"샤드는 'i/N' 형식이어야 합니다 (예: 2/4): {spec}")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"샤드 번호는 1부터 {count} 사이여야 합니다: {spec}")
+    return index, count
+
+
+def shard_pages(page_count: int, index: int, count: int) -> Tuple[int, int]:
+    """
+    샤드가 맡을 페이지 구간 (페이지를 최대한 고르게 나눔).
+
+    Args:
+        page_count: 전체 페이지 수
+        index: 샤드 번호 (1부터)
+        count: 샤드 수
+
+    Returns:
+        (첫 페이지, 마지막 페이지) (1부터, 양 끝 포함)
+
+    Raises:
+        ValueError: 샤드 수가 페이지 수보다 많아 빈 샤드가 생김
+    """
+    if count > page_count:
+        raise ValueError(f"샤드 수({count})가 페이지 수({page_count})보다 많습니다.")
+    first = (index - 1) * page_count // count + 1
+    last = index * page_count // count
+    return first, last
+
+
+def shard_path(path: Union[str, Path], index: int, count: int) -> Path:
+    """샤드별 파일 경로 (deck.pptx → deck.shard-2-of-4.pptx)."""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.shard-{index}-of-{count}{path.suffix}")
+
+
+@dataclass(frozen=True)
+class ShardInfo:
+    """샤드 PPTX가 원본 덱의 어느 부분인지."""
+
+    index: int
+    count: int
+    first_page: int
+    last_page: int
+    total_pages: int
+    source: str  # 원본 PDF SHA-256 (앞 16자리, 다른 PDF의 샤드가 섞이지 않도록 확인)
+
+    def to_tag(self) -> str:
+        """문서 속성에 기록할 태그."""
+        return (
+            f"{SHARD_TAG_PREFIX} {self.index}/{self.count} "
+            f"pages={self.first_page}-{self.last_page}/{self.total_pages} source={self.source}"
+        )
+
+    @classmethod
+    def from_tag(cls, tag: Optional[str]) -> Optional['ShardInfo']:
+        """to_tag 결과 해석 (샤드 태그가 아니면 None)."""
+        match = re.match(
+            rf'^{re.escape(SHARD_TAG_PREFIX)} (\d+)/(\d+) pages=(\d+)-(\d+)/(\d+) source=(\w+)$',
+            tag or ''
+        )
+        if not match:
+            return None
+        *numbers, source = match.groups()
+        return cls(*(int(n) for n in numbers), source)
+
+
+def read_shard_info(pptx_path: Union[str, Path]) -> Optional[ShardInfo]:
+    """샤드 PPTX의 샤드 정보 (슬라이드를 읽지 않고 문서 속성만 확인, 샤드가 아니면 None)."""
+    from lxml import etree
+
+    with zipfile.ZipFile(pptx_path) as package:
+        try:
+            core = etree.fromstring(package.read('docProps/core.xml'))
+        except KeyError:
+            return None
+    return ShardInfo.from_tag(core.findtext(f'{{{NS_DC}}}identifier'))
+
+
+def merge_shards(
+    shard_paths: List[Union[str, Path]],
+    output_path: Union[str, Path],
+    streaming: bool = True,
+    allow_missing: bool = False
+) -> Path:
+    """
+    샤드 PPTX들을 페이지 순서대로 하나의 덱으로 합치기.
+
+    슬라이드 이미지는 샤드에 들어 있는 바이트를 그대로 옮기고(재인코딩 없음),
+    노트와 네이티브 텍스트 상자도 함께 옮깁니다. 샤드 하나씩 읽으므로
+    스트리밍 writer를 쓰면 메모리 사용량은 가장 큰 샤드 크기 정도입니다.
+    기한 초과로 부분 결과가 된 샤드가 있으면 합친 덱도 부분 결과로 표시합니다.
+
+    Args:
+        shard_paths: 샤드 PPTX 경로 (순서 무관)
+        output_path: 합친 PPTX 경로
+        streaming: 슬라이드를 바로 기록하는 StreamingPptxWriter 사용
+        allow_missing: 빠진 샤드가 있어도 있는 샤드만 합치기
+
+    Returns:
+        합친 PPTX 경로
+
+    Raises:
+        ValueError: 샤드가 아닌 파일, 다른 PDF의 샤드, 중복/누락된 샤드
+    """
+    from pptx import Presentation
+
+    shards = []
+    for path in shard_paths:
+        info = read_shard_info(path)
+        if info is None:
+            raise ValueError(f"nb2pptx --shard로 만든 파일이 아닙니다: {path}")
+        shards.append((info, Path(path)))
+    if not shards:
+        raise ValueError("합칠 샤드가 없습니다.")
+
+    shards.sort(key=lambda item: item[0].first_page)
+    first = shards[0][0]
+    for info, path in shards:
+        if (info.source, info.count, info.total_pages) != (first.source, first.count, first.total_pages):
+            raise ValueError(f"다른 PDF 또는 다른 샤드 분할로 만든 파일입니다: {path}")
+
+    indexes = [info.index for info, _ in shards]
+    duplicates = sorted({i for i in indexes if indexes.count(i) > 1})
+    if duplicates:
+        raise ValueError(f"같은 샤드가 여러 번 지정되었습니다: {', '.join(map(str, duplicates))}")
+    missing = sorted(set(range(1, first.count + 1)) - set(indexes))
+    if missing:
+        message = f"빠진 샤드: {', '.join(f'{i}/{first.count}' for i in missing)}"
+        if not allow_missing:
+            raise ValueError(message)
+        print(f"⚠️ {message} (있는 샤드만 합칩니다)")
+
+    output_path = Path(output_path)
+    writer = None
+    partial = []
+    slides = 0
+    try:
+        for info, path in shards:
+            prs = Presentation(str(path))
+            if writer is None:
+                writer_class = StreamingPptxWriter if streaming else PresentationWriter
+                writer = writer_class(output_path, prs.slide_width, prs.slide_height)
+
+            expected = info.last_page - info.first_page + 1
+            if len(prs.slides) != expected:
+                raise ValueError(
+                    f"샤드 {info.index}/{info.count}의 슬라이드 수({len(prs.slides)})가 "
+                    f"페이지 구간({info.first_page}-{info.last_page})과 다릅니다: {path}"
+                )
+            print(f"🧩 샤드 {info.index}/{info.count}: 페이지 {info.first_page}-{info.last_page} ({path.name})")
+
+            for slide in prs.slides:
+                blob = slide_picture_blob(slide)
+                if blob is None:
+                    raise ValueError(f"슬라이드 이미지가 없는 샤드입니다: {path}")
+                writer.add_slide(blob, slide_notes_text(slide) or None, slide_text_boxes(slide) or None)
+                slides += 1
+
+            if prs.core_properties.content_status == PARTIAL_STATUS:
+                partial.append(f"{info.index}/{info.count}")
+
+        if partial:
+            writer.mark_partial(
+                f"부분 결과 샤드({', '.join(partial)})가 포함되어 일부 노트가 비어 있습니다 "
+                f"(nb2pptx repair로 채울 수 있음)"
+            )
+        writer.close()
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+
+    print(f"🎉 {len(shards)}개 샤드, {slides}개 슬라이드 합치기 완료: {output_path}")
+    if partial:
+        print(f"⏰ 부분 결과 샤드가 있습니다. 빈 노트는 'nb2pptx repair {output_path}'로 채울 수 있습니다.")
+    return output_path
@@ -1,8 +1,6 @@
 """
 Neo-brutalism UI Components
 Bold borders, hard shadows, modern aesthetics
-"""
-
-from .app import NotebookLMConverterApp
 
-__all__ = ['NotebookLMConverterApp']
+app.py는 `streamlit run`으로 실행하는 스크립트이므로 여기서 import하지 않습니다.
+"""
@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import tempfile
 import platform
 import webbrowser
@@ -17,9 +18,21 @@ if str(project_root) not in sys.path:
 # Import the core converter using absolute import from root
 try:
     from src.converter import NotebookLMToPPTX
+    from src.page_cache import PageCache
+    from src.ui.jobs import BackgroundConversion
+    from src.ui.uploads import spool_upload, prune_uploads
 except ImportError:
     # Fallback for different environments
     from converter import NotebookLMToPPTX
+    from page_cache import PageCache
+    from ui.jobs import BackgroundConversion
+    from ui.uploads import spool_upload, prune_uploads
+
+
+@st.cache_resource
+def get_page_cache():
+    """세션 간 공유하는 렌더링 페이지 캐시 (같은 PDF를 설정만 바꿔 다시 변환할 때 재사용)."""
+    return PageCache()
 
 # Neo-brutalism CSS
 st.markdown("""
@@ -151,6 +164,7 @@ def load_api_keys():
         'openai': os.getenv('OPENAI_API_KEY', ''),
         'anthropic': os.getenv('ANTHROPIC_API_KEY', ''),
         'grok': os.getenv('XAI_API_KEY', ''),
+        'openai-compatible': os.getenv('OPENAI_COMPATIBLE_API_KEY', ''),
     }
 
 keys = load_api_keys()
@@ -225,10 +239,30 @@ with st.sidebar:
     
     provider = st.selectbox(
         "AI Provider",
-        ("gemini", "openai", "claude", "grok"),
+        ("gemini", "openai", "claude", "grok", "openai-compatible"),
         index=0,
-        help="Select the AI intelligence to use."
+        help="Select the AI intelligence to use. openai-compatible: vLLM, llama.cpp, Ollama 등 자체 추론 서버"
     )
+
+    # OpenAI 호환 서버 (사내/로컬 추론 서버)
+    provider_model = None
+    provider_options = None
+    if provider == "openai-compatible":
+        base_url = st.text_input(
+            "Base URL",
+            value=os.getenv("OPENAI_COMPATIBLE_BASE_URL", "http://localhost:8000/v1"),
+            help="OpenAI 호환 API 주소 (/v1 포함). 예: Ollama는 http://localhost:11434/v1"
+        )
+        provider_model = st.text_input(
+            "Model",
+            value=os.getenv("OPENAI_COMPATIBLE_MODEL", ""),
+            help="서버의 비전 모델 이름 (비워 두면 서버가 제공하는 첫 번째 모델)"
+        ) or None
+        max_concurrency = st.number_input(
+            "최대 동시 요청 수", min_value=0, value=0,
+            help="서버 하드웨어에 맞게 동시 요청을 제한합니다 (0이면 제한 없음)."
+        )
+        provider_options = {"base_url": base_url, "max_concurrency": int(max_concurrency) or None}
     
     # API Key Handling
     current_key_env = keys.get(provider, '')
@@ -241,7 +275,8 @@ with st.sidebar:
         f"{provider.capitalize()} API Key", 
         value=st.session_state[f"{provider}_key"],
         type="password",
-        help=f"Enter your {provider} API key"
+        help=f"Enter your {provider} API key (쉼표로 여러 키를 구분하면 요청을 나눠 보냅니다)"
+        + (" · 인증 없는 로컬 서버는 비워 두세요" if provider == "openai-compatible" else "")
     )
     
     # Save API Key Button
@@ -259,6 +294,7 @@ with st.sidebar:
                 'openai': 'OPENAI_API_KEY',
                 'anthropic': 'ANTHROPIC_API_KEY',
                 'grok': 'XAI_API_KEY',
+                'openai-compatible': 'OPENAI_COMPATIBLE_API_KEY',
             }
             target_var = env_map.get(provider)
             
@@ -331,85 +367,152 @@ with col2:
 with col3:
     dpi = st.slider("화질 (DPI)", 72, 300, 144)
 
-if uploaded_file and st.button("🚀 PPTX로 변환 시작", use_container_width=True):
-    if not api_key and not no_notes:
+text_mode = st.selectbox(
+    "📝 PDF 텍스트 활용",
+    ("off", "assist", "text-only"),
+    index=0,
+    format_func=lambda m: {
+        "off": "사용 안 함 (이미지만 전송)",
+        "assist": "이미지 + 텍스트 (작은 모델도 정확하게)",
+        "text-only": "텍스트 위주 슬라이드는 텍스트만 전송 (빠르고 저렴)",
+    }[m],
+    help="NotebookLM PDF의 텍스트 레이어를 AI 요청에 활용합니다."
+)
+routing = st.checkbox(
+    "🔀 복잡도별 모델 자동 분배",
+    value=False,
+    help="단순한 슬라이드는 빠른 모델, 차트 등 복잡한 슬라이드는 강한 모델로 보냅니다."
+)
+
+job = st.session_state.get("conversion_job")
+job_running = job is not None and job.running
+
+# 업로드는 한 번만 디스크에 옮겨 두고 다시 실행될 때마다 재사용 (변환 중에는 지우지 않음)
+spooled = st.session_state.setdefault("spooled_uploads", {})
+if not job_running:
+    prune_uploads(spooled, [uploaded_file, *(context_files or [])])
+
+# 업로드 직후 저해상도 미리보기 (API 키 불필요, 썸네일과 PDF 해시는 전체 변환에서 재사용)
+PREVIEW_PAGES = 8
+if uploaded_file:
+    with st.expander("👀 미리보기", expanded=not job_running):
+        try:
+            pdf_path = spool_upload(uploaded_file, spooled)
+            preview_converter = NotebookLMToPPTX(
+                provider=provider,
+                api_key=api_key,
+                remove_watermark=remove_watermark,
+                page_cache=get_page_cache()
+            )
+            page_count = preview_converter.page_count(pdf_path)
+            first, last = 1, min(page_count, PREVIEW_PAGES)
+            if page_count > 1:
+                first, last = st.slider("미리볼 페이지", 1, page_count, (first, last))
+            thumbnails = preview_converter.preview(pdf_path, list(range(first, last + 1)))
+            preview_cols = st.columns(4)
+            for i, (page, thumbnail) in enumerate(thumbnails.items()):
+                preview_cols[i % 4].image(thumbnail, caption=f"{page} / {page_count}")
+        except Exception as e:
+            st.warning(f"⚠️ 미리보기를 만들 수 없습니다: {e}")
+
+if uploaded_file and st.button("🚀 PPTX로 변환 시작", use_container_width=True, disabled=job_running):
+    if not api_key and not no_notes and provider != "openai-compatible":
         st.error("⚠️ AI API 키가 필요합니다! 사이드바에서 입력하거나 노트 생성을 끄세요.")
     else:
-        with st.status("🛠️ 변환 작업 진행 중...", expanded=True) as status:
-            try:
-                # Save uploaded PDF to temp file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-                    tmp_pdf.write(uploaded_file.getvalue())
-                    pdf_path = tmp_pdf.name
-                
-                # Save context files
-                context_paths = []
-                if context_files:
-                    st.write("📚 맥락 자료 처리 중...")
-                    for cf in context_files:
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{cf.name.split('.')[-1]}") as tmp_ctx:
-                            tmp_ctx.write(cf.getvalue())
-                            context_paths.append(tmp_ctx.name)
-
-                # Initialize Converter
-                st.write(f"🤖 AI ({provider}) 연결 중...")
-                converter = NotebookLMToPPTX(
-                    provider=provider,
-                    api_key=api_key,
-                    dpi=dpi,
-                    remove_watermark=remove_watermark
-                )
+        try:
+            pdf_path = spool_upload(uploaded_file, spooled)
+            context_paths = [spool_upload(cf, spooled) for cf in context_files or []]
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".pptx") as tmp_out:
+                output_path = tmp_out.name
 
-                # Convert
-                # Progress bar wrapper
-                progress_bar = st.progress(0, text="준비 중...")
-                
-                def update_progress(current, total):
-                    pct = current / total
-                    progress_bar.progress(pct, text=f"슬라이드 변환 중... ({current}/{total})")
-
-                st.write("🔄 PDF 변환 및 분석 시작...")
-                output_path = converter.convert(
-                    pdf_path,
-                    output_path=pdf_path.replace(".pdf", ".pptx"),
-                    context_paths=context_paths if context_paths else None,
-                    generate_notes=not no_notes,
-                    progress_callback=update_progress
-                )
-                
-                status.update(label="✅ 변환 프로세스 완료!", state="complete", expanded=False)
-                
-                # Show results in a Neo-brutalism box
-                st.markdown(f"""
-                <div style='background: #A3FFAC; border: 3px solid black; padding: 20px; box-shadow: 5px 5px 0 black; margin-top: 20px; margin-bottom: 20px;'>
-                    <h3 style='margin-top:0;'>🎉 변환 성공!</h3>
-                    <p style='margin-bottom:0;'>파일이 성공적으로 생성되었습니다. 아래 버튼을 눌러 저장하세요.</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Download Button
-                with open(output_path, "rb") as f:
-                    st.download_button(
-                        label="📥 PPTX 파일 저장하기 (여기를 클릭!)",
-                        data=f,
-                        file_name=f"{uploaded_file.name.replace('.pdf', '')}.pptx",
-                        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                        use_container_width=True
-                    )
-                
-                st.info("💡 **어디에 파일이 저장되나요?**\n\n웹 브라우저를 쓰고 계시다면 컴퓨터의 **'다운로드(Downloads)'** 폴더에 저장됩니다. (로컬 터미널에서 실행 시에는 원본 PDF와 같은 폴더에 저장됩니다.)")
+            # Initialize Converter
+            converter = NotebookLMToPPTX(
+                provider=provider,
+                api_key=api_key,
+                model=provider_model,
+                provider_options=provider_options,
+                dpi=dpi,
+                remove_watermark=remove_watermark,
+                text_mode=text_mode,
+                routing=routing,
+                page_cache=get_page_cache()
+            )
 
-                # Cleanup
-                try:
-                    os.unlink(pdf_path)
-                    for p in context_paths:
-                        os.unlink(p)
-                    os.unlink(output_path)
-                except:
-                    pass
-
-            except Exception as e:
-                st.error(f"❌ 오류가 발생했습니다: {str(e)}")
-                import traceback
-                st.code(traceback.format_exc())
+            # 이전 결과 정리 후 백그라운드 작업 시작 (화면을 조작해도 변환은 계속됨)
+            if job is not None:
+                job.discard()
+            job = BackgroundConversion(
+                converter,
+                pdf_path,
+                output_path=output_path,
+                context_paths=context_paths,
+                generate_notes=not no_notes
+            )
+            job.download_name = f"{uploaded_file.name.replace('.pdf', '')}.pptx"
+            job.start()
+            st.session_state["conversion_job"] = job
+
+        except Exception as e:
+            st.error(f"❌ 오류가 발생했습니다: {str(e)}")
+            import traceback
+            st.code(traceback.format_exc())
+
+if job is not None:
+    state = job.snapshot()
+    total = state["total"] or 1
+
+    if state["status"] == "running":
+        label = "⏹️ 취소 요청됨 (곧 중단됩니다)" if state["cancel_requested"] else "🛠️ 변환 작업 진행 중..."
+        st.progress(state["current"] / total, text=f"{label} ({state['current']}/{state['total']})")
+        if not state["cancel_requested"] and st.button("⏹️ 변환 취소", use_container_width=True):
+            job.cancel()
+            st.rerun()
+        # 생성 중인 노트를 도착하는 대로 표시
+        for slide_num, live in sorted(state["live_notes"].items()):
+            st.caption(f"✍️ 슬라이드 {slide_num} 노트 작성 중...")
+            st.markdown(live)
+    elif state["status"] == "done":
+        # Show results in a Neo-brutalism box
+        st.markdown(f"""
+        <div style='background: #A3FFAC; border: 3px solid black; padding: 20px; box-shadow: 5px 5px 0 black; margin-top: 20px; margin-bottom: 20px;'>
+            <h3 style='margin-top:0;'>🎉 변환 성공!</h3>
+            <p style='margin-bottom:0;'>파일이 성공적으로 생성되었습니다. 아래 버튼을 눌러 저장하세요.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Download Button
+        st.download_button(
+            label="📥 PPTX 파일 저장하기 (여기를 클릭!)",
+            data=job.read_output(),
+            file_name=job.download_name,
+            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            use_container_width=True
+        )
+
+        st.info("💡 **어디에 파일이 저장되나요?**\n\n웹 브라우저를 쓰고 계시다면 컴퓨터의 **'다운로드(Downloads)'** 폴더에 저장됩니다. (로컬 터미널에서 실행 시에는 원본 PDF와 같은 폴더에 저장됩니다.)")
+    elif state["status"] == "cancelled":
+        st.warning(f"⏹️ 변환이 취소되었습니다. ({len(state['slides'])}/{state['total']} 슬라이드 처리됨)")
+    else:
+        st.error("❌ 오류가 발생했습니다.")
+        st.code(state["error"])
+
+    # 완성된 슬라이드 미리보기 (썸네일 + 노트)
+    if state["slides"]:
+        st.markdown("### 👀 슬라이드 미리보기")
+        for slide in reversed(state["slides"]):
+            thumb_col, notes_col = st.columns([1, 2])
+            with thumb_col:
+                st.image(slide["thumbnail"], caption=f"슬라이드 {slide['num']}")
+            with notes_col:
+                st.text_area(
+                    "발표자 노트",
+                    slide["notes"] or "(노트 없음)",
+                    height=160,
+                    disabled=True,
+                    key=f"notes_{id(job)}_{slide['num']}"
+                )
 
+    # 진행 중이면 잠시 후 다시 그려 새 슬라이드 표시
+    if state["status"] == "running":
+        time.sleep(1)
+        st.rerun()
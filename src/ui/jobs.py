@@ -0,0 +1,153 @@
+"""
+Background Conversion Jobs for the Streamlit UI
+변환을 백그라운드 스레드에서 실행하고, 화면은 주기적으로 진행 상황과 완성된 슬라이드를 표시
+"""
+
+import io
+import os
+import threading
+import traceback
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+from PIL import Image
+
+try:
+    from src.cancellation import CancellationToken, ConversionCancelled
+except ImportError:
+    from cancellation import CancellationToken, ConversionCancelled
+
+# 미리보기 썸네일 최대 크기
+THUMBNAIL_SIZE = (480, 270)
+
+
+class BackgroundConversion:
+    """
+    백그라운드 스레드에서 실행되는 변환 작업.
+
+    Streamlit 스크립트가 다시 실행되어도 작업이 유지되도록 st.session_state에 보관합니다.
+    화면 쪽은 snapshot()으로 상태를 읽기만 하고, 스레드에서는 Streamlit API를 호출하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        converter,
+        pdf_path: str,
+        output_path: str,
+        context_paths: Optional[List[str]] = None,
+        generate_notes: bool = True,
+        temp_paths: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            converter: NotebookLMToPPTX 인스턴스
+            pdf_path: 입력 PDF 경로
+            output_path: 출력 PPTX 경로
+            context_paths: 맥락 자료 경로
+            generate_notes: AI 스피커 노트 생성 여부
+            temp_paths: 작업이 끝나면 지울 임시 파일 (입력 PDF, 맥락 자료)
+        """
+        self.converter = converter
+        self.pdf_path = pdf_path
+        self.output_path = output_path
+        self.context_paths = context_paths or None
+        self.generate_notes = generate_notes
+        self.temp_paths = temp_paths or []
+
+        self.status = 'running'  # running | done | failed | cancelled
+        self.current = 0
+        self.total = 0
+        self.slides: List[Dict[str, Any]] = []
+        self.live_notes: Dict[int, str] = {}  # 생성 중인 노트 (슬라이드 번호: 지금까지의 텍스트)
+        self.error: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._cancel = CancellationToken()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """작업 시작."""
+        self._thread.start()
+
+    def cancel(self):
+        """취소 요청 (생성 중인 노트는 다음 응답 조각에서, 그 외에는 다음 슬라이드 전에 중단)."""
+        self._cancel.cancel()
+
+    @property
+    def running(self) -> bool:
+        return self.status == 'running'
+
+    def snapshot(self) -> Dict[str, Any]:
+        """화면 표시용 상태 복사본."""
+        with self._lock:
+            return {
+                'status': self.status,
+                'current': self.current,
+                'total': self.total,
+                'slides': list(self.slides),
+                'live_notes': dict(self.live_notes),
+                'error': self.error,
+                'cancel_requested': self._cancel.cancelled,
+            }
+
+    def _check_cancel(self):
+        if self._cancel.cancelled:
+            raise ConversionCancelled(self._cancel.reason)
+
+    def _on_progress(self, current: int, total: int):
+        with self._lock:
+            self.current, self.total = current, total
+        self._check_cancel()
+
+    def _on_slide(self, slide_num: int, blob: bytes, notes: Optional[str]):
+        thumbnail = Image.open(io.BytesIO(blob))
+        thumbnail.thumbnail(THUMBNAIL_SIZE)
+        with self._lock:
+            self.slides.append({'num': slide_num, 'thumbnail': thumbnail, 'notes': notes or ''})
+            self.live_notes.pop(slide_num, None)
+        self._check_cancel()
+
+    def _on_notes(self, slide_num: int, chunk: str, notes: str):
+        with self._lock:
+            self.live_notes[slide_num] = notes
+
+    def _run(self):
+        try:
+            self.converter.convert(
+                self.pdf_path,
+                output_path=self.output_path,
+                context_paths=self.context_paths,
+                generate_notes=self.generate_notes,
+                progress_callback=self._on_progress,
+                slide_callback=self._on_slide,
+                notes_callback=self._on_notes,
+                cancel_token=self._cancel
+            )
+            status = 'done'
+        except ConversionCancelled:
+            status = 'cancelled'
+        except Exception:
+            status = 'failed'
+            self.error = traceback.format_exc()
+        finally:
+            self._remove_temp_files()
+
+        with self._lock:
+            self.status = status
+
+    def _remove_temp_files(self):
+        for path in self.temp_paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def read_output(self) -> bytes:
+        """완성된 PPTX 바이트."""
+        return Path(self.output_path).read_bytes()
+
+    def discard(self):
+        """결과 파일 삭제 (새 변환을 시작하거나 결과를 닫을 때)."""
+        try:
+            os.unlink(self.output_path)
+        except OSError:
+            pass
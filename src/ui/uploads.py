@@ -0,0 +1,66 @@
+"""
+Upload Spooling for the Streamlit UI
+업로드 파일을 한 번만 임시 파일로 옮기고, 스크립트가 다시 실행되어도 같은 경로를 재사용
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable
+
+# 업로드를 디스크로 옮길 때 한 번에 복사할 크기
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+
+def upload_key(uploaded_file) -> str:
+    """업로드 파일 식별자 (file_id가 없는 이전 Streamlit 버전은 이름+크기)."""
+    file_id = getattr(uploaded_file, 'file_id', None)
+    return file_id or f"{uploaded_file.name}:{uploaded_file.size}"
+
+
+def spool_upload(uploaded_file, spooled: Dict[str, str]) -> str:
+    """
+    업로드 파일을 임시 파일로 저장하고 경로 반환.
+
+    getvalue()로 전체를 복사하지 않고 청크 단위로 옮기며,
+    이미 저장한 업로드는 다시 쓰지 않습니다.
+
+    Args:
+        uploaded_file: st.file_uploader 결과
+        spooled: {업로드 식별자: 임시 파일 경로} (st.session_state에 보관)
+
+    Returns:
+        임시 파일 경로
+    """
+    key = upload_key(uploaded_file)
+    path = spooled.get(key)
+    if path and os.path.exists(path):
+        return path
+
+    suffix = Path(uploaded_file.name).suffix
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, prefix='nb2pptx-upload-') as tmp:
+        shutil.copyfileobj(uploaded_file, tmp, SPOOL_CHUNK_SIZE)
+    uploaded_file.seek(0)
+
+    spooled[key] = tmp.name
+    return tmp.name
+
+
+def prune_uploads(spooled: Dict[str, str], active_files: Iterable) -> None:
+    """
+    더 이상 업로드 목록에 없는 파일의 임시 파일 삭제.
+
+    Args:
+        spooled: spool_upload에 넘긴 딕셔너리
+        active_files: 현재 화면에 올라와 있는 업로드 파일들
+    """
+    active = {upload_key(f) for f in active_files if f is not None}
+    for key in list(spooled):
+        if key in active:
+            continue
+        try:
+            os.unlink(spooled.pop(key))
+        except OSError:
+            pass
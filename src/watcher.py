@@ -0,0 +1,295 @@
+"""
+Watch Folder
+폴더에 새로 들어오거나 바뀐 PDF를 미리 준비해 둔 컨버터로 바로 변환 (nb2pptx watch)
+"""
+
+import json
+import queue
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Optional, Union, List, Dict, Any
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+
+class _WakeHandler(FileSystemEventHandler):
+    """파일 시스템 알림이 오면 스캔을 바로 깨움."""
+
+    def __init__(self, wake: threading.Event):
+        self.wake = wake
+
+    def on_any_event(self, event):
+        if not event.is_directory:
+            self.wake.set()
+
+
+class FolderWatcher:
+    """
+    감시 폴더 데몬.
+
+    - 감지: watchdog가 있으면 파일 시스템 알림으로 바로 스캔하고, 없거나 알림이 누락되어도
+      poll_interval마다 다시 스캔합니다 (NFS 등 알림이 없는 공유 폴더 대비).
+    - 완료 판단: 크기와 수정 시각이 settle_seconds 동안 그대로이고 파일 끝에 %%EOF가 있어야
+      변환합니다 (복사/내보내기 중인 파일 제외).
+    - 워커: 컨버터를 미리 만들어 SDK 클라이언트와 렌더러 확인을 끝내 두고 계속 재사용합니다.
+    - 상태: 처리한 파일의 크기/수정 시각을 출력 폴더의 STATE_FILE에 기록해 재시작해도
+      바뀐 파일만 다시 변환합니다.
+    """
+
+    STATE_FILE = '.nb2pptx_watch.json'
+
+    def __init__(
+        self,
+        watch_dir: Union[str, Path],
+        output_dir: Optional[Union[str, Path]] = None,
+        converter_options: Optional[Dict[str, Any]] = None,
+        convert_options: Optional[Dict[str, Any]] = None,
+        workers: int = 1,
+        poll_interval: float = 2.0,
+        settle_seconds: float = 1.0,
+        recursive: bool = False,
+        notifications: bool = True
+    ):
+        """
+        Args:
+            watch_dir: 감시할 폴더
+            output_dir: PPTX와 실행 리포트를 저장할 폴더 (None이면 감시 폴더)
+            converter_options: NotebookLMToPPTX 생성 인자 (워커마다 컨버터 하나)
+            convert_options: convert 호출 인자 (context_paths, generate_notes 등)
+            workers: 동시에 변환할 파일 수 (준비해 둘 컨버터 수)
+            poll_interval: 폴더 재스캔 간격 (초)
+            settle_seconds: 파일이 이 시간 동안 바뀌지 않으면 다 써진 것으로 판단 (초)
+            recursive: 하위 폴더까지 감시
+            notifications: watchdog 파일 시스템 알림 사용 (설치되어 있을 때)
+        """
+        self.watch_dir = Path(watch_dir).resolve()
+        if not self.watch_dir.is_dir():
+            raise NotADirectoryError(f"감시할 폴더를 찾을 수 없습니다: {self.watch_dir}")
+        self.output_dir = Path(output_dir).resolve() if output_dir else self.watch_dir
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.converter_options = converter_options or {}
+        self.convert_options = convert_options or {}
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        self.recursive = recursive
+        self.notifications = notifications and Observer is not None
+
+        self.state_path = self.output_dir / self.STATE_FILE
+        self._state: Dict[str, Dict[str, Any]] = self._load_state()
+        self._candidates: Dict[str, Dict[str, Any]] = {}  # 경로 → {'signature', 'since'}
+        self._active = set()  # 대기열에 있거나 변환 중인 경로
+        self._queue: 'queue.Queue[Optional[tuple]]' = queue.Queue()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self.processed = 0
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            return json.loads(self.state_path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_state(self):
+        tmp = self.state_path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self._state, ensure_ascii=False, indent=2), encoding='utf-8')
+        tmp.replace(self.state_path)
+
+    def stop(self):
+        """진행 중인 변환을 마친 뒤 종료하도록 요청."""
+        self._stop.set()
+        self._wake.set()
+
+    def output_paths(self, pdf_path: Path) -> tuple:
+        """PDF에 대응하는 (PPTX, 실행 리포트) 경로 (하위 폴더 구조 유지)."""
+        relative = pdf_path.relative_to(self.watch_dir)
+        pptx_path = self.output_dir / relative.with_suffix('.pptx')
+        return pptx_path, pptx_path.with_suffix('.report.json')
+
+    @staticmethod
+    def _signature(path: Path) -> Optional[List[int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def _is_complete(path: Path) -> bool:
+        """PDF가 끝까지 써졌는지 (마지막 1KB에 %%EOF)."""
+        try:
+            with open(path, 'rb') as f:
+                f.seek(0, 2)
+                f.seek(max(0, f.tell() - 1024))
+                return b'%%EOF' in f.read()
+        except OSError:
+            return False
+
+    def _iter_pdfs(self):
+        pattern = '**/*' if self.recursive else '*'
+        for path in self.watch_dir.glob(pattern):
+            # 숨김 파일, Office 잠금 파일, 출력 폴더 안의 파일은 제외
+            if path.suffix.lower() != '.pdf' or path.name.startswith(('.', '~$')):
+                continue
+            if self.output_dir != self.watch_dir and self.output_dir in path.parents:
+                continue
+            if path.is_file():
+                yield path
+
+    def scan(self) -> int:
+        """
+        폴더를 스캔해 다 써진 새 파일/바뀐 파일을 대기열에 넣기.
+
+        Returns:
+            이번에 대기열에 넣은 파일 수
+        """
+        now = time.time()
+        queued = 0
+        seen = set()
+        for path in self._iter_pdfs():
+            key = str(path)
+            seen.add(key)
+            signature = self._signature(path)
+            if signature is None:
+                continue
+            with self._lock:
+                if key in self._active or self._state.get(key, {}).get('signature') == signature:
+                    continue
+
+            candidate = self._candidates.get(key)
+            if candidate is None or candidate['signature'] != signature:
+                # 처음 보았거나 아직 쓰는 중: 바뀌지 않는지 지켜봄
+                self._candidates[key] = {'signature': signature, 'since': now}
+                continue
+            if now - candidate['since'] < self.settle_seconds or not self._is_complete(path):
+                continue
+
+            del self._candidates[key]
+            with self._lock:
+                self._active.add(key)
+            self._queue.put((path, signature, candidate['since']))
+            queued += 1
+            print(f"📥 감지: {path.name}")
+
+        # 사라진 파일은 지켜보기 중단
+        for key in set(self._candidates) - seen:
+            del self._candidates[key]
+        return queued
+
+    def _make_converter(self, key_pool=None):
+        """
+        SDK 클라이언트와 렌더러 확인까지 마친 컨버터.
+
+        Args:
+            key_pool: 다른 워커 컨버터와 함께 쓸 키 풀 (키별 한도와 제외된 키 공유)
+        """
+        from .converter import NotebookLMToPPTX
+
+        options = dict(self.converter_options)
+        if key_pool is not None:
+            options['key_pool'] = key_pool
+        converter = NotebookLMToPPTX(**options)
+        converter.warm_up(generate_notes=self.convert_options.get('generate_notes', True))
+        return converter
+
+    def _worker(self, converter):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, signature, detected_at = item
+            key = str(path)
+            pptx_path, report_path = self.output_paths(path)
+            generate_notes = self.convert_options.get('generate_notes', True)
+
+            started = time.time()
+            entry = {'signature': signature, 'output': str(pptx_path)}
+            try:
+                pptx_path.parent.mkdir(parents=True, exist_ok=True)
+                converter.convert(
+                    path,
+                    output_path=pptx_path,
+                    report_path=report_path if generate_notes else None,
+                    **self.convert_options
+                )
+                entry['status'] = 'done'
+                print(f"✅ 완료: {path.name} → {pptx_path} "
+                      f"(발견 후 {time.time() - detected_at:.1f}초, 변환 {time.time() - started:.1f}초)")
+            except Exception as e:
+                # 같은 내용으로 계속 재시도하지 않도록 기록 (파일이 바뀌면 다시 처리)
+                entry.update(status='failed', error=f"{type(e).__name__}: {e}")
+                print(f"❌ 실패: {path.name}: {e}")
+                traceback.print_exc()
+            finally:
+                entry['finished_at'] = round(time.time(), 3)
+                try:
+                    with self._lock:
+                        self._state[key] = entry
+                        self._active.discard(key)
+                        self.processed += 1
+                        self._save_state()
+                except Exception as e:
+                    # 상태 파일을 못 써도 워커는 계속 (다음 저장 때 함께 기록됨)
+                    print(f"⚠️ 상태 파일 저장 실패 ({self.state_path}): {e}")
+                finally:
+                    self._queue.task_done()
+
+    def run(self, once: bool = False) -> int:
+        """
+        감시 실행.
+
+        Args:
+            once: 지금 있는 파일만 처리하고 종료 (settle_seconds만큼 기다린 뒤)
+
+        Returns:
+            처리한 파일 수
+        """
+        print(f"🧊 컨버터 {self.workers}개 준비 중...")
+        # 첫 컨버터가 만든 키 풀을 나머지 워커도 함께 써서 --key-rpm이 워커 수만큼 늘지 않게 함
+        converters = [self._make_converter()]
+        converters += [
+            self._make_converter(key_pool=converters[0].key_pool) for _ in range(self.workers - 1)
+        ]
+        threads = [threading.Thread(target=self._worker, args=(c,), daemon=True) for c in converters]
+        for thread in threads:
+            thread.start()
+
+        observer = None
+        if self.notifications and not once:
+            observer = Observer()
+            observer.schedule(_WakeHandler(self._wake), str(self.watch_dir), recursive=self.recursive)
+            observer.start()
+
+        mode = "파일 시스템 알림 + 폴링" if observer else "폴링"
+        print(f"👀 감시 시작: {self.watch_dir} → {self.output_dir} ({mode}, {self.poll_interval}초 간격)")
+
+        try:
+            while not self._stop.is_set():
+                self.scan()
+                if once and not self._candidates:
+                    self._queue.join()
+                    break
+                # 다 써지기를 기다리는 파일이 있으면 settle 간격으로 다시 확인
+                interval = self.poll_interval
+                if self._candidates:
+                    interval = min(interval, max(0.1, self.settle_seconds / 2))
+                self._wake.wait(interval)
+                self._wake.clear()
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
+            for _ in threads:
+                self._queue.put(None)
+            for thread in threads:
+                thread.join()
+
+        return self.processed